@@ -17,19 +17,25 @@ Environment variables:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
 import os
 import sys
+from collections.abc import Awaitable, Coroutine, Iterable
+from itertools import islice
+from typing import Any, Callable, TypeVar
 
 # Add the SDK src directory to path for local development
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from rich import box
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
 
-from yod import YodClient
+from yod import AsyncYodClient, ChatResponse, YodClient
 from yod.exceptions import (
     AuthenticationError,
     NotFoundError,
@@ -43,6 +49,8 @@ from yod.exceptions import (
 
 console = Console()
 
+T = TypeVar("T")
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -95,22 +103,31 @@ def create_client(args: argparse.Namespace) -> YodClient:
     )
 
 
-def print_header():
-    """Print the application header."""
-    console.print()
-    console.print(
-        Panel(
-            "[bold cyan]Yod Memory Test App[/bold cyan]\n"
-            "[dim]Interactive SDK Testing Tool[/dim]",
-            box=box.DOUBLE,
-            padding=(1, 4),
-        )
+def create_async_client(args: argparse.Namespace) -> AsyncYodClient:
+    """Create and return an AsyncYodClient with the provided configuration."""
+    return AsyncYodClient(
+        api_key=args.api_key,
+        bearer_token=args.token,
+        user_id=args.user_id,
+        base_url=args.base_url,
+        timeout=60.0,  # Longer timeout for LLM operations
     )
-    console.print()
 
 
-def print_menu():
-    """Print the main menu."""
+# ============================================================
+# Display Helpers
+# ============================================================
+
+# The header and menu never change, so they are built once and reprinted.
+HEADER_PANEL = Panel(
+    "[bold cyan]Yod Memory Test App[/bold cyan]\n"
+    "[dim]Interactive SDK Testing Tool[/dim]",
+    box=box.DOUBLE,
+    padding=(1, 4),
+)
+
+
+def _build_menu() -> Table:
     menu = Table(show_header=False, box=box.ROUNDED, padding=(0, 2))
     menu.add_column("Option", style="cyan", width=4)
     menu.add_column("Action", style="white")
@@ -125,8 +142,101 @@ def print_menu():
     menu.add_row("8", "Health Check")
     menu.add_row("9", "Run Test Suite")
     menu.add_row("0", "Exit")
+    return menu
+
+
+MENU_TABLE = _build_menu()
+
+# Column specs for the result tables, which need fresh rows on every call
+ENTITY_COLUMNS = (
+    ("ID", {"style": "dim"}),
+    ("Name", {"style": "cyan"}),
+    ("Type", {"style": "green"}),
+)
+EXTRACTED_MEMORY_COLUMNS = (
+    ("ID", {"style": "dim"}),
+    ("Kind", {"style": "magenta"}),
+    ("Summary", {"style": "white", "max_width": 50}),
+    ("Confidence", {"style": "yellow"}),
+)
+MEMORY_LIST_COLUMNS = (
+    ("ID", {"style": "dim", "width": 14}),
+    ("Kind", {"style": "magenta", "width": 12}),
+    ("Summary", {"style": "white", "max_width": 45}),
+    ("Conf", {"style": "yellow", "width": 5}),
+    ("Status", {"style": "cyan", "width": 10}),
+)
+HISTORY_COLUMNS = (
+    ("Version", {"style": "cyan"}),
+    ("Summary", {"style": "white", "max_width": 40}),
+    ("Status", {"style": "magenta"}),
+    ("Valid From", {"style": "dim"}),
+    ("Valid To", {"style": "dim"}),
+)
+SERVICE_STATUS_COLUMNS = (
+    ("Service", {"style": "cyan"}),
+    ("Status", {"style": "white"}),
+    ("Details", {"style": "dim"}),
+)
+
+# Pre-rendered status cells for the memory list; other statuses are shown dim
+STATUS_CELLS: dict[str | None, str] = {
+    None: "[green]active[/green]",
+    "active": "[green]active[/green]",
+    "superseded": "[dim]superseded[/dim]",
+    "inactive": "[dim]inactive[/dim]",
+}
+
+
+def _ask(prompt: str) -> str:
+    """
+    Read a line of free text; an empty reply means "skip".
+
+    Prompt.ask re-parses markup and checks the terminal on every call and
+    renders an empty default as "()"; plain input() needs neither.
+    Prompt.ask is kept for the prompts that show a real default.
+    """
+    return input(f"{prompt}: ")
+
+
+def _trunc(s: str, n: int) -> str:
+    """Shorten `s` to at most `n` characters, marking the cut with an ellipsis."""
+    return s if len(s) <= n else s[: n - 1] + "…"
+
+
+def make_table(columns: tuple[tuple[str, dict[str, Any]], ...], **kwargs: Any) -> Table:
+    """Create an empty result table from a column spec."""
+    table = Table(box=box.SIMPLE, **kwargs)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
+
 
-    console.print(menu)
+def stream_rows(table: Table, rows: Iterable[tuple[str, ...]], every: int = 20) -> None:
+    """
+    Show a table while its rows are added instead of after the last one.
+
+    The live view is repainted every `every` rows rather than per row, since
+    each repaint re-renders the whole table so far.
+    """
+    with Live(table, console=console, auto_refresh=False) as live:
+        for i, row in enumerate(rows, 1):
+            table.add_row(*row)
+            if i % every == 0:
+                live.refresh()
+        live.refresh()
+
+
+def print_header():
+    """Print the application header."""
+    console.print()
+    console.print(HEADER_PANEL)
+    console.print()
+
+
+def print_menu():
+    """Print the main menu."""
+    console.print(MENU_TABLE)
     console.print()
 
 
@@ -173,6 +283,24 @@ def handle_error(e: Exception):
         print_error(f"Unexpected error: {e}")
 
 
+# ============================================================
+# Chat Cache
+# ============================================================
+
+
+@functools.lru_cache(maxsize=1000)
+def _cached_chat(
+    client: YodClient, question: str, language: str | None, as_of: str | None
+) -> ChatResponse:
+    """
+    Query memories, reusing the answer for a question asked before.
+
+    Answers depend on what is stored, so every action that changes memories
+    must call `_cached_chat.cache_clear()`.
+    """
+    return client.chat(question=question, language=language, as_of=as_of)
+
+
 # ============================================================
 # Feature Implementations
 # ============================================================
@@ -183,13 +311,22 @@ def do_ingest(client: YodClient):
     console.print("\n[bold]Ingest Text[/bold]")
     console.print("[dim]Enter text to store in memory (facts, preferences, conversations)[/dim]\n")
 
-    text = Prompt.ask("Text to ingest")
-    if not text.strip():
+    console.print("[dim]Enter one entry per line; finish with an empty line[/dim]")
+    lines = []
+    while True:
+        line = _ask("Text to ingest" if not lines else "...")
+        if not line.strip():
+            break
+        lines.append(line)
+    if not lines:
         print_error("Text cannot be empty")
         return
 
-    source_id = Prompt.ask("Source ID (optional)", default="")
-    timestamp = Prompt.ask("Timestamp ISO8601 (optional)", default="")
+    # All entries go out in a single request instead of one round-trip per line
+    text = "\n".join(lines)
+
+    source_id = _ask("Source ID (optional)")
+    timestamp = _ask("Timestamp ISO8601 (optional)")
 
     try:
         with console.status("[cyan]Ingesting text...[/cyan]"):
@@ -199,43 +336,37 @@ def do_ingest(client: YodClient):
                 timestamp=timestamp if timestamp else None,
             )
 
-        print_success("Text ingested successfully!")
+        _cached_chat.cache_clear()
+        print_success(f"Ingested {len(lines)} entries in one request")
         console.print(f"[dim]Source ID: {response.source_id}[/dim]")
         console.print(f"[dim]Chunks created: {response.chunks}[/dim]")
 
         # Show extracted entities
         if response.entities:
             console.print("\n[bold]Extracted Entities:[/bold]")
-            entity_table = Table(box=box.SIMPLE)
-            entity_table.add_column("ID", style="dim")
-            entity_table.add_column("Name", style="cyan")
-            entity_table.add_column("Type", style="green")
-
-            for entity in response.entities:
-                entity_table.add_row(
-                    entity.entity_id[:12] + "...",
-                    entity.canonical_name,
-                    entity.type,
-                )
-            console.print(entity_table)
+            stream_rows(
+                make_table(ENTITY_COLUMNS),
+                (
+                    (_trunc(entity.entity_id, 15), entity.canonical_name, entity.type)
+                    for entity in response.entities
+                ),
+            )
 
         # Show extracted memories
         if response.memories:
             console.print("\n[bold]Extracted Memories:[/bold]")
-            memory_table = Table(box=box.SIMPLE)
-            memory_table.add_column("ID", style="dim")
-            memory_table.add_column("Kind", style="magenta")
-            memory_table.add_column("Summary", style="white", max_width=50)
-            memory_table.add_column("Confidence", style="yellow")
-
-            for memory in response.memories:
-                memory_table.add_row(
-                    memory.memory_id[:12] + "...",
-                    memory.kind,
-                    memory.summary[:50] + "..." if len(memory.summary) > 50 else memory.summary,
-                    f"{memory.confidence:.2f}",
-                )
-            console.print(memory_table)
+            stream_rows(
+                make_table(EXTRACTED_MEMORY_COLUMNS),
+                (
+                    (
+                        _trunc(memory.memory_id, 15),
+                        memory.kind,
+                        _trunc(memory.summary, 50),
+                        f"{memory.confidence:.2f}",
+                    )
+                    for memory in response.memories
+                ),
+            )
 
     except YodError as e:
         handle_error(e)
@@ -246,24 +377,28 @@ def do_chat(client: YodClient):
     console.print("\n[bold]Chat with Memory[/bold]")
     console.print("[dim]Ask a question - the LLM will use your memories to answer[/dim]\n")
 
-    question = Prompt.ask("Your question")
+    question = _ask("Your question")
     if not question.strip():
         print_error("Question cannot be empty")
         return
 
-    language = Prompt.ask("Language (optional, e.g., 'en', 'fa')", default="")
-    as_of = Prompt.ask("As-of timestamp (optional, for temporal queries)", default="")
+    language = _ask("Language (optional, e.g., 'en', 'fa')")
+    as_of = _ask("As-of timestamp (optional, for temporal queries)")
 
     try:
+        hits_before = _cached_chat.cache_info().hits
         with console.status("[cyan]Thinking...[/cyan]"):
-            response = client.chat(
-                question=question,
-                language=language if language else None,
-                as_of=as_of if as_of else None,
+            response = _cached_chat(
+                client,
+                " ".join(question.split()),
+                language if language else None,
+                as_of if as_of else None,
             )
 
         # Display answer
         console.print()
+        if _cached_chat.cache_info().hits > hits_before:
+            console.print("[dim](cached answer - no request sent)[/dim]")
         console.print(Panel(
             response.answer, title="[bold green]Answer[/bold green]", box=box.ROUNDED
         ))
@@ -289,8 +424,8 @@ def do_list_memories(client: YodClient):
     console.print("\n[bold]List Memories[/bold]\n")
 
     limit = Prompt.ask("Limit", default="20")
-    kind = Prompt.ask("Filter by kind (optional, e.g., 'preference', 'fact')", default="")
-    search = Prompt.ask("Search term (optional)", default="")
+    kind = _ask("Filter by kind (optional, e.g., 'preference', 'fact')")
+    search = _ask("Search term (optional)")
     include_inactive = Confirm.ask("Include inactive/superseded?", default=False)
 
     try:
@@ -309,22 +444,15 @@ def do_list_memories(client: YodClient):
         print_success(f"Found {len(response.items)} memories")
         console.print()
 
-        table = Table(box=box.SIMPLE)
-        table.add_column("ID", style="dim", width=14)
-        table.add_column("Kind", style="magenta", width=12)
-        table.add_column("Summary", style="white", max_width=45)
-        table.add_column("Conf", style="yellow", width=5)
-        table.add_column("Status", style="cyan", width=10)
+        table = make_table(MEMORY_LIST_COLUMNS)
 
         for item in response.items:
-            status = item.status or "active"
-            status_style = "green" if status == "active" else "dim"
             table.add_row(
-                item.memory_id[:12] + "...",
+                _trunc(item.memory_id, 14),
                 item.kind,
-                item.summary[:42] + "..." if len(item.summary) > 42 else item.summary,
+                _trunc(item.summary, 45),
                 f"{item.confidence:.2f}",
-                f"[{status_style}]{status}[/{status_style}]",
+                STATUS_CELLS.get(item.status or None) or f"[dim]{item.status}[/dim]",
             )
 
         console.print(table)
@@ -337,7 +465,7 @@ def do_get_memory(client: YodClient):
     """Get a single memory by ID."""
     console.print("\n[bold]Get Memory Details[/bold]\n")
 
-    memory_id = Prompt.ask("Memory ID")
+    memory_id = _ask("Memory ID")
     if not memory_id.strip():
         print_error("Memory ID is required")
         return
@@ -362,19 +490,18 @@ def do_get_memory(client: YodClient):
         ))
 
         if memory.entity_ids:
-            console.print(f"\n[bold]Linked Entities:[/bold] {', '.join(memory.entity_ids[:5])}")
-            if len(memory.entity_ids) > 5:
-                console.print(f"[dim]...and {len(memory.entity_ids) - 5} more[/dim]")
+            shown = ", ".join(islice(memory.entity_ids, 5))
+            console.print(f"\n[bold]Linked Entities:[/bold] {shown}")
+            rest = len(memory.entity_ids) - 5
+            if rest > 0:
+                console.print(f"[dim]...and {rest} more[/dim]")
 
         if memory.support:
             console.print("\n[bold]Supporting Evidence:[/bold]")
-            for support in memory.support[:3]:
+            for support in islice(memory.support, 3):
                 console.print(f"  Source: [dim]{support.source_id[:12]}...[/dim]")
-                for quote in support.quotes[:2]:
-                    if len(quote) > 60:
-                        console.print(f"    • [italic]\"{quote[:60]}...\"[/italic]")
-                    else:
-                        console.print(f"    • [italic]\"{quote}\"[/italic]")
+                for quote in islice(support.quotes, 2):
+                    console.print(f'    • [italic]"{_trunc(quote, 60)}"[/italic]')
 
     except YodError as e:
         handle_error(e)
@@ -384,16 +511,16 @@ def do_update_memory(client: YodClient):
     """Update a memory's fields."""
     console.print("\n[bold]Update Memory[/bold]\n")
 
-    memory_id = Prompt.ask("Memory ID to update")
+    memory_id = _ask("Memory ID to update")
     if not memory_id.strip():
         print_error("Memory ID is required")
         return
 
     console.print("[dim]Leave fields empty to keep current value[/dim]\n")
 
-    kind = Prompt.ask("New kind (optional)", default="")
-    summary = Prompt.ask("New summary (optional)", default="")
-    confidence = Prompt.ask("New confidence 0.0-1.0 (optional)", default="")
+    kind = _ask("New kind (optional)")
+    summary = _ask("New summary (optional)")
+    confidence = _ask("New confidence 0.0-1.0 (optional)")
 
     try:
         with console.status("[cyan]Updating memory...[/cyan]"):
@@ -405,6 +532,7 @@ def do_update_memory(client: YodClient):
             )
 
         if result.get("ok"):
+            _cached_chat.cache_clear()
             print_success("Memory updated successfully!")
         else:
             print_error("Update failed")
@@ -417,7 +545,7 @@ def do_delete_memory(client: YodClient):
     """Delete a memory."""
     console.print("\n[bold]Delete Memory[/bold]\n")
 
-    memory_id = Prompt.ask("Memory ID to delete")
+    memory_id = _ask("Memory ID to delete")
     if not memory_id.strip():
         print_error("Memory ID is required")
         return
@@ -432,6 +560,7 @@ def do_delete_memory(client: YodClient):
             result = client.delete_memory(memory_id)
 
         if result.get("ok"):
+            _cached_chat.cache_clear()
             print_success("Memory deleted successfully!")
             console.print(f"[dim]Qdrant vectors deleted: {result.get('qdrant_deleted', 0)}[/dim]")
         else:
@@ -445,7 +574,7 @@ def do_view_history(client: YodClient):
     """View memory version history."""
     console.print("\n[bold]Memory History[/bold]\n")
 
-    memory_id = Prompt.ask("Memory ID")
+    memory_id = _ask("Memory ID")
     if not memory_id.strip():
         print_error("Memory ID is required")
         return
@@ -461,17 +590,12 @@ def do_view_history(client: YodClient):
         print_success(f"Found {len(response.items)} versions")
         console.print()
 
-        table = Table(box=box.SIMPLE, title="Version History")
-        table.add_column("Version", style="cyan")
-        table.add_column("Summary", style="white", max_width=40)
-        table.add_column("Status", style="magenta")
-        table.add_column("Valid From", style="dim")
-        table.add_column("Valid To", style="dim")
+        table = make_table(HISTORY_COLUMNS, title="Version History")
 
         for i, item in enumerate(response.items, 1):
             table.add_row(
                 str(i),
-                item.summary[:37] + "..." if len(item.summary) > 37 else item.summary,
+                _trunc(item.summary, 40),
                 item.status or "active",
                 item.valid_from[:10] if item.valid_from else "N/A",
                 item.valid_to[:10] if item.valid_to else "current",
@@ -488,20 +612,14 @@ def do_health_check(client: YodClient):
     console.print("\n[bold]Health Check[/bold]\n")
 
     try:
-        # Basic health
-        with console.status("[cyan]Checking health...[/cyan]"):
-            health = client.health()
-        print_success(f"API Health: {health.status}")
-
-        # Detailed readiness
+        # /ready answers everything /health does plus the backend checks,
+        # so one round-trip covers both lines below.
         with console.status("[cyan]Checking readiness...[/cyan]"):
             ready = client.ready()
+        print_success(f"API Health: {ready.status}")
 
         console.print()
-        table = Table(box=box.SIMPLE, title="Service Status")
-        table.add_column("Service", style="cyan")
-        table.add_column("Status", style="white")
-        table.add_column("Details", style="dim")
+        table = make_table(SERVICE_STATUS_COLUMNS, title="Service Status")
 
         # Overall
         if ready.status == "ok":
@@ -530,6 +648,14 @@ def do_health_check(client: YodClient):
                 ready.qdrant.error or "",
             )
 
+        # Local chat cache
+        cache = _cached_chat.cache_info()
+        table.add_row(
+            "Chat cache",
+            f"{cache.currsize}/{cache.maxsize}",
+            f"{cache.hits} hits, {cache.misses} misses",
+        )
+
         console.print(table)
 
     except YodError as e:
@@ -541,113 +667,117 @@ def do_health_check(client: YodClient):
 # ============================================================
 
 
-def run_test_suite(client: YodClient):
-    """Run automated test scenarios."""
+SEED_UTTERANCES = [
+    "My name is TestUser.",
+    "I love Python programming.",
+    "My favorite color is blue.",
+]
+
+
+async def run_test_suite(client: AsyncYodClient) -> bool:
+    """
+    Run automated test scenarios.
+
+    Tests are grouped into stages by data dependency. Tests within a stage
+    are independent, so they run concurrently and a stage takes as long as
+    its slowest request rather than the sum of them.
+    """
     console.print("\n[bold cyan]Running Automated Test Suite[/bold cyan]\n")
 
     tests_passed = 0
     tests_failed = 0
+    memory_id_to_test = None
 
-    def test(name: str, func):
+    async def run_stage(*tests: tuple[str, Callable[[], Awaitable[str | None]]]):
         nonlocal tests_passed, tests_failed
-        console.print(f"[bold]Test:[/bold] {name}")
-        try:
-            func()
-            print_success("PASSED")
-            tests_passed += 1
-        except AssertionError as e:
-            print_error(f"FAILED: {e}")
-            tests_failed += 1
-        except YodError as e:
-            print_error(f"ERROR: {e}")
-            tests_failed += 1
-        console.print()
-
-    # Test 1: Health Check
-    def test_health():
-        health = client.health()
+        results = await asyncio.gather(*(func() for _, func in tests), return_exceptions=True)
+        for (name, _), result in zip(tests, results):
+            console.print(f"[bold]Test:[/bold] {name}")
+            if isinstance(result, AssertionError):
+                print_error(f"FAILED: {result}")
+                tests_failed += 1
+            elif isinstance(result, YodError):
+                print_error(f"ERROR: {result}")
+                tests_failed += 1
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                if result:
+                    console.print(f"  [dim]{result}[/dim]")
+                print_success("PASSED")
+                tests_passed += 1
+            console.print()
+
+    # Stage 1: no dependencies
+    async def test_health():
+        health = await client.health()
         assert health.status == "ok", f"Expected 'ok', got '{health.status}'"
 
-    test("Health Check", test_health)
-
-    # Test 2: Ingest basic text
-    ingest_response = None
-
-    def test_ingest():
-        nonlocal ingest_response
-        ingest_response = client.ingest_chat(
-            text="My name is TestUser and I love Python programming. My favorite color is blue."
-        )
-        assert ingest_response.source_id, "No source_id returned"
-        assert ingest_response.chunks > 0, "No chunks created"
-        console.print(f"  [dim]Created {len(ingest_response.memories)} memories[/dim]")
+    async def test_ingest():
+        response = await client.ingest_chat(text="\n".join(SEED_UTTERANCES))
+        assert response.source_id, "No source_id returned"
+        assert response.chunks > 0, "No chunks created"
+        return f"Created {len(response.memories)} memories"
 
-    test("Ingest Text", test_ingest)
+    await run_stage(("Health Check", test_health), ("Ingest Text", test_ingest))
 
-    # Test 3: List memories
-    def test_list():
-        response = client.list_memories(limit=10)
+    # Stage 2: needs the ingested memories
+    async def test_list():
+        response = await client.list_memories(limit=10)
         assert response.items is not None, "No items returned"
-        console.print(f"  [dim]Found {len(response.items)} memories[/dim]")
+        return f"Found {len(response.items)} memories"
 
-    test("List Memories", test_list)
-
-    # Test 4: Chat query
-    def test_chat():
-        response = client.chat(question="What is my name?")
+    async def test_chat():
+        response = await client.chat(question="What is my name?")
         assert response.answer, "No answer returned"
-        console.print(f"  [dim]Answer: {response.answer[:60]}...[/dim]")
-
-    test("Chat Query", test_chat)
+        return f"Answer: {response.answer[:60]}..."
 
-    # Test 5: Chat with context
-    def test_chat_context():
-        response = client.chat(question="What programming language do I like?")
+    async def test_chat_context():
+        response = await client.chat(question="What programming language do I like?")
         assert response.answer, "No answer returned"
         # Check if Python is mentioned (case insensitive)
         assert "python" in response.answer.lower(), (
             f"Expected 'Python' in answer: {response.answer}"
         )
-        console.print("  [dim]Answer mentions Python: YES[/dim]")
-
-    test("Chat with Context", test_chat_context)
+        return "Answer mentions Python: YES"
 
-    # Test 6: Get memory (if we have one)
-    memory_id_to_test = None
+    await run_stage(
+        ("List Memories", test_list),
+        ("Chat Query", test_chat),
+        ("Chat with Context", test_chat_context),
+    )
 
-    def test_get_memory():
+    # Stage 3: pick a memory to exercise the single-memory endpoints
+    async def test_get_memory():
         nonlocal memory_id_to_test
-        memories = client.list_memories(limit=1)
-        if memories.items:
-            memory_id_to_test = memories.items[0].memory_id
-            memory = client.get_memory(memory_id_to_test)
-            assert memory.memory_id == memory_id_to_test, "Memory ID mismatch"
-            console.print(f"  [dim]Retrieved: {memory.summary[:40]}...[/dim]")
-        else:
+        memories = await client.list_memories(limit=1)
+        if not memories.items:
             raise AssertionError("No memories to test")
+        memory_id_to_test = memories.items[0].memory_id
+        memory = await client.get_memory(memory_id_to_test)
+        assert memory.memory_id == memory_id_to_test, "Memory ID mismatch"
+        return f"Retrieved: {memory.summary[:40]}..."
 
-    test("Get Memory", test_get_memory)
+    await run_stage(("Get Memory", test_get_memory))
 
-    # Test 7: Update memory
-    def test_update():
+    # Stage 4: needs the memory picked in stage 3
+    async def test_update():
         if not memory_id_to_test:
             raise AssertionError("No memory to update")
-        result = client.update_memory(memory_id_to_test, confidence=0.95)
+        result = await client.update_memory(memory_id_to_test, confidence=0.95)
         assert result.get("ok"), "Update failed"
 
-    test("Update Memory", test_update)
-
-    # Test 8: Memory history (may or may not have history)
-    def test_history():
+    async def test_history():
+        # May or may not have history
         if not memory_id_to_test:
             raise AssertionError("No memory to check history")
         try:
-            response = client.get_memory_history(memory_id_to_test)
-            console.print(f"  [dim]Found {len(response.items)} versions[/dim]")
+            response = await client.get_memory_history(memory_id_to_test)
+            return f"Found {len(response.items)} versions"
         except NotFoundError:
-            console.print("  [dim]No history (expected for new memories)[/dim]")
+            return "No history (expected for new memories)"
 
-    test("Memory History", test_history)
+    await run_stage(("Update Memory", test_update), ("Memory History", test_history))
 
     # Summary
     console.print()
@@ -662,11 +792,49 @@ def run_test_suite(client: YodClient):
     return tests_failed == 0
 
 
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    if hasattr(uvloop, "run"):
+        return uvloop.run(coro)
+    # uvloop < 0.18 has no run(); install its event loop policy instead
+    uvloop.install()
+    return asyncio.run(coro)
+
+
+async def run_test_suite_with(args: argparse.Namespace) -> bool:
+    """Run the test suite on a dedicated async client."""
+    async with create_async_client(args) as client:
+        return await run_test_suite(client)
+
+
 # ============================================================
 # Main Entry Point
 # ============================================================
 
 
+def do_test_suite(args: argparse.Namespace) -> None:
+    """Run the automated suite from the menu; it may change memories, so drop cached answers."""
+    run_async(run_test_suite_with(args))
+    _cached_chat.cache_clear()
+
+
+# Menu choice -> handler; "9" needs the CLI args and is added in main()
+MENU_ACTIONS: dict[str, Callable[[YodClient], object]] = {
+    "1": do_ingest,
+    "2": do_chat,
+    "3": do_list_memories,
+    "4": do_get_memory,
+    "5": do_update_memory,
+    "6": do_delete_memory,
+    "7": do_view_history,
+    "8": do_health_check,
+}
+
+
 def main():
     """Main entry point."""
     args = parse_args()
@@ -678,51 +846,42 @@ def main():
         console.print("Or set YOD_API_KEY, YOD_TOKEN, or YOD_USER_ID environment variables")
         sys.exit(1)
 
-    # Create client
-    client = create_client(args)
     console.print(f"[dim]Connecting to: {args.base_url}[/dim]")
 
     # Run automated tests if --test flag
     if args.test:
-        success = run_test_suite(client)
+        # Non-interactive: buffer the whole report and write it out in one go
+        try:
+            with console.capture() as capture:
+                success = run_async(run_test_suite_with(args))
+        finally:
+            sys.stdout.write(capture.get())
         sys.exit(0 if success else 1)
 
-    # Interactive mode
-    print_header()
-
-    while True:
-        print_menu()
-        choice = Prompt.ask("Select option", default="0")
-
-        if choice == "1":
-            do_ingest(client)
-        elif choice == "2":
-            do_chat(client)
-        elif choice == "3":
-            do_list_memories(client)
-        elif choice == "4":
-            do_get_memory(client)
-        elif choice == "5":
-            do_update_memory(client)
-        elif choice == "6":
-            do_delete_memory(client)
-        elif choice == "7":
-            do_view_history(client)
-        elif choice == "8":
-            do_health_check(client)
-        elif choice == "9":
-            run_test_suite(client)
-        elif choice == "0":
-            console.print("\n[cyan]Goodbye![/cyan]\n")
-            break
-        else:
-            print_error("Invalid option")
-
-        console.print()
-        Prompt.ask("Press Enter to continue")
-        console.clear()
+    # Interactive mode - one client, and so one keep-alive connection pool,
+    # for the whole session; closed on exit
+    actions = {**MENU_ACTIONS, "9": lambda _client: do_test_suite(args)}
+    with create_client(args) as client:
         print_header()
 
+        while True:
+            print_menu()
+            choice = Prompt.ask("Select option", default="0")
+
+            if choice == "0":
+                console.print("\n[cyan]Goodbye![/cyan]\n")
+                break
+            action = actions.get(choice)
+            if action is None:
+                print_error("Invalid option")
+            else:
+                action(client)
+
+            console.print()
+            _ask("Press Enter to continue")
+            console.clear()
+            print_header()
+
 
 if __name__ == "__main__":
     main()
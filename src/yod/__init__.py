@@ -26,9 +26,12 @@ Quick Start (Async):
 For more information, see https://docs.yod.agames.ai/sdk/python
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from yod._version import __version__
-from yod.async_client import AsyncYodClient
-from yod.client import YodClient
 from yod.exceptions import (
     AuthenticationError,
     AuthorizationError,
@@ -41,74 +44,81 @@ from yod.exceptions import (
     YodError,
     YodTimeoutError,
 )
-from yod.models import (
-    # Responses - Proposed Memories
-    ApproveMemoryResponse,
-    # Responses - Audit
-    AuditEvent,
-    AuditSummaryResponse,
-    # Requests
-    ChatRequest,
-    # Responses - Core
-    ChatResponse,
-    Citation,
-    # Responses - Graph
-    ClaimsGraphResponse,
-    Contradiction,
-    # Responses - Contradictions
-    ContradictionPair,
-    ContradictionsResponse,
-    # Responses - Evolution/Drift
-    DriftScore,
-    # Responses - Entities
-    EntitiesResponse,
-    EntityDetailsResponse,
-    EntityLink,
-    EntitySummary,
-    # Enums
-    EntityType,
-    EvolutionKeysResponse,
-    EvolutionPoint,
-    EvolutionResponse,
-    ExtractedEntity,
-    ExtractedMemory,
-    FeedbackRequest,
-    # Responses - Chat Tools
-    FeedbackResponse,
-    # Request Types
-    FeedbackType,
-    GraphLink,
-    GraphNode,
-    HealthResponse,
-    IngestChatRequest,
-    IngestResponse,
-    MemoryAuditTrailResponse,
-    MemoryItem,
-    MemoryKind,
-    MemoryLink,
-    MemoryListResponse,
-    MemoryStatus,
-    MemorySupport,
-    MemoryToolAction,
-    MemoryToolRequest,
-    MemoryToolResponse,
-    MemoryToolsSchemaResponse,
-    MemoryType,
-    MemoryUpdateRequest,
-    MergeInfo,
-    ProposedMemoriesResponse,
-    ReadyResponse,
-    RecentAuditResponse,
-    RejectMemoryResponse,
-    ServiceStatus,
-    Session,
-    SessionContradictionsResponse,
-    SessionListResponse,
-    SuspiciousActivityResponse,
-    SuspiciousPattern,
-    ToolDefinition,
-    ToolParameter,
-)
+
+if TYPE_CHECKING:
+    from yod._retry import RetryConfig
+    from yod.async_client import AsyncYodClient
+    from yod.client import YodClient
+    from yod.models import (
+        # Responses - Proposed Memories
+        ApproveMemoryResponse,
+        # Responses - Audit
+        AuditEvent,
+        AuditSummaryResponse,
+        # Requests
+        ChatRequest,
+        # Responses - Core
+        ChatResponse,
+        Citation,
+        # Responses - Graph
+        ClaimsGraphResponse,
+        Contradiction,
+        # Responses - Contradictions
+        ContradictionPair,
+        ContradictionsResponse,
+        # Responses - Dashboard
+        DashboardSnapshot,
+        # Responses - Evolution/Drift
+        DriftScore,
+        # Responses - Entities
+        EntitiesResponse,
+        EntityDetailsResponse,
+        EntityLink,
+        EntitySummary,
+        # Enums
+        EntityType,
+        EvolutionKeysResponse,
+        EvolutionPoint,
+        EvolutionResponse,
+        ExtractedEntity,
+        ExtractedMemory,
+        FeedbackRequest,
+        # Responses - Chat Tools
+        FeedbackResponse,
+        # Request Types
+        FeedbackType,
+        GraphLink,
+        GraphNode,
+        HealthResponse,
+        IngestChatRequest,
+        IngestResponse,
+        MemoryAuditTrailResponse,
+        MemoryItem,
+        MemoryKind,
+        MemoryLink,
+        MemoryListResponse,
+        MemoryStatus,
+        MemorySupport,
+        MemoryToolAction,
+        MemoryToolRequest,
+        MemoryToolResponse,
+        MemoryToolsSchemaResponse,
+        MemoryType,
+        MemoryUpdateRequest,
+        MergeInfo,
+        ProposedMemoriesResponse,
+        ReadyResponse,
+        RecentAuditResponse,
+        RejectMemoryResponse,
+        ServiceStatus,
+        Session,
+        SessionContradictionsResponse,
+        SessionListResponse,
+        SuspiciousActivityResponse,
+        SuspiciousPattern,
+        ToolDefinition,
+        ToolParameter,
+    )
 
 __all__ = [
     # Version
@@ -116,6 +126,7 @@ __all__ = [
     # Clients
     "YodClient",
     "AsyncYodClient",
+    "RetryConfig",
     # Exceptions
     "YodError",
     "YodAPIError",
@@ -176,6 +187,8 @@ __all__ = [
     "ContradictionPair",
     "ContradictionsResponse",
     "SessionContradictionsResponse",
+    # Response Models - Dashboard
+    "DashboardSnapshot",
     # Response Models - Audit
     "AuditSummaryResponse",
     "AuditEvent",
@@ -194,3 +207,25 @@ __all__ = [
     "ToolDefinition",
     "MemoryToolsSchemaResponse",
 ]
+
+# Clients and models are imported on first attribute access (PEP 562), so
+# `import yod` does not pay for building every pydantic model up front.
+_LAZY_IMPORTS: dict[str, str] = {
+    name: "yod.models" for name in __all__ if name not in globals()
+}
+_LAZY_IMPORTS["YodClient"] = "yod.client"
+_LAZY_IMPORTS["AsyncYodClient"] = "yod.async_client"
+_LAZY_IMPORTS["RetryConfig"] = "yod._retry"
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
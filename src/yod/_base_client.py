@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import json
+import time
+from collections.abc import Hashable, Mapping
 from dataclasses import dataclass, field
-from typing import Any, NoReturn
+from types import MappingProxyType
+from typing import Any, Callable, NoReturn, TypeVar
 
-from yod._retry import RetryConfig
+import httpx
+from pydantic import BaseModel
+
+from yod._retry import RetryConfig, parse_retry_after
 from yod._version import __version__
 from yod.exceptions import (
     AuthenticationError,
@@ -18,6 +24,61 @@ from yod.exceptions import (
     YodAPIError,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a request body to compact UTF-8 JSON (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(content: bytes) -> Any:
+    """Deserialize a response body (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _compact(**fields: Any) -> dict[str, Any]:
+    """Build a request payload or query dict, leaving out fields that are None."""
+    return {key: value for key, value in fields.items() if value is not None}
+
+
+def _is_json_media_type(content_type: str) -> bool:
+    """Whether a Content-Type header denotes JSON (application/json or any +json type)."""
+    media_type = content_type.partition(";")[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
+
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+_USER_AGENT = f"yod-python-sdk/{__version__}"
+
+_JSON_HEADERS: Mapping[str, str] = MappingProxyType({"Content-Type": "application/json"})
+
+_EMPTY_HEADERS: Mapping[str, str] = MappingProxyType({})
+
+# Upper bound on entries in the opt-in response cache (oldest are evicted first)
+_CACHE_MAX_ENTRIES = 256
+
+# How long cached GETs stay fresh with cache_responses=True, in seconds
+_HEALTH_CACHE_TTL = 5.0
+_ENTITY_CACHE_TTL = 30.0
+_SCHEMA_CACHE_TTL = 300.0
+
+# Status codes that map straight to an exception class with a fixed status code
+_STATUS_ERRORS: dict[int, Callable[..., YodAPIError]] = {
+    401: AuthenticationError,
+    403: AuthorizationError,
+    404: NotFoundError,
+    422: ValidationError,
+}
+
 
 @dataclass
 class ClientConfig:
@@ -37,8 +98,25 @@ class ClientConfig:
     # Retry configuration
     max_retries: int = 3
 
-    # Custom headers
-    custom_headers: dict[str, str] = field(default_factory=dict)
+    # Connection pool (httpx defaults); raise these for highly concurrent workloads
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 5.0
+
+    # Upper bound on in-flight requests for the *_bulk helpers
+    max_concurrency: int = 20
+
+    # Open a pooled connection when entering the client's context manager
+    warmup: bool = False
+
+    # Negotiate HTTP/2 (needs the `http2` extra); concurrent requests then share a connection
+    http2: bool = False
+
+    # Cache results of read-only GETs (health, schemas, entity details) for a short TTL
+    cache_responses: bool = False
+
+    # Custom headers (shared read-only empty mapping when none are given)
+    custom_headers: Mapping[str, str] = field(default_factory=lambda: _EMPTY_HEADERS)
 
 
 class BaseClient:
@@ -57,6 +135,14 @@ class BaseClient:
         timeout: float = 30.0,
         connect_timeout: float = 5.0,
         max_retries: int = 3,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        max_concurrency: int | None = None,
+        retry_config: RetryConfig | None = None,
+        warmup: bool = False,
+        http2: bool = False,
+        cache_responses: bool = False,
         **kwargs: Any,
     ) -> None:
         """
@@ -75,7 +161,21 @@ class BaseClient:
             timeout: Request timeout in seconds
             connect_timeout: Connection timeout in seconds
             max_retries: Maximum retry attempts for failed requests
+            max_connections: Maximum concurrent connections in the pool
+            max_keepalive_connections: Maximum idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept open
+            max_concurrency: Maximum concurrent requests issued by the *_bulk
+                helpers (default: max_keepalive_connections)
+            retry_config: Full retry policy (delays, jitter, retryable statuses);
+                overrides max_retries when given
+            warmup: Connect to the API when entering the context manager so the
+                first real request skips DNS/TCP/TLS setup (best-effort)
+            http2: Use HTTP/2 when the server supports it (requires `yod[http2]`)
+            cache_responses: Briefly cache results of read-only GETs such as health()
+                and get_memory_tools_schema(); see invalidate_cache()
         """
+        if retry_config is not None:
+            max_retries = retry_config.max_retries
         self.config = ClientConfig(
             base_url=base_url or "https://api.yod.agames.ai",
             api_key=api_key,
@@ -84,35 +184,77 @@ class BaseClient:
             timeout=timeout,
             connect_timeout=connect_timeout,
             max_retries=max_retries,
-            custom_headers=kwargs.get("custom_headers", {}),
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            max_concurrency=(
+                max_concurrency if max_concurrency is not None else max_keepalive_connections
+            ),
+            warmup=warmup,
+            http2=http2,
+            cache_responses=cache_responses,
+            custom_headers=kwargs.get("custom_headers") or _EMPTY_HEADERS,
         )
 
-        self.retry_config = RetryConfig(max_retries=max_retries)
+        self.retry_config = retry_config or RetryConfig(max_retries=max_retries)
+
+        # Headers only depend on the config, so build them once per client
+        self._headers: Mapping[str, str] = MappingProxyType(self._build_headers())
+
+        # Opt-in response cache: (path, params) -> (expiry on the monotonic clock, result)
+        self._response_cache: dict[Hashable, tuple[float, Any]] = {}
 
     def _build_headers(self) -> dict[str, str]:
         """Construct request headers with authentication."""
+        # No Content-Type here: these are client-wide defaults and httpx would let
+        # it override the multipart type on uploads. JSON requests add _JSON_HEADERS.
         headers: dict[str, str] = {
-            "Content-Type": "application/json",
             "Accept": "application/json",
-            "User-Agent": f"yod-python-sdk/{__version__}",
+            "User-Agent": _USER_AGENT,
         }
 
-        # Add authentication headers (priority: api_key > bearer_token > user_id)
-        if self.config.api_key:
-            # API keys are sent as Bearer tokens
-            headers["Authorization"] = f"Bearer {self.config.api_key}"
-        elif self.config.bearer_token:
-            headers["Authorization"] = f"Bearer {self.config.bearer_token}"
+        # Add authentication headers (priority: api_key > bearer_token > user_id).
+        # API keys and JWTs are both sent as Bearer tokens.
+        token = self.config.api_key or self.config.bearer_token
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
 
         # X-User-Id for dev mode (works alongside or without auth)
         if self.config.user_id:
             headers["X-User-Id"] = self.config.user_id
 
         # Add custom headers
-        headers.update(self.config.custom_headers)
+        if self.config.custom_headers:
+            headers.update(self.config.custom_headers)
 
         return headers
 
+    def invalidate_cache(self) -> None:
+        """Drop all cached responses (only used with cache_responses=True)."""
+        self._response_cache.clear()
+
+    def _cache_key(self, path: str, params: Mapping[str, Any] | None) -> Hashable:
+        """Cache key for a GET request."""
+        return (path, tuple(sorted(params.items())) if params else ())
+
+    def _cache_get(self, key: Hashable) -> Any:
+        """Return the cached result for `key`, or None if missing or expired."""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._response_cache.pop(key, None)
+            return None
+        return value
+
+    def _cache_put(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Cache `value` under `key` for `ttl` seconds, evicting the oldest entry if full."""
+        cache = self._response_cache
+        if key not in cache and len(cache) >= _CACHE_MAX_ENTRIES:
+            cache.pop(next(iter(cache)), None)
+        cache[key] = (time.monotonic() + ttl, value)
+
     def _build_url(self, path: str) -> str:
         """Build full URL from path."""
         base = self.config.base_url.rstrip("/")
@@ -122,49 +264,71 @@ class BaseClient:
     def _handle_error_response(
         self,
         status_code: int,
-        body: dict[str, Any] | None,
+        body: Mapping[str, Any] | list[Any] | None,
         request_id: str | None = None,
-        headers: dict[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
     ) -> NoReturn:
-        """Raise appropriate exception based on status code."""
-        message = "Unknown error"
-        if body:
-            message = body.get("detail", body.get("message", str(body)))
-
-        if status_code == 401:
-            raise AuthenticationError(message, response_body=body, request_id=request_id)
-        elif status_code == 403:
-            raise AuthorizationError(message, response_body=body, request_id=request_id)
-        elif status_code == 404:
-            raise NotFoundError(message, response_body=body, request_id=request_id)
-        elif status_code == 422:
-            raise ValidationError(message, response_body=body, request_id=request_id)
-        elif status_code == 429:
+        """
+        Raise appropriate exception based on status code.
+
+        `headers` must be looked up case-insensitively (e.g. httpx.Headers).
+        """
+        message: Any = "Unknown error"
+        if isinstance(body, Mapping):
+            if (detail := body.get("detail")) is not None:
+                message = detail
+            elif (msg := body.get("message")) is not None:
+                message = msg
+            elif body:
+                message = repr(body)
+        elif body:
+            message = repr(body)
+        # Only JSON objects are kept on the exception; other payloads end up in the message
+        body = body if isinstance(body, dict) else None
+
+        exc_cls = _STATUS_ERRORS.get(status_code)
+        if exc_cls is not None:
+            raise exc_cls(message, response_body=body, request_id=request_id)
+        if status_code == 429:
             retry_after = None
             if headers:
-                retry_after_str = headers.get("Retry-After") or headers.get("retry-after")
+                retry_after_str = headers.get("Retry-After")
                 if retry_after_str:
-                    try:
-                        retry_after = float(retry_after_str)
-                    except ValueError:
-                        pass
+                    retry_after = parse_retry_after(retry_after_str)
             raise RateLimitError(
                 message, retry_after=retry_after, response_body=body, request_id=request_id
             )
-        elif status_code >= 500:
+        if status_code >= 500:
             raise ServerError(
                 message, status_code=status_code, response_body=body, request_id=request_id
             )
-        else:
-            raise YodAPIError(
-                message, status_code=status_code, response_body=body, request_id=request_id
+        raise YodAPIError(
+            message, status_code=status_code, response_body=body, request_id=request_id
+        )
+
+    def _raise_for_status(self, response: httpx.Response) -> None:
+        """Raise the matching YodAPIError if `response` is an error response (body must be read)."""
+        if response.status_code >= 400:
+            body = self._parse_response_body(
+                response.content, response.headers.get("Content-Type")
+            )
+            # httpx.Headers is already a case-insensitive Mapping; no need to copy it
+            self._handle_error_response(
+                response.status_code, body, response.headers.get("X-Request-Id"), response.headers
             )
 
-    def _parse_response_body(self, content: bytes) -> dict[str, Any] | list[Any] | None:
-        """Parse response body as JSON, return None on failure."""
-        if not content:
+    def _parse_response_body(
+        self, content: bytes, content_type: str | None = None
+    ) -> dict[str, Any] | list[Any] | None:
+        """
+        Parse response body as JSON, return None on failure.
+
+        A body whose Content-Type is present but not JSON (e.g. an HTML error
+        page from a proxy) is not parsed at all.
+        """
+        if not content or (content_type is not None and not _is_json_media_type(content_type)):
             return None
         try:
-            return json.loads(content)
-        except (json.JSONDecodeError, ValueError):
+            return _json_loads(content)
+        except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError included
             return None
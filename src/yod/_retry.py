@@ -5,7 +5,9 @@ from __future__ import annotations
 import random
 import time
 from collections.abc import Awaitable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Callable
 
 import httpx
@@ -21,12 +23,43 @@ class RetryConfig:
     backoff_multiplier: float = 2.0
     retry_on_status: tuple[int, ...] = (429, 500, 502, 503, 504)
     jitter: float = 0.1
+    # Decorrelated jitter: each delay is drawn from [initial_delay, 3 * previous delay]
+    # (capped at max_delay) instead of following the fixed exponential schedule
+    decorrelated_jitter: bool = False
+
+    # Derived from the fields above (and refreshed whenever one of them is set):
+    # capped backoff delay per attempt, and the retryable statuses as a set
+    _delays: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _retry_set: frozenset[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._refresh_derived()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        # Fields assigned during __init__ are covered by __post_init__
+        if name in _DERIVED_FROM and "_delays" in self.__dict__:
+            self._refresh_derived()
+
+    def _refresh_derived(self) -> None:
+        self._retry_set = frozenset(self.retry_on_status)
+        self._delays = tuple(
+            min(self.initial_delay * self.backoff_multiplier**attempt, self.max_delay)
+            for attempt in range(self.max_retries + 1)
+        )
+
+
+# RetryConfig fields that _delays/_retry_set are computed from
+_DERIVED_FROM = frozenset(
+    {"max_retries", "initial_delay", "max_delay", "backoff_multiplier", "retry_on_status"}
+)
 
 
 def calculate_delay(
     attempt: int,
     config: RetryConfig,
     retry_after: float | None = None,
+    previous_delay: float | None = None,
 ) -> float:
     """
     Calculate delay before next retry.
@@ -35,6 +68,7 @@ def calculate_delay(
         attempt: Current attempt number (0-indexed)
         config: Retry configuration
         retry_after: Value from Retry-After header if present
+        previous_delay: Delay before the previous retry (used by decorrelated jitter)
 
     Returns:
         Delay in seconds before next retry
@@ -42,19 +76,48 @@ def calculate_delay(
     if retry_after is not None:
         return min(retry_after, config.max_delay)
 
-    delay = config.initial_delay * (config.backoff_multiplier ** attempt)
-    delay = min(delay, config.max_delay)
+    if config.decorrelated_jitter:
+        upper = 3.0 * (previous_delay or config.initial_delay)
+        return min(config.max_delay, random.uniform(config.initial_delay, upper))
+
+    if attempt < len(config._delays):
+        delay = config._delays[attempt]
+    else:
+        delay = min(config.initial_delay * config.backoff_multiplier**attempt, config.max_delay)
 
-    # Add jitter to prevent thundering herd
-    jitter_range = delay * config.jitter
-    delay += random.uniform(-jitter_range, jitter_range)
+    # Add jitter to prevent thundering herd: uniform in [-jitter, +jitter] * delay
+    delay += (random.random() * 2.0 - 1.0) * delay * config.jitter
 
     return max(0.0, delay)
 
 
 def should_retry(status_code: int, config: RetryConfig) -> bool:
     """Determine if request should be retried based on status code."""
-    return status_code in config.retry_on_status
+    return status_code in config._retry_set
+
+
+def parse_retry_after(value: str) -> float | None:
+    """
+    Parse a Retry-After header value into seconds.
+
+    Accepts both forms allowed by RFC 9110: delay-seconds ("120") and an
+    HTTP-date ("Wed, 21 Oct 2015 07:28:00 GMT"). A date in the past yields 0.
+
+    Returns:
+        Seconds to wait, or None if the value is not understood
+    """
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
 
 
 def get_retry_after(response: httpx.Response) -> float | None:
@@ -62,12 +125,24 @@ def get_retry_after(response: httpx.Response) -> float | None:
     retry_after = response.headers.get("Retry-After")
     if retry_after is None:
         return None
+    return parse_retry_after(retry_after)
 
-    try:
-        return float(retry_after)
-    except ValueError:
-        # Could be HTTP-date format, ignore for simplicity
+
+def _retry_delay(
+    response: httpx.Response,
+    attempt: int,
+    config: RetryConfig,
+    previous_delay: float | None = None,
+) -> float | None:
+    """Return how long to wait before retrying `response`, or None to return it as is."""
+    status_code = response.status_code
+    if (
+        status_code < 400
+        or status_code not in config._retry_set
+        or attempt == config.max_retries
+    ):
         return None
+    return calculate_delay(attempt, config, get_retry_after(response), previous_delay)
 
 
 def execute_with_retry_sync(
@@ -87,27 +162,20 @@ def execute_with_retry_sync(
     Raises:
         The last exception if all retries fail
     """
+    delay: float | None = None
     for attempt in range(config.max_retries + 1):
         try:
             response = request_func()
 
-            if response.status_code < 400:
-                return response
-
-            if not should_retry(response.status_code, config):
-                return response
-
-            if attempt == config.max_retries:
+            delay = _retry_delay(response, attempt, config, delay)
+            if delay is None:
                 return response
-
-            retry_after = get_retry_after(response)
-            delay = calculate_delay(attempt, config, retry_after)
             time.sleep(delay)
 
         except (httpx.ConnectError, httpx.TimeoutException):
             if attempt == config.max_retries:
                 raise
-            delay = calculate_delay(attempt, config)
+            delay = calculate_delay(attempt, config, previous_delay=delay)
             time.sleep(delay)
 
     # Unreachable: loop always returns or raises
@@ -133,27 +201,20 @@ async def execute_with_retry_async(
     """
     import asyncio
 
+    delay: float | None = None
     for attempt in range(config.max_retries + 1):
         try:
             response = await request_func()
 
-            if response.status_code < 400:
-                return response
-
-            if not should_retry(response.status_code, config):
+            delay = _retry_delay(response, attempt, config, delay)
+            if delay is None:
                 return response
-
-            if attempt == config.max_retries:
-                return response
-
-            retry_after = get_retry_after(response)
-            delay = calculate_delay(attempt, config, retry_after)
             await asyncio.sleep(delay)
 
         except (httpx.ConnectError, httpx.TimeoutException):
             if attempt == config.max_retries:
                 raise
-            delay = calculate_delay(attempt, config)
+            delay = calculate_delay(attempt, config, previous_delay=delay)
             await asyncio.sleep(delay)
 
     # Unreachable: loop always returns or raises
@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Hashable, Iterable, Sequence
+from typing import Any, Callable, TypeVar, overload
 
 import httpx
-
-from yod._base_client import BaseClient
-from yod._retry import execute_with_retry_async
+from pydantic import BaseModel
+
+from yod._base_client import (
+    _ENTITY_CACHE_TTL,
+    _HEALTH_CACHE_TTL,
+    _JSON_HEADERS,
+    _SCHEMA_CACHE_TTL,
+    BaseClient,
+    _compact,
+    _json_dumps,
+    _ModelT,
+)
+from yod._retry import RetryConfig, execute_with_retry_async
 from yod.exceptions import YodConnectionError, YodTimeoutError
 from yod.models import (
     ApproveMemoryResponse,
@@ -20,6 +34,7 @@ from yod.models import (
     ContradictionsResponse,
     Conversation,
     CreateKeyResponse,
+    DashboardSnapshot,
     EntitiesResponse,
     EntityDetailsResponse,
     EvolutionKeysResponse,
@@ -50,6 +65,28 @@ from yod.models import (
     SuspiciousActivityResponse,
     UsageResponse,
 )
+from yod.models.responses import _CONVERSATION_LIST, _MESSAGE_INPUT_LIST, _MESSAGE_LIST
+
+_T = TypeVar("_T")
+
+# sync_messages() batches at least this long are serialized off the event loop
+_SYNC_OFFLOAD_THRESHOLD = 64
+
+
+async def _wait_all(tasks: Sequence[asyncio.Future[Any]]) -> None:
+    """
+    Wait for all of `tasks` to finish.
+
+    If one fails (or the caller is cancelled), the others are cancelled and
+    awaited before the error propagates, so nothing is left running unobserved.
+    """
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 class AsyncYodClient(BaseClient):
@@ -75,6 +112,14 @@ class AsyncYodClient(BaseClient):
         timeout: float = 30.0,
         connect_timeout: float = 5.0,
         max_retries: int = 3,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        max_concurrency: int | None = None,
+        retry_config: RetryConfig | None = None,
+        warmup: bool = False,
+        http2: bool = False,
+        cache_responses: bool = False,
         **kwargs: Any,
     ) -> None:
         """
@@ -88,6 +133,18 @@ class AsyncYodClient(BaseClient):
             timeout: Request timeout in seconds
             connect_timeout: Connection timeout in seconds
             max_retries: Maximum retry attempts for failed requests
+            max_connections: Maximum concurrent connections in the pool
+            max_keepalive_connections: Maximum idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept open
+            max_concurrency: Maximum concurrent requests issued by the *_bulk
+                helpers (default: max_keepalive_connections)
+            retry_config: Full retry policy (delays, jitter, retryable statuses);
+                overrides max_retries when given
+            warmup: Connect to the API when entering the context manager so the
+                first real request skips DNS/TCP/TLS setup (best-effort)
+            http2: Use HTTP/2 when the server supports it (requires `yod[http2]`)
+            cache_responses: Briefly cache results of read-only GETs such as health()
+                and get_memory_tools_schema(); see invalidate_cache()
         """
         super().__init__(
             api_key=api_key,
@@ -97,23 +154,117 @@ class AsyncYodClient(BaseClient):
             timeout=timeout,
             connect_timeout=connect_timeout,
             max_retries=max_retries,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            max_concurrency=max_concurrency,
+            retry_config=retry_config,
+            warmup=warmup,
+            http2=http2,
+            cache_responses=cache_responses,
             **kwargs,
         )
         self._client: httpx.AsyncClient | None = None
+        # GETs currently on the wire, so identical concurrent GETs share one response
+        self._inflight: dict[Hashable, asyncio.Future[httpx.Response]] = {}
+        # Callers currently awaiting each in-flight GET
+        self._waiters: dict[asyncio.Future[httpx.Response], int] = {}
 
     def _get_client(self) -> httpx.AsyncClient:
         """Get or create the async HTTP client."""
         if self._client is None:
             self._client = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.config.timeout, connect=self.config.connect_timeout),
-                headers=self._build_headers(),
+                headers=self._headers,
+                base_url=self.config.base_url,
+                http2=self.config.http2,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive_connections,
+                    keepalive_expiry=self.config.keepalive_expiry,
+                ),
             )
         return self._client
 
+    async def _gather_bounded(self, coros: Iterable[Awaitable[_T]]) -> list[_T]:
+        """
+        Run `coros` concurrently, at most config.max_concurrency at a time, in order.
+
+        On the first failure the remaining coroutines are cancelled (and awaited)
+        before the error is raised.
+        """
+        # One per call: on Python < 3.10 a semaphore binds to the loop it is first used on,
+        # and the client may be reused across asyncio.run() calls
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def bounded(coro: Awaitable[_T]) -> _T:
+            async with semaphore:
+                return await coro
+
+        tasks = [asyncio.ensure_future(bounded(coro)) for coro in coros]
+        await _wait_all(tasks)
+        return [task.result() for task in tasks]
+
+    async def _send_coalesced(
+        self,
+        key: Hashable,
+        make_request: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """
+        Send a GET, or join an identical one that is already in flight.
+
+        The request runs in its own task that no caller owns, and every caller
+        awaits it through asyncio.shield(), so cancelling one caller never
+        cancels the request for the others; it is only abandoned once every
+        caller waiting on it has been cancelled. Only the (fully read)
+        httpx.Response is shared, so every caller still validates its own model
+        and raises its own exception.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(execute_with_retry_async(make_request, self.retry_config))
+            self._inflight[key] = task
+
+            def forget(finished: asyncio.Future[httpx.Response]) -> None:
+                if self._inflight.get(key) is finished:
+                    del self._inflight[key]
+                if not finished.cancelled():
+                    finished.exception()  # Retrieved here so a task nobody awaits doesn't log it
+
+            task.add_done_callback(forget)
+
+        waiters = self._waiters
+        waiters[task] = waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            waiters[task] -= 1
+            if not waiters[task]:
+                del waiters[task]
+                # If the last caller left before the request finished, abandon it
+                if task.cancel():
+                    if self._inflight.get(key) is task:
+                        del self._inflight[key]
+                    await asyncio.wait((task,))
+
     async def __aenter__(self) -> AsyncYodClient:
         """Async context manager entry."""
+        if self.config.warmup:
+            await self.warmup()
         return self
 
+    async def warmup(self) -> None:
+        """
+        Open a keep-alive connection to the API ahead of the first request.
+
+        Sends one unretried GET /health bounded by connect_timeout. Failures are
+        ignored: warm-up is best-effort and real requests report their own errors.
+        """
+        try:
+            await self._get_client().get("/health", timeout=self.config.connect_timeout)
+        except httpx.HTTPError:
+            pass
+
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit - closes HTTP session."""
         await self.close()
@@ -124,6 +275,7 @@ class AsyncYodClient(BaseClient):
             await self._client.aclose()
             self._client = None
 
+    @overload
     async def _request(
         self,
         method: str,
@@ -132,47 +284,92 @@ class AsyncYodClient(BaseClient):
         params: dict[str, Any] | None = None,
         files: dict[str, Any] | None = None,
         raw_response: bool = False,
+        *,
+        response_model: type[_ModelT],
+        cache_ttl: float | None = None,
+    ) -> _ModelT: ...
+
+    @overload
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        files: dict[str, Any] | None = None,
+        raw_response: bool = False,
+        response_model: None = None,
+        cache_ttl: float | None = None,
+    ) -> Any: ...
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        files: dict[str, Any] | None = None,
+        raw_response: bool = False,
+        response_model: type[BaseModel] | None = None,
+        cache_ttl: float | None = None,
     ) -> Any:
-        """Make an async HTTP request with retry logic."""
-        url = self._build_url(path)
+        """
+        Make an async HTTP request with retry logic.
+
+        On success, returns the raw body bytes if `raw_response` is set, the
+        body validated straight from JSON bytes into `response_model` if given,
+        and otherwise the decoded JSON ({} for an empty body).
+
+        With cache_responses enabled, a `response_model` result is cached for
+        `cache_ttl` seconds; only pass it for read-only GETs.
+        """
+        cache_key = None
+        if cache_ttl is not None and response_model is not None and self.config.cache_responses:
+            cache_key = self._cache_key(path, params)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
         client = self._get_client()
 
-        # Filter out None params
-        if params:
-            params = {k: v for k, v in params.items() if v is not None}
+        # Build the request once (serializing the JSON body a single time); retries resend it
+        if files:
+            # httpx sets the multipart Content-Type (with boundary) itself
+            request = client.build_request(method, path, files=files, params=params)
+        elif json is not None:
+            request = client.build_request(
+                method, path, content=_json_dumps(json), headers=_JSON_HEADERS, params=params
+            )
+        else:
+            request = client.build_request(method, path, params=params)
 
         async def make_request() -> httpx.Response:
-            if files:
-                # For file uploads, don't use JSON content type
-                headers = self._build_headers()
-                headers.pop("Content-Type", None)
-                return await client.request(
-                    method, url, files=files, headers=headers, params=params
-                )
-            return await client.request(method, url, json=json, params=params)
+            return await client.send(request)
 
         try:
-            response = await execute_with_retry_async(make_request, self.retry_config)
+            if method == "GET":
+                response = await self._send_coalesced(self._cache_key(path, params), make_request)
+            else:
+                response = await execute_with_retry_async(make_request, self.retry_config)
         except httpx.ConnectError as e:
-            raise YodConnectionError(f"Failed to connect to {url}: {e}") from e
+            raise YodConnectionError(f"Failed to connect to {self._build_url(path)}: {e}") from e
         except httpx.TimeoutException as e:
-            raise YodTimeoutError(f"Request to {url} timed out: {e}") from e
+            raise YodTimeoutError(f"Request to {self._build_url(path)} timed out: {e}") from e
 
-        request_id = response.headers.get("X-Request-Id")
-        headers = dict(response.headers)
+        self._raise_for_status(response)
 
+        body = response.content
         if raw_response:
-            if response.status_code >= 400:
-                body = self._parse_response_body(response.content)
-                self._handle_error_response(response.status_code, body, request_id, headers)
-            return response.content
-
-        body = self._parse_response_body(response.content)
-
-        if response.status_code >= 400:
-            self._handle_error_response(response.status_code, body, request_id, headers)
-
-        return body
+            return body
+        if response_model is not None:
+            result = response_model.model_validate_json(body)
+            if cache_key is not None and cache_ttl is not None:
+                self._cache_put(cache_key, result, cache_ttl)
+            return result
+        if not body:
+            # 204 No Content (or an empty 200) from a mutation: nothing to decode
+            return {}
+        return self._parse_response_body(body, response.headers.get("Content-Type"))
 
     # --- Ingest Operations ---
 
@@ -203,18 +400,49 @@ class AsyncYodClient(BaseClient):
             ValidationError: If text is empty or too long
             RateLimitError: If rate limit exceeded
         """
-        payload = {"text": text}
-        if source_id is not None:
-            payload["source_id"] = source_id
-        if timestamp is not None:
-            payload["timestamp"] = timestamp
-        if session_id is not None:
-            payload["session_id"] = session_id
-        if agent_id is not None:
-            payload["agent_id"] = agent_id
+        payload = _compact(
+            text=text,
+            source_id=source_id,
+            timestamp=timestamp,
+            session_id=session_id,
+            agent_id=agent_id,
+        )
+
+        return await self._request(
+            "POST", "/ingest/chat", json=payload, response_model=IngestResponse
+        )
+
+    async def ingest_chat_bulk(
+        self,
+        texts: Iterable[str],
+        *,
+        source_id: str | None = None,
+        session_id: str | None = None,
+        agent_id: str | None = None,
+    ) -> list[IngestResponse]:
+        """
+        Ingest several texts concurrently.
+
+        Each text is sent as its own ingest_chat() request (there is no batch
+        ingest endpoint); at most config.max_concurrency are in flight at once.
+
+        Args:
+            texts: The text contents to ingest (1-100,000 chars each)
+            source_id: Optional identifier for the source, applied to every text
+            session_id: Optional session ID for memory isolation across contexts
+            agent_id: Optional agent identifier within a session
+
+        Returns:
+            IngestResponses in the same order as texts
 
-        data = await self._request("POST", "/ingest/chat", json=payload)
-        return IngestResponse.model_validate(data)
+        Raises:
+            ValidationError: If any text is empty or too long
+            RateLimitError: If rate limit exceeded
+        """
+        return await self._gather_bounded(
+            self.ingest_chat(text, source_id=source_id, session_id=session_id, agent_id=agent_id)
+            for text in texts
+        )
 
     # --- Chat Operations ---
 
@@ -243,16 +471,41 @@ class AsyncYodClient(BaseClient):
             ValidationError: If question is empty or too long
             RateLimitError: If rate limit exceeded
         """
-        payload: dict[str, Any] = {"question": question}
-        if language is not None:
-            payload["language"] = language
-        if as_of is not None:
-            payload["as_of"] = as_of
-        if session_id is not None:
-            payload["session_id"] = session_id
+        payload = _compact(question=question, language=language, as_of=as_of, session_id=session_id)
+
+        return await self._request("POST", "/chat", json=payload, response_model=ChatResponse)
+
+    async def chat_bulk(
+        self,
+        questions: Iterable[str],
+        *,
+        language: str | None = None,
+        as_of: str | None = None,
+        session_id: str | None = None,
+    ) -> list[ChatResponse]:
+        """
+        Ask several questions concurrently.
+
+        Each question is sent as its own chat() request; at most
+        config.max_concurrency are in flight at once.
 
-        data = await self._request("POST", "/chat", json=payload)
-        return ChatResponse.model_validate(data)
+        Args:
+            questions: The questions to ask (1-10,000 chars each)
+            language: Optional language code for every response (e.g., "en", "fa")
+            as_of: Optional ISO8601 timestamp for temporal queries
+            session_id: Optional session ID for scoped retrieval, applied to every question
+
+        Returns:
+            ChatResponses in the same order as questions
+
+        Raises:
+            ValidationError: If any question is empty or too long
+            RateLimitError: If rate limit exceeded
+        """
+        return await self._gather_bounded(
+            self.chat(question, language=language, as_of=as_of, session_id=session_id)
+            for question in questions
+        )
 
     # --- Memory Operations ---
 
@@ -278,18 +531,17 @@ class AsyncYodClient(BaseClient):
         Returns:
             MemoryListResponse with list of MemoryItem
         """
-        params: dict[str, Any] = {"limit": limit}
-        if kind is not None:
-            params["kind"] = kind
-        if search is not None:
-            params["search"] = search
-        if include_inactive:
-            params["include_inactive"] = include_inactive
-        if as_of is not None:
-            params["as_of"] = as_of
+        params = _compact(
+            limit=limit,
+            kind=kind,
+            search=search,
+            include_inactive=include_inactive or None,
+            as_of=as_of,
+        )
 
-        data = await self._request("GET", "/memories", params=params)
-        return MemoryListResponse.model_validate(data)
+        return await self._request(
+            "GET", "/memories", params=params, response_model=MemoryListResponse
+        )
 
     async def get_memory(self, memory_id: str) -> MemoryItem:
         """
@@ -304,8 +556,24 @@ class AsyncYodClient(BaseClient):
         Raises:
             NotFoundError: If memory does not exist
         """
-        data = await self._request("GET", f"/memories/{memory_id}")
-        return MemoryItem.model_validate(data)
+        return await self._request("GET", f"/memories/{memory_id}", response_model=MemoryItem)
+
+    async def get_memories_bulk(self, memory_ids: Iterable[str]) -> list[MemoryItem]:
+        """
+        Get several memories by ID concurrently.
+
+        At most config.max_concurrency requests are in flight at once.
+
+        Args:
+            memory_ids: The memory IDs to retrieve
+
+        Returns:
+            MemoryItems in the same order as memory_ids
+
+        Raises:
+            NotFoundError: If any memory does not exist
+        """
+        return await self._gather_bounded(self.get_memory(memory_id) for memory_id in memory_ids)
 
     async def update_memory(
         self,
@@ -331,13 +599,7 @@ class AsyncYodClient(BaseClient):
             NotFoundError: If memory does not exist
             ValidationError: If confidence out of range
         """
-        payload: dict[str, Any] = {}
-        if kind is not None:
-            payload["kind"] = kind
-        if summary is not None:
-            payload["summary"] = summary
-        if confidence is not None:
-            payload["confidence"] = confidence
+        payload = _compact(kind=kind, summary=summary, confidence=confidence)
 
         result: dict[str, Any] = await self._request(
             "PATCH", f"/memories/{memory_id}", json=payload
@@ -375,8 +637,9 @@ class AsyncYodClient(BaseClient):
         Raises:
             NotFoundError: If memory not found or has no history
         """
-        data = await self._request("GET", f"/memories/{memory_id}/history")
-        return MemoryListResponse.model_validate(data)
+        return await self._request(
+            "GET", f"/memories/{memory_id}/history", response_model=MemoryListResponse
+        )
 
     # --- Session Operations ---
 
@@ -396,14 +659,9 @@ class AsyncYodClient(BaseClient):
         Returns:
             Session with session_id, user_id, agent_id, created_at, metadata
         """
-        payload: dict[str, Any] = {}
-        if agent_id is not None:
-            payload["agent_id"] = agent_id
-        if metadata is not None:
-            payload["metadata"] = metadata
+        payload = _compact(agent_id=agent_id, metadata=metadata)
 
-        data = await self._request("POST", "/sessions", json=payload)
-        return Session.model_validate(data)
+        return await self._request("POST", "/sessions", json=payload, response_model=Session)
 
     async def list_sessions(
         self,
@@ -423,12 +681,40 @@ class AsyncYodClient(BaseClient):
         Returns:
             SessionListResponse with sessions list and total count
         """
-        params: dict[str, Any] = {"limit": limit, "offset": offset}
-        if agent_id is not None:
-            params["agent_id"] = agent_id
+        params = _compact(limit=limit, offset=offset, agent_id=agent_id)
+
+        return await self._request(
+            "GET", "/sessions", params=params, response_model=SessionListResponse
+        )
+
+    async def iter_sessions(
+        self,
+        *,
+        agent_id: str | None = None,
+        page_size: int = 50,
+    ) -> AsyncIterator[Session]:
+        """
+        Iterate over all sessions for the current user, one page at a time.
 
-        data = await self._request("GET", "/sessions", params=params)
-        return SessionListResponse.model_validate(data)
+        Only one page is held in memory, and the first sessions are available
+        before later pages have been fetched.
+
+        Args:
+            agent_id: Optional filter by agent ID
+            page_size: Number of sessions requested per page (default: 50)
+
+        Yields:
+            Session objects
+        """
+        offset = 0
+        while True:
+            page = await self.list_sessions(agent_id=agent_id, limit=page_size, offset=offset)
+            for session in page.sessions:
+                yield session
+            # The server may cap the page below page_size, so only `total` marks the end
+            offset += len(page.sessions)
+            if not page.sessions or offset >= page.total:
+                return
 
     async def get_session(self, session_id: str) -> Session:
         """
@@ -443,8 +729,26 @@ class AsyncYodClient(BaseClient):
         Raises:
             NotFoundError: If session does not exist
         """
-        data = await self._request("GET", f"/sessions/{session_id}")
-        return Session.model_validate(data)
+        return await self._request("GET", f"/sessions/{session_id}", response_model=Session)
+
+    async def get_sessions_bulk(self, session_ids: Iterable[str]) -> list[Session]:
+        """
+        Get several sessions by ID concurrently.
+
+        At most config.max_concurrency requests are in flight at once.
+
+        Args:
+            session_ids: The session IDs to retrieve
+
+        Returns:
+            Sessions in the same order as session_ids
+
+        Raises:
+            NotFoundError: If any session does not exist
+        """
+        return await self._gather_bounded(
+            self.get_session(session_id) for session_id in session_ids
+        )
 
     async def update_session(
         self,
@@ -465,8 +769,9 @@ class AsyncYodClient(BaseClient):
         Raises:
             NotFoundError: If session does not exist
         """
-        data = await self._request("PATCH", f"/sessions/{session_id}", json={"metadata": metadata})
-        return Session.model_validate(data)
+        return await self._request(
+            "PATCH", f"/sessions/{session_id}", json={"metadata": metadata}, response_model=Session
+        )
 
     async def delete_session(
         self,
@@ -498,13 +803,15 @@ class AsyncYodClient(BaseClient):
 
     async def health(self) -> HealthResponse:
         """Check API health status."""
-        data = await self._request("GET", "/health")
-        return HealthResponse.model_validate(data)
+        return await self._request(
+            "GET", "/health", response_model=HealthResponse, cache_ttl=_HEALTH_CACHE_TTL
+        )
 
     async def ready(self) -> ReadyResponse:
         """Check API readiness (includes backend checks)."""
-        data = await self._request("GET", "/ready")
-        return ReadyResponse.model_validate(data)
+        return await self._request(
+            "GET", "/ready", response_model=ReadyResponse, cache_ttl=_HEALTH_CACHE_TTL
+        )
 
     # --- API Key Operations ---
 
@@ -526,14 +833,9 @@ class AsyncYodClient(BaseClient):
         Returns:
             CreateKeyResponse with key_id and secret_key (shown only once!)
         """
-        payload: dict[str, Any] = {"name": name}
-        if scopes is not None:
-            payload["scopes"] = scopes
-        if expires_in_days is not None:
-            payload["expires_in_days"] = expires_in_days
+        payload = _compact(name=name, scopes=scopes, expires_in_days=expires_in_days)
 
-        data = await self._request("POST", "/keys", json=payload)
-        return CreateKeyResponse.model_validate(data)
+        return await self._request("POST", "/keys", json=payload, response_model=CreateKeyResponse)
 
     async def list_api_keys(self) -> KeyListResponse:
         """
@@ -542,8 +844,7 @@ class AsyncYodClient(BaseClient):
         Returns:
             KeyListResponse with list of APIKeyItem (secrets not included)
         """
-        data = await self._request("GET", "/keys")
-        return KeyListResponse.model_validate(data)
+        return await self._request("GET", "/keys", response_model=KeyListResponse)
 
     async def revoke_api_key(self, key_id: str) -> dict[str, Any]:
         """
@@ -577,14 +878,11 @@ class AsyncYodClient(BaseClient):
         Returns:
             UsageResponse with summary and per-endpoint breakdown
         """
-        params: dict[str, Any] = {}
-        if start_date is not None:
-            params["start_date"] = start_date
-        if end_date is not None:
-            params["end_date"] = end_date
+        params = _compact(start_date=start_date, end_date=end_date)
 
-        data = await self._request("GET", "/keys/usage", params=params)
-        return UsageResponse.model_validate(data)
+        return await self._request(
+            "GET", "/keys/usage", params=params, response_model=UsageResponse
+        )
 
     async def get_quota(self) -> QuotaResponse:
         """
@@ -593,8 +891,7 @@ class AsyncYodClient(BaseClient):
         Returns:
             QuotaResponse with plan info and quota limits
         """
-        data = await self._request("GET", "/keys/quota")
-        return QuotaResponse.model_validate(data)
+        return await self._request("GET", "/keys/quota", response_model=QuotaResponse)
 
     # --- Conversation Operations ---
 
@@ -614,14 +911,11 @@ class AsyncYodClient(BaseClient):
         Returns:
             Conversation with conversation_id, title, created_at, etc.
         """
-        payload: dict[str, Any] = {}
-        if title is not None:
-            payload["title"] = title
-        if conversation_id is not None:
-            payload["conversation_id"] = conversation_id
+        payload = _compact(title=title, conversation_id=conversation_id)
 
-        data = await self._request("POST", "/conversations", json=payload)
-        return Conversation.model_validate(data)
+        return await self._request(
+            "POST", "/conversations", json=payload, response_model=Conversation
+        )
 
     async def list_conversations(
         self,
@@ -640,10 +934,33 @@ class AsyncYodClient(BaseClient):
             List of Conversation objects
         """
         params: dict[str, Any] = {"limit": limit, "offset": offset}
-        data = await self._request("GET", "/conversations", params=params)
-        if data is None:
+        content = await self._request("GET", "/conversations", params=params, raw_response=True)
+        if not content:
             return []
-        return [Conversation.model_validate(c) for c in data]
+        return _CONVERSATION_LIST.validate_json(content)
+
+    async def iter_conversations(self, *, page_size: int = 50) -> AsyncIterator[Conversation]:
+        """
+        Iterate over all conversations for the current user, one page at a time.
+
+        Only one page is held in memory, and the first conversations are
+        available before later pages have been fetched.
+
+        Args:
+            page_size: Number of conversations requested per page (default: 50)
+
+        Yields:
+            Conversation objects
+        """
+        offset = 0
+        while True:
+            page = await self.list_conversations(limit=page_size, offset=offset)
+            for conversation in page:
+                yield conversation
+            # No total here, and the server may cap the page below page_size
+            if not page:
+                return
+            offset += len(page)
 
     async def get_conversation(self, conversation_id: str) -> Conversation:
         """
@@ -658,8 +975,9 @@ class AsyncYodClient(BaseClient):
         Raises:
             NotFoundError: If conversation does not exist
         """
-        data = await self._request("GET", f"/conversations/{conversation_id}")
-        return Conversation.model_validate(data)
+        return await self._request(
+            "GET", f"/conversations/{conversation_id}", response_model=Conversation
+        )
 
     async def update_conversation(
         self,
@@ -680,10 +998,10 @@ class AsyncYodClient(BaseClient):
         Raises:
             NotFoundError: If conversation does not exist
         """
-        data = await self._request(
-            "PATCH", f"/conversations/{conversation_id}", json={"title": title}
+        return await self._request(
+            "PATCH", f"/conversations/{conversation_id}", json={"title": title},
+            response_model=Conversation,
         )
-        return Conversation.model_validate(data)
 
     async def delete_conversation(self, conversation_id: str) -> dict[str, Any]:
         """
@@ -731,16 +1049,14 @@ class AsyncYodClient(BaseClient):
         Returns:
             List of Message objects
         """
-        params: dict[str, Any] = {"limit": limit}
-        if before_id is not None:
-            params["before_id"] = before_id
+        params = _compact(limit=limit, before_id=before_id)
 
-        data = await self._request(
-            "GET", f"/conversations/{conversation_id}/messages", params=params
+        content = await self._request(
+            "GET", f"/conversations/{conversation_id}/messages", params=params, raw_response=True
         )
-        if data is None:
+        if not content:
             return []
-        return [Message.model_validate(m) for m in data]
+        return _MESSAGE_LIST.validate_json(content)
 
     async def add_message(
         self,
@@ -762,14 +1078,12 @@ class AsyncYodClient(BaseClient):
         Returns:
             Message with message_id, created_at, etc.
         """
-        payload: dict[str, Any] = {"role": role, "content": content}
-        if citations is not None:
-            payload["citations"] = citations
+        payload = _compact(role=role, content=content, citations=citations)
 
-        data = await self._request(
-            "POST", f"/conversations/{conversation_id}/messages", json=payload
+        return await self._request(
+            "POST", f"/conversations/{conversation_id}/messages", json=payload,
+            response_model=Message,
         )
-        return Message.model_validate(data)
 
     async def sync_messages(
         self,
@@ -788,7 +1102,15 @@ class AsyncYodClient(BaseClient):
         Returns:
             Dict with ok: True and saved count
         """
-        payload = {"messages": [m.model_dump() for m in messages]}
+        # One serializer call for the whole batch; large batches are dumped in a
+        # worker thread so they don't stall other requests on the event loop.
+        if len(messages) < _SYNC_OFFLOAD_THRESHOLD:
+            dumped = _MESSAGE_INPUT_LIST.dump_python(messages, mode="json")
+        else:
+            dumped = await asyncio.to_thread(
+                _MESSAGE_INPUT_LIST.dump_python, messages, mode="json"
+            )
+        payload = {"messages": dumped}
         result: dict[str, Any] = await self._request(
             "POST", f"/conversations/{conversation_id}/sync", json=payload
         )
@@ -813,8 +1135,7 @@ class AsyncYodClient(BaseClient):
             STTResponse with transcribed text and detected language
         """
         files = {"audio": (filename, audio_file)}
-        data = await self._request("POST", "/speech/stt", files=files)
-        return STTResponse.model_validate(data)
+        return await self._request("POST", "/speech/stt", files=files, response_model=STTResponse)
 
     async def text_to_speech(
         self,
@@ -832,12 +1153,52 @@ class AsyncYodClient(BaseClient):
         Returns:
             MP3 audio bytes
         """
-        payload: dict[str, Any] = {"text": text}
-        if voice_id is not None:
-            payload["voice_id"] = voice_id
+        payload = _compact(text=text, voice_id=voice_id)
 
         return await self._request("POST", "/speech/tts", json=payload, raw_response=True)
 
+    async def text_to_speech_stream(
+        self,
+        text: str,
+        *,
+        voice_id: str | None = None,
+        chunk_size: int = 16384,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream text-to-speech audio as it is received.
+
+        Unlike text_to_speech(), the MP3 is not buffered in memory: chunks are
+        yielded as they arrive. The request is not retried.
+
+        Args:
+            text: Text to convert to speech
+            voice_id: Optional ElevenLabs voice ID (uses server default if not specified)
+            chunk_size: Size in bytes of the yielded chunks
+
+        Yields:
+            Chunks of MP3 audio bytes
+        """
+        payload = _compact(text=text, voice_id=voice_id)
+
+        client = self._get_client()
+        try:
+            async with client.stream(
+                "POST", "/speech/tts", content=_json_dumps(payload), headers=_JSON_HEADERS
+            ) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    self._raise_for_status(response)
+                async for chunk in response.aiter_bytes(chunk_size):
+                    yield chunk
+        except httpx.ConnectError as e:
+            raise YodConnectionError(
+                f"Failed to connect to {self._build_url('/speech/tts')}: {e}"
+            ) from e
+        except httpx.TimeoutException as e:
+            raise YodTimeoutError(
+                f"Request to {self._build_url('/speech/tts')} timed out: {e}"
+            ) from e
+
     # --- Consolidation Operations ---
 
     async def get_consolidation_status(self) -> ConsolidationStatusResponse:
@@ -849,8 +1210,9 @@ class AsyncYodClient(BaseClient):
         Returns:
             ConsolidationStatusResponse with enabled, schedule, stats, and last_consolidation
         """
-        data = await self._request("GET", "/consolidation/status")
-        return ConsolidationStatusResponse.model_validate(data)
+        return await self._request(
+            "GET", "/consolidation/status", response_model=ConsolidationStatusResponse
+        )
 
     async def run_consolidation(self) -> ConsolidationResultResponse:
         """
@@ -872,8 +1234,9 @@ class AsyncYodClient(BaseClient):
             For long-running consolidation, consider using trigger_consolidation()
             for async execution.
         """
-        data = await self._request("POST", "/consolidation/run")
-        return ConsolidationResultResponse.model_validate(data)
+        return await self._request(
+            "POST", "/consolidation/run", response_model=ConsolidationResultResponse
+        )
 
     async def trigger_consolidation(self) -> ConsolidationTriggerResponse:
         """
@@ -888,8 +1251,9 @@ class AsyncYodClient(BaseClient):
             - message: Human-readable status message
             - job_id: ID for tracking the background job (use with get_consolidation_result)
         """
-        data = await self._request("POST", "/consolidation/trigger")
-        return ConsolidationTriggerResponse.model_validate(data)
+        return await self._request(
+            "POST", "/consolidation/trigger", response_model=ConsolidationTriggerResponse
+        )
 
     async def get_consolidation_result(self, job_id: str) -> ConsolidationResultResponse:
         """
@@ -905,8 +1269,54 @@ class AsyncYodClient(BaseClient):
         Raises:
             NotFoundError: If job_id does not exist
         """
-        data = await self._request("GET", f"/consolidation/result/{job_id}")
-        return ConsolidationResultResponse.model_validate(data)
+        return await self._request(
+            "GET", f"/consolidation/result/{job_id}", response_model=ConsolidationResultResponse
+        )
+
+    async def wait_for_consolidation(
+        self,
+        job_id: str,
+        *,
+        poll_interval: float = 0.5,
+        max_interval: float = 10.0,
+        timeout: float | None = None,
+    ) -> ConsolidationResultResponse:
+        """
+        Wait for an async consolidation job to complete.
+
+        Polls get_consolidation_result() with exponential backoff (doubling from
+        poll_interval up to max_interval, plus up to 50% jitter).
+
+        Args:
+            job_id: The job ID returned from trigger_consolidation()
+            poll_interval: Delay in seconds before the second poll
+            max_interval: Upper bound on the delay between polls
+            timeout: Give up after this many seconds (default: wait indefinitely)
+
+        Returns:
+            ConsolidationResultResponse with completed_at set
+
+        Raises:
+            NotFoundError: If job_id does not exist
+            YodTimeoutError: If the job has not completed within timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = poll_interval
+        while True:
+            result = await self.get_consolidation_result(job_id)
+            if result.completed_at is not None:
+                return result
+
+            delay = interval * (1.0 + random.random() * 0.5)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise YodTimeoutError(
+                        f"Consolidation job {job_id} did not complete within {timeout}s"
+                    )
+                delay = min(delay, remaining)
+            await asyncio.sleep(delay)
+            interval = min(interval * 2, max_interval)
 
     # --- Evolution/Drift Operations ---
 
@@ -928,12 +1338,11 @@ class AsyncYodClient(BaseClient):
         Returns:
             EvolutionResponse with timeline, drift scores, pattern, and interpretation
         """
-        params: dict[str, Any] = {}
-        if time_windows is not None:
-            params["time_windows"] = time_windows
+        params = _compact(time_windows=time_windows)
 
-        data = await self._request("GET", f"/memories/evolution/{key}", params=params)
-        return EvolutionResponse.model_validate(data)
+        return await self._request(
+            "GET", f"/memories/evolution/{key}", params=params, response_model=EvolutionResponse
+        )
 
     async def list_evolution_keys(self, *, limit: int = 20) -> EvolutionKeysResponse:
         """
@@ -947,8 +1356,10 @@ class AsyncYodClient(BaseClient):
         Returns:
             EvolutionKeysResponse with list of keys and count
         """
-        data = await self._request("GET", "/memories/evolution", params={"limit": limit})
-        return EvolutionKeysResponse.model_validate(data)
+        return await self._request(
+            "GET", "/memories/evolution", params={"limit": limit},
+            response_model=EvolutionKeysResponse,
+        )
 
     # --- Entity Operations ---
 
@@ -964,8 +1375,9 @@ class AsyncYodClient(BaseClient):
         Returns:
             EntitiesResponse with entities list and co-occurrence links
         """
-        data = await self._request("GET", "/entities", params={"limit": limit})
-        return EntitiesResponse.model_validate(data)
+        return await self._request(
+            "GET", "/entities", params={"limit": limit}, response_model=EntitiesResponse
+        )
 
     async def get_entity_details(self, entity_id: str) -> EntityDetailsResponse:
         """
@@ -980,8 +1392,33 @@ class AsyncYodClient(BaseClient):
         Raises:
             NotFoundError: If entity does not exist
         """
-        data = await self._request("GET", f"/entities/{entity_id}/details")
-        return EntityDetailsResponse.model_validate(data)
+        return await self._request(
+            "GET",
+            f"/entities/{entity_id}/details",
+            response_model=EntityDetailsResponse,
+            cache_ttl=_ENTITY_CACHE_TTL,
+        )
+
+    async def get_entity_details_bulk(
+        self, entity_ids: Iterable[str]
+    ) -> list[EntityDetailsResponse]:
+        """
+        Get details for several entities concurrently.
+
+        At most config.max_concurrency requests are in flight at once.
+
+        Args:
+            entity_ids: The entity IDs to retrieve
+
+        Returns:
+            EntityDetailsResponses in the same order as entity_ids
+
+        Raises:
+            NotFoundError: If any entity does not exist
+        """
+        return await self._gather_bounded(
+            self.get_entity_details(entity_id) for entity_id in entity_ids
+        )
 
     # --- Graph Operations ---
 
@@ -1004,8 +1441,9 @@ class AsyncYodClient(BaseClient):
             ClaimsGraphResponse with nodes and links
         """
         params = {"limit": limit, "include_inactive": include_inactive}
-        data = await self._request("GET", "/memories/graph", params=params)
-        return ClaimsGraphResponse.model_validate(data)
+        return await self._request(
+            "GET", "/memories/graph", params=params, response_model=ClaimsGraphResponse
+        )
 
     # --- Contradiction Operations ---
 
@@ -1018,8 +1456,9 @@ class AsyncYodClient(BaseClient):
         Returns:
             ContradictionsResponse with total conflicts, samples, and session count
         """
-        data = await self._request("GET", "/memories/contradictions")
-        return ContradictionsResponse.model_validate(data)
+        return await self._request(
+            "GET", "/memories/contradictions", response_model=ContradictionsResponse
+        )
 
     async def get_session_contradictions(
         self,
@@ -1037,12 +1476,48 @@ class AsyncYodClient(BaseClient):
         Returns:
             SessionContradictionsResponse with contradiction pairs
         """
-        data = await self._request(
+        return await self._request(
             "GET",
             f"/memories/contradictions/session/{session_id}",
             params={"limit": limit},
+            response_model=SessionContradictionsResponse,
+        )
+
+    # --- Composite Operations ---
+
+    async def dashboard_snapshot(
+        self,
+        *,
+        entity_limit: int = 200,
+        claims_limit: int = 100,
+    ) -> DashboardSnapshot:
+        """
+        Fetch everything a memory dashboard needs in one round of concurrent requests.
+
+        Runs list_entities(), get_claims_graph(), get_contradictions() and health()
+        concurrently, so the total latency is that of the slowest call. If any
+        of them fails, the others are cancelled and awaited, then the error is
+        raised.
+
+        Args:
+            entity_limit: Maximum number of entities to return (default: 200)
+            claims_limit: Maximum number of claims in the graph (default: 100)
+
+        Returns:
+            DashboardSnapshot with entities, claims, contradictions and health
+        """
+        entities = asyncio.ensure_future(self.list_entities(limit=entity_limit))
+        claims = asyncio.ensure_future(self.get_claims_graph(limit=claims_limit))
+        contradictions = asyncio.ensure_future(self.get_contradictions())
+        health = asyncio.ensure_future(self.health())
+        await _wait_all((entities, claims, contradictions, health))
+
+        return DashboardSnapshot(
+            entities=entities.result(),
+            claims=claims.result(),
+            contradictions=contradictions.result(),
+            health=health.result(),
         )
-        return SessionContradictionsResponse.model_validate(data)
 
     # --- Audit Operations ---
 
@@ -1056,8 +1531,10 @@ class AsyncYodClient(BaseClient):
         Returns:
             AuditSummaryResponse with total events and breakdown by action
         """
-        data = await self._request("GET", "/memories/audit/summary", params={"days": days})
-        return AuditSummaryResponse.model_validate(data)
+        return await self._request(
+            "GET", "/memories/audit/summary", params={"days": days},
+            response_model=AuditSummaryResponse,
+        )
 
     async def get_recent_audit(
         self,
@@ -1075,12 +1552,11 @@ class AsyncYodClient(BaseClient):
         Returns:
             RecentAuditResponse with list of audit events
         """
-        params: dict[str, Any] = {"limit": limit}
-        if action is not None:
-            params["action"] = action
+        params = _compact(limit=limit, action=action)
 
-        data = await self._request("GET", "/memories/audit/recent", params=params)
-        return RecentAuditResponse.model_validate(data)
+        return await self._request(
+            "GET", "/memories/audit/recent", params=params, response_model=RecentAuditResponse
+        )
 
     async def get_suspicious_activity(self, *, hours: int = 24) -> SuspiciousActivityResponse:
         """
@@ -1094,8 +1570,10 @@ class AsyncYodClient(BaseClient):
         Returns:
             SuspiciousActivityResponse with detected patterns
         """
-        data = await self._request("GET", "/memories/audit/suspicious", params={"hours": hours})
-        return SuspiciousActivityResponse.model_validate(data)
+        return await self._request(
+            "GET", "/memories/audit/suspicious", params={"hours": hours},
+            response_model=SuspiciousActivityResponse,
+        )
 
     async def get_memory_audit_trail(
         self,
@@ -1116,12 +1594,37 @@ class AsyncYodClient(BaseClient):
         Raises:
             NotFoundError: If memory does not exist
         """
-        data = await self._request(
+        return await self._request(
             "GET",
             f"/memories/{memory_id}/audit",
             params={"limit": limit},
+            response_model=MemoryAuditTrailResponse,
+        )
+
+    async def get_memory_audit_trails_bulk(
+        self,
+        memory_ids: Iterable[str],
+        *,
+        limit: int = 50,
+    ) -> list[MemoryAuditTrailResponse]:
+        """
+        Get audit trails for several memories concurrently.
+
+        At most config.max_concurrency requests are in flight at once.
+
+        Args:
+            memory_ids: The memory IDs to get audit trails for
+            limit: Maximum number of events to return per memory (default: 50)
+
+        Returns:
+            MemoryAuditTrailResponses in the same order as memory_ids
+
+        Raises:
+            NotFoundError: If any memory does not exist
+        """
+        return await self._gather_bounded(
+            self.get_memory_audit_trail(memory_id, limit=limit) for memory_id in memory_ids
         )
-        return MemoryAuditTrailResponse.model_validate(data)
 
     # --- Proposed Memory Operations ---
 
@@ -1137,8 +1640,10 @@ class AsyncYodClient(BaseClient):
         Returns:
             ProposedMemoriesResponse with list of proposed memories
         """
-        data = await self._request("GET", "/memories/proposed", params={"limit": limit})
-        return ProposedMemoriesResponse.model_validate(data)
+        return await self._request(
+            "GET", "/memories/proposed", params={"limit": limit},
+            response_model=ProposedMemoriesResponse,
+        )
 
     async def approve_memory(self, memory_id: str) -> ApproveMemoryResponse:
         """
@@ -1156,8 +1661,32 @@ class AsyncYodClient(BaseClient):
             NotFoundError: If memory does not exist
             ValidationError: If memory is not in proposed status
         """
-        data = await self._request("POST", f"/memories/{memory_id}/approve")
-        return ApproveMemoryResponse.model_validate(data)
+        return await self._request(
+            "POST", f"/memories/{memory_id}/approve", response_model=ApproveMemoryResponse
+        )
+
+    async def approve_memories_bulk(self, memory_ids: Iterable[str]) -> list[ApproveMemoryResponse]:
+        """
+        Approve several proposed memories concurrently.
+
+        Each memory is a separate approve_memory() request; at most
+        config.max_concurrency are in flight at once. If one fails, the requests
+        not yet finished are cancelled before the error is raised, so some
+        memories may already have been approved.
+
+        Args:
+            memory_ids: The proposed memory IDs to approve
+
+        Returns:
+            ApproveMemoryResponses in the same order as memory_ids
+
+        Raises:
+            NotFoundError: If any memory does not exist
+            ValidationError: If any memory is not in proposed status
+        """
+        return await self._gather_bounded(
+            self.approve_memory(memory_id) for memory_id in memory_ids
+        )
 
     async def reject_memory(self, memory_id: str) -> RejectMemoryResponse:
         """
@@ -1175,8 +1704,32 @@ class AsyncYodClient(BaseClient):
             NotFoundError: If memory does not exist
             ValidationError: If memory is not in proposed status
         """
-        data = await self._request("POST", f"/memories/{memory_id}/reject")
-        return RejectMemoryResponse.model_validate(data)
+        return await self._request(
+            "POST", f"/memories/{memory_id}/reject", response_model=RejectMemoryResponse
+        )
+
+    async def reject_memories_bulk(self, memory_ids: Iterable[str]) -> list[RejectMemoryResponse]:
+        """
+        Reject several proposed memories concurrently.
+
+        Each memory is a separate reject_memory() request; at most
+        config.max_concurrency are in flight at once. If one fails, the requests
+        not yet finished are cancelled before the error is raised, so some
+        memories may already have been rejected.
+
+        Args:
+            memory_ids: The proposed memory IDs to reject
+
+        Returns:
+            RejectMemoryResponses in the same order as memory_ids
+
+        Raises:
+            NotFoundError: If any memory does not exist
+            ValidationError: If any memory is not in proposed status
+        """
+        return await self._gather_bounded(
+            self.reject_memory(memory_id) for memory_id in memory_ids
+        )
 
     # --- Memory Tool Operations ---
 
@@ -1202,17 +1755,16 @@ class AsyncYodClient(BaseClient):
         Returns:
             FeedbackResponse with feedback ID and confirmation
         """
-        payload: dict[str, Any] = {
-            "feedback_type": feedback_type,
-            "memory_ids": memory_ids,
-        }
-        if conversation_id is not None:
-            payload["conversation_id"] = conversation_id
-        if session_id is not None:
-            payload["session_id"] = session_id
+        payload = _compact(
+            feedback_type=feedback_type,
+            memory_ids=memory_ids,
+            conversation_id=conversation_id,
+            session_id=session_id,
+        )
 
-        data = await self._request("POST", "/chat/feedback", json=payload)
-        return FeedbackResponse.model_validate(data)
+        return await self._request(
+            "POST", "/chat/feedback", json=payload, response_model=FeedbackResponse
+        )
 
     async def execute_memory_tool(
         self,
@@ -1220,7 +1772,7 @@ class AsyncYodClient(BaseClient):
         content: str,
         *,
         key: str | None = None,
-        memory_type: MemoryType = "semantic",
+        memory_type: MemoryType | str = MemoryType.SEMANTIC,
         confidence: float = 0.8,
         entity_names: list[str] | None = None,
         reason: str | None = None,
@@ -1244,23 +1796,20 @@ class AsyncYodClient(BaseClient):
         Returns:
             MemoryToolResponse with success status and details
         """
-        payload: dict[str, Any] = {
-            "action": action,
-            "content": content,
-            "memory_type": memory_type,
-            "confidence": confidence,
-        }
-        if key is not None:
-            payload["key"] = key
-        if entity_names is not None:
-            payload["entity_names"] = entity_names
-        if reason is not None:
-            payload["reason"] = reason
-        if session_id is not None:
-            payload["session_id"] = session_id
-
-        data = await self._request("POST", "/chat/memory-tool", json=payload)
-        return MemoryToolResponse.model_validate(data)
+        payload = _compact(
+            action=action,
+            content=content,
+            memory_type=memory_type,
+            confidence=confidence,
+            key=key,
+            entity_names=entity_names,
+            reason=reason,
+            session_id=session_id,
+        )
+
+        return await self._request(
+            "POST", "/chat/memory-tool", json=payload, response_model=MemoryToolResponse
+        )
 
     async def get_memory_tools_schema(self) -> MemoryToolsSchemaResponse:
         """
@@ -1271,5 +1820,9 @@ class AsyncYodClient(BaseClient):
         Returns:
             MemoryToolsSchemaResponse with tool definitions and enabled status
         """
-        data = await self._request("GET", "/chat/memory-tools/schema")
-        return MemoryToolsSchemaResponse.model_validate(data)
+        return await self._request(
+            "GET",
+            "/chat/memory-tools/schema",
+            response_model=MemoryToolsSchemaResponse,
+            cache_ttl=_SCHEMA_CACHE_TTL,
+        )
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
-from typing import Any
+import random
+import threading
+import time
+from collections.abc import Hashable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar, overload
 
 import httpx
-
-from yod._base_client import BaseClient
-from yod._retry import execute_with_retry_sync
+from pydantic import BaseModel
+
+from yod._base_client import (
+    _ENTITY_CACHE_TTL,
+    _HEALTH_CACHE_TTL,
+    _JSON_HEADERS,
+    _SCHEMA_CACHE_TTL,
+    BaseClient,
+    _compact,
+    _json_dumps,
+    _ModelT,
+)
+from yod._retry import RetryConfig, execute_with_retry_sync
 from yod.exceptions import YodConnectionError, YodTimeoutError
 from yod.models import (
     ApproveMemoryResponse,
@@ -50,6 +65,10 @@ from yod.models import (
     SuspiciousActivityResponse,
     UsageResponse,
 )
+from yod.models.responses import _CONVERSATION_LIST, _MESSAGE_INPUT_LIST, _MESSAGE_LIST
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
 
 
 class YodClient(BaseClient):
@@ -75,6 +94,14 @@ class YodClient(BaseClient):
         timeout: float = 30.0,
         connect_timeout: float = 5.0,
         max_retries: int = 3,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        max_concurrency: int | None = None,
+        retry_config: RetryConfig | None = None,
+        warmup: bool = False,
+        http2: bool = False,
+        cache_responses: bool = False,
         **kwargs: Any,
     ) -> None:
         """
@@ -88,6 +115,18 @@ class YodClient(BaseClient):
             timeout: Request timeout in seconds
             connect_timeout: Connection timeout in seconds
             max_retries: Maximum retry attempts for failed requests
+            max_connections: Maximum concurrent connections in the pool
+            max_keepalive_connections: Maximum idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept open
+            max_concurrency: Maximum concurrent requests issued by the *_bulk
+                helpers (default: max_keepalive_connections)
+            retry_config: Full retry policy (delays, jitter, retryable statuses);
+                overrides max_retries when given
+            warmup: Connect to the API when entering the context manager so the
+                first real request skips DNS/TCP/TLS setup (best-effort)
+            http2: Use HTTP/2 when the server supports it (requires `yod[http2]`)
+            cache_responses: Briefly cache results of read-only GETs such as health()
+                and get_memory_tools_schema(); see invalidate_cache()
         """
         super().__init__(
             api_key=api_key,
@@ -97,32 +136,130 @@ class YodClient(BaseClient):
             timeout=timeout,
             connect_timeout=connect_timeout,
             max_retries=max_retries,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            max_concurrency=max_concurrency,
+            retry_config=retry_config,
+            warmup=warmup,
+            http2=http2,
+            cache_responses=cache_responses,
             **kwargs,
         )
         self._client: httpx.Client | None = None
+        # Guards creation/teardown so threads sharing a client can't each build a pool
+        self._client_lock = threading.Lock()
+        # The response cache is shared by the threads of the *_bulk helpers
+        self._cache_lock = threading.Lock()
 
     def _get_client(self) -> httpx.Client:
         """Get or create the HTTP client."""
-        if self._client is None:
-            self._client = httpx.Client(
-                timeout=httpx.Timeout(self.config.timeout, connect=self.config.connect_timeout),
-                headers=self._build_headers(),
-            )
-        return self._client
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                client = self._client
+                if client is None:
+                    client = self._client = httpx.Client(
+                        timeout=httpx.Timeout(
+                            self.config.timeout, connect=self.config.connect_timeout
+                        ),
+                        headers=self._headers,
+                        base_url=self.config.base_url,
+                        http2=self.config.http2,
+                        limits=httpx.Limits(
+                            max_connections=self.config.max_connections,
+                            max_keepalive_connections=self.config.max_keepalive_connections,
+                            keepalive_expiry=self.config.keepalive_expiry,
+                        ),
+                    )
+        return client
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached responses (only used with cache_responses=True)."""
+        with self._cache_lock:
+            super().invalidate_cache()
+
+    def _cache_get(self, key: Hashable) -> Any:
+        """Thread-safe BaseClient._cache_get."""
+        with self._cache_lock:
+            return super()._cache_get(key)
+
+    def _cache_put(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Thread-safe BaseClient._cache_put."""
+        with self._cache_lock:
+            super()._cache_put(key, value, ttl)
+
+    def _map_bounded(self, func: Callable[[_T], _R], items: Iterable[_T]) -> list[_R]:
+        """
+        Call `func` on each item from up to config.max_concurrency threads, in order.
+
+        On the first failure, calls that have not started yet are cancelled; the
+        error is raised once the ones already running have finished.
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        # Threads share the pooled httpx.Client, which is safe for concurrent use
+        workers = min(self.config.max_concurrency, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Executor.map cancels the calls still queued when a result raises
+            return list(executor.map(func, items))
 
     def __enter__(self) -> YodClient:
         """Context manager entry."""
+        if self.config.warmup:
+            self.warmup()
         return self
 
+    def warmup(self) -> None:
+        """
+        Open a keep-alive connection to the API ahead of the first request.
+
+        Sends one unretried GET /health bounded by connect_timeout. Failures are
+        ignored: warm-up is best-effort and real requests report their own errors.
+        """
+        try:
+            self._get_client().get("/health", timeout=self.config.connect_timeout)
+        except httpx.HTTPError:
+            pass
+
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Context manager exit - closes HTTP session."""
         self.close()
 
     def close(self) -> None:
         """Close the HTTP session."""
-        if self._client is not None:
-            self._client.close()
-            self._client = None
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    @overload
+    def _request(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        files: dict[str, Any] | None = None,
+        raw_response: bool = False,
+        *,
+        response_model: type[_ModelT],
+        cache_ttl: float | None = None,
+    ) -> _ModelT: ...
+
+    @overload
+    def _request(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        files: dict[str, Any] | None = None,
+        raw_response: bool = False,
+        response_model: None = None,
+        cache_ttl: float | None = None,
+    ) -> Any: ...
 
     def _request(
         self,
@@ -132,45 +269,63 @@ class YodClient(BaseClient):
         params: dict[str, Any] | None = None,
         files: dict[str, Any] | None = None,
         raw_response: bool = False,
+        response_model: type[BaseModel] | None = None,
+        cache_ttl: float | None = None,
     ) -> Any:
-        """Make an HTTP request with retry logic."""
-        url = self._build_url(path)
+        """
+        Make an HTTP request with retry logic.
+
+        On success, returns the raw body bytes if `raw_response` is set, the
+        body validated straight from JSON bytes into `response_model` if given,
+        and otherwise the decoded JSON ({} for an empty body).
+
+        With cache_responses enabled, a `response_model` result is cached for
+        `cache_ttl` seconds; only pass it for read-only GETs.
+        """
+        cache_key = None
+        if cache_ttl is not None and response_model is not None and self.config.cache_responses:
+            cache_key = self._cache_key(path, params)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
         client = self._get_client()
 
-        # Filter out None params
-        if params:
-            params = {k: v for k, v in params.items() if v is not None}
+        # Build the request once (serializing the JSON body a single time); retries resend it
+        if files:
+            # httpx sets the multipart Content-Type (with boundary) itself
+            request = client.build_request(method, path, files=files, params=params)
+        elif json is not None:
+            request = client.build_request(
+                method, path, content=_json_dumps(json), headers=_JSON_HEADERS, params=params
+            )
+        else:
+            request = client.build_request(method, path, params=params)
 
         def make_request() -> httpx.Response:
-            if files:
-                # For file uploads, don't use JSON content type
-                headers = self._build_headers()
-                headers.pop("Content-Type", None)
-                return client.request(method, url, files=files, headers=headers, params=params)
-            return client.request(method, url, json=json, params=params)
+            return client.send(request)
 
         try:
             response = execute_with_retry_sync(make_request, self.retry_config)
         except httpx.ConnectError as e:
-            raise YodConnectionError(f"Failed to connect to {url}: {e}") from e
+            raise YodConnectionError(f"Failed to connect to {self._build_url(path)}: {e}") from e
         except httpx.TimeoutException as e:
-            raise YodTimeoutError(f"Request to {url} timed out: {e}") from e
+            raise YodTimeoutError(f"Request to {self._build_url(path)} timed out: {e}") from e
 
-        request_id = response.headers.get("X-Request-Id")
-        headers = dict(response.headers)
+        self._raise_for_status(response)
 
+        body = response.content
         if raw_response:
-            if response.status_code >= 400:
-                body = self._parse_response_body(response.content)
-                self._handle_error_response(response.status_code, body, request_id, headers)
-            return response.content
-
-        body = self._parse_response_body(response.content)
-
-        if response.status_code >= 400:
-            self._handle_error_response(response.status_code, body, request_id, headers)
-
-        return body
+            return body
+        if response_model is not None:
+            result = response_model.model_validate_json(body)
+            if cache_key is not None and cache_ttl is not None:
+                self._cache_put(cache_key, result, cache_ttl)
+            return result
+        if not body:
+            # 204 No Content (or an empty 200) from a mutation: nothing to decode
+            return {}
+        return self._parse_response_body(body, response.headers.get("Content-Type"))
 
     # --- Ingest Operations ---
 
@@ -201,18 +356,50 @@ class YodClient(BaseClient):
             ValidationError: If text is empty or too long
             RateLimitError: If rate limit exceeded
         """
-        payload = {"text": text}
-        if source_id is not None:
-            payload["source_id"] = source_id
-        if timestamp is not None:
-            payload["timestamp"] = timestamp
-        if session_id is not None:
-            payload["session_id"] = session_id
-        if agent_id is not None:
-            payload["agent_id"] = agent_id
+        payload = _compact(
+            text=text,
+            source_id=source_id,
+            timestamp=timestamp,
+            session_id=session_id,
+            agent_id=agent_id,
+        )
+
+        return self._request("POST", "/ingest/chat", json=payload, response_model=IngestResponse)
 
-        data = self._request("POST", "/ingest/chat", json=payload)
-        return IngestResponse.model_validate(data)
+    def ingest_chat_bulk(
+        self,
+        texts: Iterable[str],
+        *,
+        source_id: str | None = None,
+        session_id: str | None = None,
+        agent_id: str | None = None,
+    ) -> list[IngestResponse]:
+        """
+        Ingest several texts concurrently.
+
+        Each text is sent as its own ingest_chat() request (there is no batch
+        ingest endpoint) from a thread pool; at most config.max_concurrency are
+        in flight at once.
+
+        Args:
+            texts: The text contents to ingest (1-100,000 chars each)
+            source_id: Optional identifier for the source, applied to every text
+            session_id: Optional session ID for memory isolation across contexts
+            agent_id: Optional agent identifier within a session
+
+        Returns:
+            IngestResponses in the same order as texts
+
+        Raises:
+            ValidationError: If any text is empty or too long
+            RateLimitError: If rate limit exceeded
+        """
+        return self._map_bounded(
+            lambda text: self.ingest_chat(
+                text, source_id=source_id, session_id=session_id, agent_id=agent_id
+            ),
+            texts,
+        )
 
     # --- Chat Operations ---
 
@@ -241,16 +428,43 @@ class YodClient(BaseClient):
             ValidationError: If question is empty or too long
             RateLimitError: If rate limit exceeded
         """
-        payload: dict[str, Any] = {"question": question}
-        if language is not None:
-            payload["language"] = language
-        if as_of is not None:
-            payload["as_of"] = as_of
-        if session_id is not None:
-            payload["session_id"] = session_id
+        payload = _compact(question=question, language=language, as_of=as_of, session_id=session_id)
 
-        data = self._request("POST", "/chat", json=payload)
-        return ChatResponse.model_validate(data)
+        return self._request("POST", "/chat", json=payload, response_model=ChatResponse)
+
+    def chat_bulk(
+        self,
+        questions: Iterable[str],
+        *,
+        language: str | None = None,
+        as_of: str | None = None,
+        session_id: str | None = None,
+    ) -> list[ChatResponse]:
+        """
+        Ask several questions concurrently.
+
+        Each question is sent as its own chat() request from a thread pool; at most
+        config.max_concurrency are in flight at once.
+
+        Args:
+            questions: The questions to ask (1-10,000 chars each)
+            language: Optional language code for every response (e.g., "en", "fa")
+            as_of: Optional ISO8601 timestamp for temporal queries
+            session_id: Optional session ID for scoped retrieval, applied to every question
+
+        Returns:
+            ChatResponses in the same order as questions
+
+        Raises:
+            ValidationError: If any question is empty or too long
+            RateLimitError: If rate limit exceeded
+        """
+        return self._map_bounded(
+            lambda question: self.chat(
+                question, language=language, as_of=as_of, session_id=session_id
+            ),
+            questions,
+        )
 
     # --- Memory Operations ---
 
@@ -276,18 +490,15 @@ class YodClient(BaseClient):
         Returns:
             MemoryListResponse with list of MemoryItem
         """
-        params: dict[str, Any] = {"limit": limit}
-        if kind is not None:
-            params["kind"] = kind
-        if search is not None:
-            params["search"] = search
-        if include_inactive:
-            params["include_inactive"] = include_inactive
-        if as_of is not None:
-            params["as_of"] = as_of
+        params = _compact(
+            limit=limit,
+            kind=kind,
+            search=search,
+            include_inactive=include_inactive or None,
+            as_of=as_of,
+        )
 
-        data = self._request("GET", "/memories", params=params)
-        return MemoryListResponse.model_validate(data)
+        return self._request("GET", "/memories", params=params, response_model=MemoryListResponse)
 
     def get_memory(self, memory_id: str) -> MemoryItem:
         """
@@ -302,8 +513,24 @@ class YodClient(BaseClient):
         Raises:
             NotFoundError: If memory does not exist
         """
-        data = self._request("GET", f"/memories/{memory_id}")
-        return MemoryItem.model_validate(data)
+        return self._request("GET", f"/memories/{memory_id}", response_model=MemoryItem)
+
+    def get_memories_bulk(self, memory_ids: Iterable[str]) -> list[MemoryItem]:
+        """
+        Get several memories by ID concurrently.
+
+        At most config.max_concurrency requests are in flight at once.
+
+        Args:
+            memory_ids: The memory IDs to retrieve
+
+        Returns:
+            MemoryItems in the same order as memory_ids
+
+        Raises:
+            NotFoundError: If any memory does not exist
+        """
+        return self._map_bounded(self.get_memory, memory_ids)
 
     def update_memory(
         self,
@@ -329,13 +556,7 @@ class YodClient(BaseClient):
             NotFoundError: If memory does not exist
             ValidationError: If confidence out of range
         """
-        payload: dict[str, Any] = {}
-        if kind is not None:
-            payload["kind"] = kind
-        if summary is not None:
-            payload["summary"] = summary
-        if confidence is not None:
-            payload["confidence"] = confidence
+        payload = _compact(kind=kind, summary=summary, confidence=confidence)
 
         result: dict[str, Any] = self._request("PATCH", f"/memories/{memory_id}", json=payload)
         return result
@@ -371,8 +592,9 @@ class YodClient(BaseClient):
         Raises:
             NotFoundError: If memory not found or has no history
         """
-        data = self._request("GET", f"/memories/{memory_id}/history")
-        return MemoryListResponse.model_validate(data)
+        return self._request(
+            "GET", f"/memories/{memory_id}/history", response_model=MemoryListResponse
+        )
 
     # --- Session Operations ---
 
@@ -392,14 +614,9 @@ class YodClient(BaseClient):
         Returns:
             Session with session_id, user_id, agent_id, created_at, metadata
         """
-        payload: dict[str, Any] = {}
-        if agent_id is not None:
-            payload["agent_id"] = agent_id
-        if metadata is not None:
-            payload["metadata"] = metadata
+        payload = _compact(agent_id=agent_id, metadata=metadata)
 
-        data = self._request("POST", "/sessions", json=payload)
-        return Session.model_validate(data)
+        return self._request("POST", "/sessions", json=payload, response_model=Session)
 
     def list_sessions(
         self,
@@ -419,12 +636,37 @@ class YodClient(BaseClient):
         Returns:
             SessionListResponse with sessions list and total count
         """
-        params: dict[str, Any] = {"limit": limit, "offset": offset}
-        if agent_id is not None:
-            params["agent_id"] = agent_id
+        params = _compact(limit=limit, offset=offset, agent_id=agent_id)
+
+        return self._request("GET", "/sessions", params=params, response_model=SessionListResponse)
+
+    def iter_sessions(
+        self,
+        *,
+        agent_id: str | None = None,
+        page_size: int = 50,
+    ) -> Iterator[Session]:
+        """
+        Iterate over all sessions for the current user, one page at a time.
 
-        data = self._request("GET", "/sessions", params=params)
-        return SessionListResponse.model_validate(data)
+        Only one page is held in memory, and the first sessions are available
+        before later pages have been fetched.
+
+        Args:
+            agent_id: Optional filter by agent ID
+            page_size: Number of sessions requested per page (default: 50)
+
+        Yields:
+            Session objects
+        """
+        offset = 0
+        while True:
+            page = self.list_sessions(agent_id=agent_id, limit=page_size, offset=offset)
+            yield from page.sessions
+            # The server may cap the page below page_size, so only `total` marks the end
+            offset += len(page.sessions)
+            if not page.sessions or offset >= page.total:
+                return
 
     def get_session(self, session_id: str) -> Session:
         """
@@ -439,8 +681,24 @@ class YodClient(BaseClient):
         Raises:
             NotFoundError: If session does not exist
         """
-        data = self._request("GET", f"/sessions/{session_id}")
-        return Session.model_validate(data)
+        return self._request("GET", f"/sessions/{session_id}", response_model=Session)
+
+    def get_sessions_bulk(self, session_ids: Iterable[str]) -> list[Session]:
+        """
+        Get several sessions by ID concurrently.
+
+        At most config.max_concurrency requests are in flight at once.
+
+        Args:
+            session_ids: The session IDs to retrieve
+
+        Returns:
+            Sessions in the same order as session_ids
+
+        Raises:
+            NotFoundError: If any session does not exist
+        """
+        return self._map_bounded(self.get_session, session_ids)
 
     def update_session(
         self,
@@ -461,8 +719,9 @@ class YodClient(BaseClient):
         Raises:
             NotFoundError: If session does not exist
         """
-        data = self._request("PATCH", f"/sessions/{session_id}", json={"metadata": metadata})
-        return Session.model_validate(data)
+        return self._request(
+            "PATCH", f"/sessions/{session_id}", json={"metadata": metadata}, response_model=Session
+        )
 
     def delete_session(
         self,
@@ -492,13 +751,15 @@ class YodClient(BaseClient):
 
     def health(self) -> HealthResponse:
         """Check API health status."""
-        data = self._request("GET", "/health")
-        return HealthResponse.model_validate(data)
+        return self._request(
+            "GET", "/health", response_model=HealthResponse, cache_ttl=_HEALTH_CACHE_TTL
+        )
 
     def ready(self) -> ReadyResponse:
         """Check API readiness (includes backend checks)."""
-        data = self._request("GET", "/ready")
-        return ReadyResponse.model_validate(data)
+        return self._request(
+            "GET", "/ready", response_model=ReadyResponse, cache_ttl=_HEALTH_CACHE_TTL
+        )
 
     # --- API Key Operations ---
 
@@ -520,14 +781,9 @@ class YodClient(BaseClient):
         Returns:
             CreateKeyResponse with key_id and secret_key (shown only once!)
         """
-        payload: dict[str, Any] = {"name": name}
-        if scopes is not None:
-            payload["scopes"] = scopes
-        if expires_in_days is not None:
-            payload["expires_in_days"] = expires_in_days
+        payload = _compact(name=name, scopes=scopes, expires_in_days=expires_in_days)
 
-        data = self._request("POST", "/keys", json=payload)
-        return CreateKeyResponse.model_validate(data)
+        return self._request("POST", "/keys", json=payload, response_model=CreateKeyResponse)
 
     def list_api_keys(self) -> KeyListResponse:
         """
@@ -536,8 +792,7 @@ class YodClient(BaseClient):
         Returns:
             KeyListResponse with list of APIKeyItem (secrets not included)
         """
-        data = self._request("GET", "/keys")
-        return KeyListResponse.model_validate(data)
+        return self._request("GET", "/keys", response_model=KeyListResponse)
 
     def revoke_api_key(self, key_id: str) -> dict[str, Any]:
         """
@@ -571,14 +826,9 @@ class YodClient(BaseClient):
         Returns:
             UsageResponse with summary and per-endpoint breakdown
         """
-        params: dict[str, Any] = {}
-        if start_date is not None:
-            params["start_date"] = start_date
-        if end_date is not None:
-            params["end_date"] = end_date
+        params = _compact(start_date=start_date, end_date=end_date)
 
-        data = self._request("GET", "/keys/usage", params=params)
-        return UsageResponse.model_validate(data)
+        return self._request("GET", "/keys/usage", params=params, response_model=UsageResponse)
 
     def get_quota(self) -> QuotaResponse:
         """
@@ -587,8 +837,7 @@ class YodClient(BaseClient):
         Returns:
             QuotaResponse with plan info and quota limits
         """
-        data = self._request("GET", "/keys/quota")
-        return QuotaResponse.model_validate(data)
+        return self._request("GET", "/keys/quota", response_model=QuotaResponse)
 
     # --- Conversation Operations ---
 
@@ -608,14 +857,9 @@ class YodClient(BaseClient):
         Returns:
             Conversation with conversation_id, title, created_at, etc.
         """
-        payload: dict[str, Any] = {}
-        if title is not None:
-            payload["title"] = title
-        if conversation_id is not None:
-            payload["conversation_id"] = conversation_id
+        payload = _compact(title=title, conversation_id=conversation_id)
 
-        data = self._request("POST", "/conversations", json=payload)
-        return Conversation.model_validate(data)
+        return self._request("POST", "/conversations", json=payload, response_model=Conversation)
 
     def list_conversations(
         self,
@@ -634,10 +878,32 @@ class YodClient(BaseClient):
             List of Conversation objects
         """
         params: dict[str, Any] = {"limit": limit, "offset": offset}
-        data = self._request("GET", "/conversations", params=params)
-        if data is None:
+        content = self._request("GET", "/conversations", params=params, raw_response=True)
+        if not content:
             return []
-        return [Conversation.model_validate(c) for c in data]
+        return _CONVERSATION_LIST.validate_json(content)
+
+    def iter_conversations(self, *, page_size: int = 50) -> Iterator[Conversation]:
+        """
+        Iterate over all conversations for the current user, one page at a time.
+
+        Only one page is held in memory, and the first conversations are
+        available before later pages have been fetched.
+
+        Args:
+            page_size: Number of conversations requested per page (default: 50)
+
+        Yields:
+            Conversation objects
+        """
+        offset = 0
+        while True:
+            page = self.list_conversations(limit=page_size, offset=offset)
+            yield from page
+            # No total here, and the server may cap the page below page_size
+            if not page:
+                return
+            offset += len(page)
 
     def get_conversation(self, conversation_id: str) -> Conversation:
         """
@@ -652,8 +918,9 @@ class YodClient(BaseClient):
         Raises:
             NotFoundError: If conversation does not exist
         """
-        data = self._request("GET", f"/conversations/{conversation_id}")
-        return Conversation.model_validate(data)
+        return self._request(
+            "GET", f"/conversations/{conversation_id}", response_model=Conversation
+        )
 
     def update_conversation(
         self,
@@ -674,10 +941,10 @@ class YodClient(BaseClient):
         Raises:
             NotFoundError: If conversation does not exist
         """
-        data = self._request(
-            "PATCH", f"/conversations/{conversation_id}", json={"title": title}
+        return self._request(
+            "PATCH", f"/conversations/{conversation_id}", json={"title": title},
+            response_model=Conversation,
         )
-        return Conversation.model_validate(data)
 
     def delete_conversation(self, conversation_id: str) -> dict[str, Any]:
         """
@@ -725,16 +992,14 @@ class YodClient(BaseClient):
         Returns:
             List of Message objects
         """
-        params: dict[str, Any] = {"limit": limit}
-        if before_id is not None:
-            params["before_id"] = before_id
+        params = _compact(limit=limit, before_id=before_id)
 
-        data = self._request(
-            "GET", f"/conversations/{conversation_id}/messages", params=params
+        content = self._request(
+            "GET", f"/conversations/{conversation_id}/messages", params=params, raw_response=True
         )
-        if data is None:
+        if not content:
             return []
-        return [Message.model_validate(m) for m in data]
+        return _MESSAGE_LIST.validate_json(content)
 
     def add_message(
         self,
@@ -756,14 +1021,12 @@ class YodClient(BaseClient):
         Returns:
             Message with message_id, created_at, etc.
         """
-        payload: dict[str, Any] = {"role": role, "content": content}
-        if citations is not None:
-            payload["citations"] = citations
+        payload = _compact(role=role, content=content, citations=citations)
 
-        data = self._request(
-            "POST", f"/conversations/{conversation_id}/messages", json=payload
+        return self._request(
+            "POST", f"/conversations/{conversation_id}/messages", json=payload,
+            response_model=Message,
         )
-        return Message.model_validate(data)
 
     def sync_messages(
         self,
@@ -782,7 +1045,7 @@ class YodClient(BaseClient):
         Returns:
             Dict with ok: True and saved count
         """
-        payload = {"messages": [m.model_dump() for m in messages]}
+        payload = {"messages": _MESSAGE_INPUT_LIST.dump_python(messages, mode="json")}
         result: dict[str, Any] = self._request(
             "POST", f"/conversations/{conversation_id}/sync", json=payload
         )
@@ -807,8 +1070,7 @@ class YodClient(BaseClient):
             STTResponse with transcribed text and detected language
         """
         files = {"audio": (filename, audio_file)}
-        data = self._request("POST", "/speech/stt", files=files)
-        return STTResponse.model_validate(data)
+        return self._request("POST", "/speech/stt", files=files, response_model=STTResponse)
 
     def text_to_speech(
         self,
@@ -826,12 +1088,51 @@ class YodClient(BaseClient):
         Returns:
             MP3 audio bytes
         """
-        payload: dict[str, Any] = {"text": text}
-        if voice_id is not None:
-            payload["voice_id"] = voice_id
+        payload = _compact(text=text, voice_id=voice_id)
 
         return self._request("POST", "/speech/tts", json=payload, raw_response=True)
 
+    def text_to_speech_stream(
+        self,
+        text: str,
+        *,
+        voice_id: str | None = None,
+        chunk_size: int = 16384,
+    ) -> Iterator[bytes]:
+        """
+        Stream text-to-speech audio as it is received.
+
+        Unlike text_to_speech(), the MP3 is not buffered in memory: chunks are
+        yielded as they arrive. The request is not retried.
+
+        Args:
+            text: Text to convert to speech
+            voice_id: Optional ElevenLabs voice ID (uses server default if not specified)
+            chunk_size: Size in bytes of the yielded chunks
+
+        Yields:
+            Chunks of MP3 audio bytes
+        """
+        payload = _compact(text=text, voice_id=voice_id)
+
+        client = self._get_client()
+        try:
+            with client.stream(
+                "POST", "/speech/tts", content=_json_dumps(payload), headers=_JSON_HEADERS
+            ) as response:
+                if response.status_code >= 400:
+                    response.read()
+                    self._raise_for_status(response)
+                yield from response.iter_bytes(chunk_size)
+        except httpx.ConnectError as e:
+            raise YodConnectionError(
+                f"Failed to connect to {self._build_url('/speech/tts')}: {e}"
+            ) from e
+        except httpx.TimeoutException as e:
+            raise YodTimeoutError(
+                f"Request to {self._build_url('/speech/tts')} timed out: {e}"
+            ) from e
+
     # --- Consolidation Operations ---
 
     def get_consolidation_status(self) -> ConsolidationStatusResponse:
@@ -843,8 +1144,9 @@ class YodClient(BaseClient):
         Returns:
             ConsolidationStatusResponse with enabled, schedule, stats, and last_consolidation
         """
-        data = self._request("GET", "/consolidation/status")
-        return ConsolidationStatusResponse.model_validate(data)
+        return self._request(
+            "GET", "/consolidation/status", response_model=ConsolidationStatusResponse
+        )
 
     def run_consolidation(self) -> ConsolidationResultResponse:
         """
@@ -866,8 +1168,9 @@ class YodClient(BaseClient):
             For long-running consolidation, consider using trigger_consolidation()
             for async execution.
         """
-        data = self._request("POST", "/consolidation/run")
-        return ConsolidationResultResponse.model_validate(data)
+        return self._request(
+            "POST", "/consolidation/run", response_model=ConsolidationResultResponse
+        )
 
     def trigger_consolidation(self) -> ConsolidationTriggerResponse:
         """
@@ -882,8 +1185,9 @@ class YodClient(BaseClient):
             - message: Human-readable status message
             - job_id: ID for tracking the background job (use with get_consolidation_result)
         """
-        data = self._request("POST", "/consolidation/trigger")
-        return ConsolidationTriggerResponse.model_validate(data)
+        return self._request(
+            "POST", "/consolidation/trigger", response_model=ConsolidationTriggerResponse
+        )
 
     def get_consolidation_result(self, job_id: str) -> ConsolidationResultResponse:
         """
@@ -899,8 +1203,54 @@ class YodClient(BaseClient):
         Raises:
             NotFoundError: If job_id does not exist
         """
-        data = self._request("GET", f"/consolidation/result/{job_id}")
-        return ConsolidationResultResponse.model_validate(data)
+        return self._request(
+            "GET", f"/consolidation/result/{job_id}", response_model=ConsolidationResultResponse
+        )
+
+    def wait_for_consolidation(
+        self,
+        job_id: str,
+        *,
+        poll_interval: float = 0.5,
+        max_interval: float = 10.0,
+        timeout: float | None = None,
+    ) -> ConsolidationResultResponse:
+        """
+        Wait for an async consolidation job to complete.
+
+        Polls get_consolidation_result() with exponential backoff (doubling from
+        poll_interval up to max_interval, plus up to 50% jitter).
+
+        Args:
+            job_id: The job ID returned from trigger_consolidation()
+            poll_interval: Delay in seconds before the second poll
+            max_interval: Upper bound on the delay between polls
+            timeout: Give up after this many seconds (default: wait indefinitely)
+
+        Returns:
+            ConsolidationResultResponse with completed_at set
+
+        Raises:
+            NotFoundError: If job_id does not exist
+            YodTimeoutError: If the job has not completed within timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = poll_interval
+        while True:
+            result = self.get_consolidation_result(job_id)
+            if result.completed_at is not None:
+                return result
+
+            delay = interval * (1.0 + random.random() * 0.5)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise YodTimeoutError(
+                        f"Consolidation job {job_id} did not complete within {timeout}s"
+                    )
+                delay = min(delay, remaining)
+            time.sleep(delay)
+            interval = min(interval * 2, max_interval)
 
     # --- Evolution/Drift Operations ---
 
@@ -922,12 +1272,11 @@ class YodClient(BaseClient):
         Returns:
             EvolutionResponse with timeline, drift scores, pattern, and interpretation
         """
-        params: dict[str, Any] = {}
-        if time_windows is not None:
-            params["time_windows"] = time_windows
+        params = _compact(time_windows=time_windows)
 
-        data = self._request("GET", f"/memories/evolution/{key}", params=params)
-        return EvolutionResponse.model_validate(data)
+        return self._request(
+            "GET", f"/memories/evolution/{key}", params=params, response_model=EvolutionResponse
+        )
 
     def list_evolution_keys(self, *, limit: int = 20) -> EvolutionKeysResponse:
         """
@@ -941,8 +1290,10 @@ class YodClient(BaseClient):
         Returns:
             EvolutionKeysResponse with list of keys and count
         """
-        data = self._request("GET", "/memories/evolution", params={"limit": limit})
-        return EvolutionKeysResponse.model_validate(data)
+        return self._request(
+            "GET", "/memories/evolution", params={"limit": limit},
+            response_model=EvolutionKeysResponse,
+        )
 
     # --- Entity Operations ---
 
@@ -958,8 +1309,9 @@ class YodClient(BaseClient):
         Returns:
             EntitiesResponse with entities list and co-occurrence links
         """
-        data = self._request("GET", "/entities", params={"limit": limit})
-        return EntitiesResponse.model_validate(data)
+        return self._request(
+            "GET", "/entities", params={"limit": limit}, response_model=EntitiesResponse
+        )
 
     def get_entity_details(self, entity_id: str) -> EntityDetailsResponse:
         """
@@ -974,8 +1326,29 @@ class YodClient(BaseClient):
         Raises:
             NotFoundError: If entity does not exist
         """
-        data = self._request("GET", f"/entities/{entity_id}/details")
-        return EntityDetailsResponse.model_validate(data)
+        return self._request(
+            "GET",
+            f"/entities/{entity_id}/details",
+            response_model=EntityDetailsResponse,
+            cache_ttl=_ENTITY_CACHE_TTL,
+        )
+
+    def get_entity_details_bulk(self, entity_ids: Iterable[str]) -> list[EntityDetailsResponse]:
+        """
+        Get details for several entities concurrently.
+
+        At most config.max_concurrency requests are in flight at once.
+
+        Args:
+            entity_ids: The entity IDs to retrieve
+
+        Returns:
+            EntityDetailsResponses in the same order as entity_ids
+
+        Raises:
+            NotFoundError: If any entity does not exist
+        """
+        return self._map_bounded(self.get_entity_details, entity_ids)
 
     # --- Graph Operations ---
 
@@ -998,8 +1371,9 @@ class YodClient(BaseClient):
             ClaimsGraphResponse with nodes and links
         """
         params = {"limit": limit, "include_inactive": include_inactive}
-        data = self._request("GET", "/memories/graph", params=params)
-        return ClaimsGraphResponse.model_validate(data)
+        return self._request(
+            "GET", "/memories/graph", params=params, response_model=ClaimsGraphResponse
+        )
 
     # --- Contradiction Operations ---
 
@@ -1012,8 +1386,9 @@ class YodClient(BaseClient):
         Returns:
             ContradictionsResponse with total conflicts, samples, and session count
         """
-        data = self._request("GET", "/memories/contradictions")
-        return ContradictionsResponse.model_validate(data)
+        return self._request(
+            "GET", "/memories/contradictions", response_model=ContradictionsResponse
+        )
 
     def get_session_contradictions(
         self,
@@ -1031,12 +1406,12 @@ class YodClient(BaseClient):
         Returns:
             SessionContradictionsResponse with contradiction pairs
         """
-        data = self._request(
+        return self._request(
             "GET",
             f"/memories/contradictions/session/{session_id}",
             params={"limit": limit},
+            response_model=SessionContradictionsResponse,
         )
-        return SessionContradictionsResponse.model_validate(data)
 
     # --- Audit Operations ---
 
@@ -1050,8 +1425,10 @@ class YodClient(BaseClient):
         Returns:
             AuditSummaryResponse with total events and breakdown by action
         """
-        data = self._request("GET", "/memories/audit/summary", params={"days": days})
-        return AuditSummaryResponse.model_validate(data)
+        return self._request(
+            "GET", "/memories/audit/summary", params={"days": days},
+            response_model=AuditSummaryResponse,
+        )
 
     def get_recent_audit(
         self,
@@ -1069,12 +1446,11 @@ class YodClient(BaseClient):
         Returns:
             RecentAuditResponse with list of audit events
         """
-        params: dict[str, Any] = {"limit": limit}
-        if action is not None:
-            params["action"] = action
+        params = _compact(limit=limit, action=action)
 
-        data = self._request("GET", "/memories/audit/recent", params=params)
-        return RecentAuditResponse.model_validate(data)
+        return self._request(
+            "GET", "/memories/audit/recent", params=params, response_model=RecentAuditResponse
+        )
 
     def get_suspicious_activity(self, *, hours: int = 24) -> SuspiciousActivityResponse:
         """
@@ -1088,8 +1464,10 @@ class YodClient(BaseClient):
         Returns:
             SuspiciousActivityResponse with detected patterns
         """
-        data = self._request("GET", "/memories/audit/suspicious", params={"hours": hours})
-        return SuspiciousActivityResponse.model_validate(data)
+        return self._request(
+            "GET", "/memories/audit/suspicious", params={"hours": hours},
+            response_model=SuspiciousActivityResponse,
+        )
 
     def get_memory_audit_trail(
         self,
@@ -1110,12 +1488,37 @@ class YodClient(BaseClient):
         Raises:
             NotFoundError: If memory does not exist
         """
-        data = self._request(
+        return self._request(
             "GET",
             f"/memories/{memory_id}/audit",
             params={"limit": limit},
+            response_model=MemoryAuditTrailResponse,
+        )
+
+    def get_memory_audit_trails_bulk(
+        self,
+        memory_ids: Iterable[str],
+        *,
+        limit: int = 50,
+    ) -> list[MemoryAuditTrailResponse]:
+        """
+        Get audit trails for several memories concurrently.
+
+        At most config.max_concurrency requests are in flight at once.
+
+        Args:
+            memory_ids: The memory IDs to get audit trails for
+            limit: Maximum number of events to return per memory (default: 50)
+
+        Returns:
+            MemoryAuditTrailResponses in the same order as memory_ids
+
+        Raises:
+            NotFoundError: If any memory does not exist
+        """
+        return self._map_bounded(
+            lambda memory_id: self.get_memory_audit_trail(memory_id, limit=limit), memory_ids
         )
-        return MemoryAuditTrailResponse.model_validate(data)
 
     # --- Proposed Memory Operations ---
 
@@ -1131,8 +1534,10 @@ class YodClient(BaseClient):
         Returns:
             ProposedMemoriesResponse with list of proposed memories
         """
-        data = self._request("GET", "/memories/proposed", params={"limit": limit})
-        return ProposedMemoriesResponse.model_validate(data)
+        return self._request(
+            "GET", "/memories/proposed", params={"limit": limit},
+            response_model=ProposedMemoriesResponse,
+        )
 
     def approve_memory(self, memory_id: str) -> ApproveMemoryResponse:
         """
@@ -1150,8 +1555,29 @@ class YodClient(BaseClient):
             NotFoundError: If memory does not exist
             ValidationError: If memory is not in proposed status
         """
-        data = self._request("POST", f"/memories/{memory_id}/approve")
-        return ApproveMemoryResponse.model_validate(data)
+        return self._request(
+            "POST", f"/memories/{memory_id}/approve", response_model=ApproveMemoryResponse
+        )
+
+    def approve_memories_bulk(self, memory_ids: Iterable[str]) -> list[ApproveMemoryResponse]:
+        """
+        Approve several proposed memories concurrently.
+
+        Each memory is a separate approve_memory() request; at most
+        config.max_concurrency are in flight at once. If one fails, requests not
+        yet started are skipped, so some memories may already have been approved.
+
+        Args:
+            memory_ids: The proposed memory IDs to approve
+
+        Returns:
+            ApproveMemoryResponses in the same order as memory_ids
+
+        Raises:
+            NotFoundError: If any memory does not exist
+            ValidationError: If any memory is not in proposed status
+        """
+        return self._map_bounded(self.approve_memory, memory_ids)
 
     def reject_memory(self, memory_id: str) -> RejectMemoryResponse:
         """
@@ -1169,8 +1595,29 @@ class YodClient(BaseClient):
             NotFoundError: If memory does not exist
             ValidationError: If memory is not in proposed status
         """
-        data = self._request("POST", f"/memories/{memory_id}/reject")
-        return RejectMemoryResponse.model_validate(data)
+        return self._request(
+            "POST", f"/memories/{memory_id}/reject", response_model=RejectMemoryResponse
+        )
+
+    def reject_memories_bulk(self, memory_ids: Iterable[str]) -> list[RejectMemoryResponse]:
+        """
+        Reject several proposed memories concurrently.
+
+        Each memory is a separate reject_memory() request; at most
+        config.max_concurrency are in flight at once. If one fails, requests not
+        yet started are skipped, so some memories may already have been rejected.
+
+        Args:
+            memory_ids: The proposed memory IDs to reject
+
+        Returns:
+            RejectMemoryResponses in the same order as memory_ids
+
+        Raises:
+            NotFoundError: If any memory does not exist
+            ValidationError: If any memory is not in proposed status
+        """
+        return self._map_bounded(self.reject_memory, memory_ids)
 
     # --- Memory Tool Operations ---
 
@@ -1196,17 +1643,16 @@ class YodClient(BaseClient):
         Returns:
             FeedbackResponse with feedback ID and confirmation
         """
-        payload: dict[str, Any] = {
-            "feedback_type": feedback_type,
-            "memory_ids": memory_ids,
-        }
-        if conversation_id is not None:
-            payload["conversation_id"] = conversation_id
-        if session_id is not None:
-            payload["session_id"] = session_id
+        payload = _compact(
+            feedback_type=feedback_type,
+            memory_ids=memory_ids,
+            conversation_id=conversation_id,
+            session_id=session_id,
+        )
 
-        data = self._request("POST", "/chat/feedback", json=payload)
-        return FeedbackResponse.model_validate(data)
+        return self._request(
+            "POST", "/chat/feedback", json=payload, response_model=FeedbackResponse
+        )
 
     def execute_memory_tool(
         self,
@@ -1214,7 +1660,7 @@ class YodClient(BaseClient):
         content: str,
         *,
         key: str | None = None,
-        memory_type: MemoryType = "semantic",
+        memory_type: MemoryType | str = MemoryType.SEMANTIC,
         confidence: float = 0.8,
         entity_names: list[str] | None = None,
         reason: str | None = None,
@@ -1238,23 +1684,20 @@ class YodClient(BaseClient):
         Returns:
             MemoryToolResponse with success status and details
         """
-        payload: dict[str, Any] = {
-            "action": action,
-            "content": content,
-            "memory_type": memory_type,
-            "confidence": confidence,
-        }
-        if key is not None:
-            payload["key"] = key
-        if entity_names is not None:
-            payload["entity_names"] = entity_names
-        if reason is not None:
-            payload["reason"] = reason
-        if session_id is not None:
-            payload["session_id"] = session_id
-
-        data = self._request("POST", "/chat/memory-tool", json=payload)
-        return MemoryToolResponse.model_validate(data)
+        payload = _compact(
+            action=action,
+            content=content,
+            memory_type=memory_type,
+            confidence=confidence,
+            key=key,
+            entity_names=entity_names,
+            reason=reason,
+            session_id=session_id,
+        )
+
+        return self._request(
+            "POST", "/chat/memory-tool", json=payload, response_model=MemoryToolResponse
+        )
 
     def get_memory_tools_schema(self) -> MemoryToolsSchemaResponse:
         """
@@ -1265,5 +1708,9 @@ class YodClient(BaseClient):
         Returns:
             MemoryToolsSchemaResponse with tool definitions and enabled status
         """
-        data = self._request("GET", "/chat/memory-tools/schema")
-        return MemoryToolsSchemaResponse.model_validate(data)
+        return self._request(
+            "GET",
+            "/chat/memory-tools/schema",
+            response_model=MemoryToolsSchemaResponse,
+            cache_ttl=_SCHEMA_CACHE_TTL,
+        )
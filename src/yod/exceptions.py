@@ -12,19 +12,29 @@ class YodError(Exception):
 
 
 class YodAPIError(YodError):
-    """API returned an error response."""
+    """
+    API returned an error response.
+
+    Subclasses set `default_status_code` and `default_message`, which apply
+    when the constructor is not given a status code or message. Everything
+    after the message is keyword-only.
+    """
+
+    default_status_code: int = 500
+    default_message: str = "API error"
 
     def __init__(
         self,
-        message: str,
-        status_code: int,
+        message: str | None = None,
+        *,
+        status_code: int | None = None,
         response_body: dict[str, Any] | None = None,
         request_id: str | None = None,
     ) -> None:
-        self.status_code = status_code
+        self.status_code = status_code if status_code is not None else self.default_status_code
         self.response_body = response_body
         self.request_id = request_id
-        super().__init__(message)
+        super().__init__(message if message is not None else self.default_message)
 
     def __str__(self) -> str:
         msg = f"{self.status_code}: {super().__str__()}"
@@ -36,73 +46,46 @@ class YodAPIError(YodError):
 class AuthenticationError(YodAPIError):
     """401 Unauthorized - Invalid or missing credentials."""
 
-    def __init__(
-        self,
-        message: str = "Authentication failed",
-        response_body: dict[str, Any] | None = None,
-        request_id: str | None = None,
-    ) -> None:
-        super().__init__(
-            message, status_code=401, response_body=response_body, request_id=request_id
-        )
+    default_status_code = 401
+    default_message = "Authentication failed"
 
 
 class AuthorizationError(YodAPIError):
     """403 Forbidden - Insufficient permissions."""
 
-    def __init__(
-        self,
-        message: str = "Permission denied",
-        response_body: dict[str, Any] | None = None,
-        request_id: str | None = None,
-    ) -> None:
-        super().__init__(
-            message, status_code=403, response_body=response_body, request_id=request_id
-        )
+    default_status_code = 403
+    default_message = "Permission denied"
 
 
 class NotFoundError(YodAPIError):
     """404 Not Found - Resource does not exist."""
 
-    def __init__(
-        self,
-        message: str = "Resource not found",
-        response_body: dict[str, Any] | None = None,
-        request_id: str | None = None,
-    ) -> None:
-        super().__init__(
-            message, status_code=404, response_body=response_body, request_id=request_id
-        )
+    default_status_code = 404
+    default_message = "Resource not found"
 
 
 class ValidationError(YodAPIError):
     """422 Unprocessable Entity - Request validation failed."""
 
-    def __init__(
-        self,
-        message: str = "Validation error",
-        response_body: dict[str, Any] | None = None,
-        request_id: str | None = None,
-    ) -> None:
-        super().__init__(
-            message, status_code=422, response_body=response_body, request_id=request_id
-        )
+    default_status_code = 422
+    default_message = "Validation error"
 
 
 class RateLimitError(YodAPIError):
     """429 Too Many Requests - Rate limit exceeded."""
 
+    default_status_code = 429
+    default_message = "Rate limit exceeded"
+
     def __init__(
         self,
-        message: str = "Rate limit exceeded",
+        message: str | None = None,
         retry_after: float | None = None,
         response_body: dict[str, Any] | None = None,
         request_id: str | None = None,
     ) -> None:
         self.retry_after = retry_after
-        super().__init__(
-            message, status_code=429, response_body=response_body, request_id=request_id
-        )
+        super().__init__(message, response_body=response_body, request_id=request_id)
 
     def __str__(self) -> str:
         msg = super().__str__()
@@ -114,19 +97,8 @@ class RateLimitError(YodAPIError):
 class ServerError(YodAPIError):
     """5xx Server Error - API is experiencing issues."""
 
-    def __init__(
-        self,
-        message: str = "Server error",
-        status_code: int = 500,
-        response_body: dict[str, Any] | None = None,
-        request_id: str | None = None,
-    ) -> None:
-        super().__init__(
-            message,
-            status_code=status_code,
-            response_body=response_body,
-            request_id=request_id,
-        )
+    default_status_code = 500
+    default_message = "Server error"
 
 
 class YodConnectionError(YodError):
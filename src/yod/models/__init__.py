@@ -26,6 +26,7 @@ from yod.models.responses import (
     ContradictionsResponse,
     Conversation,
     CreateKeyResponse,
+    DashboardSnapshot,
     DriftScore,
     EndpointUsage,
     EntitiesResponse,
@@ -141,6 +142,8 @@ __all__ = [
     "ContradictionPair",
     "ContradictionsResponse",
     "SessionContradictionsResponse",
+    # Responses - Dashboard
+    "DashboardSnapshot",
     # Responses - Audit
     "AuditSummaryResponse",
     "AuditEvent",
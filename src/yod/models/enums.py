@@ -2,42 +2,61 @@
 
 from __future__ import annotations
 
-from typing import Literal
-
-EntityType = Literal[
-    "self",
-    "person",
-    "organization",
-    "project",
-    "location",
-    "date",
-    "preference",
-    "topic",
-    "other",
-]
-
-MemoryKind = Literal[
-    "preference",
-    "event",
-    "profile_fact",
-    "task",
-    "relationship",
-    "fact",
-    "semantic",  # Consolidated memories abstracted from episodic clusters
-]
-
-MemoryStatus = Literal[
-    "active",
-    "superseded",
-    "rejected",
-    "proposed",
-    "consolidated",  # Episodic memories merged into semantic facts
-    "archived",      # Decayed memories pruned during consolidation
-]
-
-MemoryType = Literal[
-    "episodic",     # Events with temporal context, subject to decay
-    "semantic",     # Stable facts, singleton behavior
-    "procedural",   # Preferences/behaviors that strengthen with use
-    "core",         # Identity facts, never superseded
-]
+from enum import Enum
+
+
+class _StrEnum(str, Enum):
+    """
+    String enum whose members compare equal to, and format as, their values.
+
+    Stands in for enum.StrEnum, which needs Python 3.11.
+    """
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+
+class EntityType(_StrEnum):
+    """Type of an extracted entity."""
+
+    SELF = "self"
+    PERSON = "person"
+    ORGANIZATION = "organization"
+    PROJECT = "project"
+    LOCATION = "location"
+    DATE = "date"
+    PREFERENCE = "preference"
+    TOPIC = "topic"
+    OTHER = "other"
+
+
+class MemoryKind(_StrEnum):
+    """What a memory is about."""
+
+    PREFERENCE = "preference"
+    EVENT = "event"
+    PROFILE_FACT = "profile_fact"
+    TASK = "task"
+    RELATIONSHIP = "relationship"
+    FACT = "fact"
+    SEMANTIC = "semantic"  # Consolidated memories abstracted from episodic clusters
+
+
+class MemoryStatus(_StrEnum):
+    """Lifecycle status of a memory."""
+
+    ACTIVE = "active"
+    SUPERSEDED = "superseded"
+    REJECTED = "rejected"
+    PROPOSED = "proposed"
+    CONSOLIDATED = "consolidated"  # Episodic memories merged into semantic facts
+    ARCHIVED = "archived"  # Decayed memories pruned during consolidation
+
+
+class MemoryType(_StrEnum):
+    """Cognitive classification of a memory; affects decay and ranking."""
+
+    EPISODIC = "episodic"  # Events with temporal context, subject to decay
+    SEMANTIC = "semantic"  # Stable facts, singleton behavior
+    PROCEDURAL = "procedural"  # Preferences/behaviors that strengthen with use
+    CORE = "core"  # Identity facts, never superseded
@@ -2,24 +2,39 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
+from yod.models.enums import MemoryKind, MemoryStatus
 
-class Citation(BaseModel):
-    """A citation referencing a source."""
+
+class _ResponseModel(BaseModel):
+    """
+    Base for response models.
+
+    Schemas are built on first use rather than at import, so importing the
+    models only pays for the ones an application actually touches.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class Citation(_ResponseModel):
+    """A citation referencing a source. Immutable and hashable, so repeats can be deduplicated."""
+
+    model_config = ConfigDict(frozen=True)
 
     source_id: str
     quote: str | None = None
 
 
-class MemorySupport(BaseModel):
+class MemorySupport(_ResponseModel):
     """Evidence supporting a memory."""
 
     source_id: str
     quotes: list[str] = Field(default_factory=list)
 
 
-class MemoryLink(BaseModel):
+class MemoryLink(_ResponseModel):
     """
     Semantic link between memories discovered by A-MEM algorithm.
 
@@ -27,8 +42,12 @@ class MemoryLink(BaseModel):
     relationships between claims using the A-MEM two-step process:
     1. Candidate retrieval (keyword/entity matching)
     2. LLM relationship classification
+
+    Immutable and hashable, so duplicate links can be collapsed with a set.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     target: str
     """The memory_id of the linked memory."""
 
@@ -42,14 +61,17 @@ class MemoryLink(BaseModel):
     """Optional explanation for the relationship."""
 
 
-class Contradiction(BaseModel):
+class Contradiction(_ResponseModel):
     """
     Detected contradiction between user's memories.
 
     Surfaced during chat queries when MEMORY_LINKING_ENABLED=true and
-    conflicting claims are found in the retrieved memories.
+    conflicting claims are found in the retrieved memories. Immutable and
+    hashable, like MemoryLink.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     claim_a: str
     """Summary of first conflicting claim."""
 
@@ -60,17 +82,19 @@ class Contradiction(BaseModel):
     """Explanation of why the claims conflict."""
 
 
-class MemoryItem(BaseModel):
+class MemoryItem(_ResponseModel):
     """A single memory item."""
 
     memory_id: str
-    kind: str
+    kind: MemoryKind | str = Field(union_mode="left_to_right")
+    """Known kinds parse to MemoryKind; kinds newer than this SDK stay plain strings."""
     summary: str
     confidence: float
     updated_at: str | None = None
     entity_ids: list[str] = Field(default_factory=list)
     support: list[MemorySupport] = Field(default_factory=list)
-    status: str | None = None
+    status: MemoryStatus | str | None = Field(default=None, union_mode="left_to_right")
+    """Known statuses parse to MemoryStatus; unknown ones stay plain strings."""
     key: str | None = None
     valid_from: str | None = None
     valid_to: str | None = None
@@ -92,13 +116,13 @@ class MemoryItem(BaseModel):
     """Number of times this memory has been accessed. Used for procedural strengthening."""
 
 
-class MemoryListResponse(BaseModel):
+class MemoryListResponse(_ResponseModel):
     """Response containing a list of memories."""
 
     items: list[MemoryItem] = Field(default_factory=list)
 
 
-class ChatResponse(BaseModel):
+class ChatResponse(_ResponseModel):
     """Response from a chat/query request."""
 
     answer: str
@@ -116,7 +140,7 @@ class ChatResponse(BaseModel):
     """Total end-to-end latency in milliseconds."""
 
 
-class ExtractedEntity(BaseModel):
+class ExtractedEntity(_ResponseModel):
     """An entity extracted during ingestion."""
 
     entity_id: str
@@ -125,7 +149,7 @@ class ExtractedEntity(BaseModel):
     aliases: list[str] = Field(default_factory=list)
 
 
-class MergeInfo(BaseModel):
+class MergeInfo(_ResponseModel):
     """Information about a merged memory when decision is MERGE."""
 
     existing_value: str
@@ -136,11 +160,11 @@ class MergeInfo(BaseModel):
     """The resulting merged value."""
 
 
-class ExtractedMemory(BaseModel):
+class ExtractedMemory(_ResponseModel):
     """A memory extracted during ingestion."""
 
     memory_id: str
-    kind: str
+    kind: MemoryKind | str = Field(union_mode="left_to_right")
     summary: str
     entity_ids: list[str] = Field(default_factory=list)
     confidence: float = 0.6
@@ -164,7 +188,7 @@ class ExtractedMemory(BaseModel):
     """Memory type: episodic, semantic, procedural, or core. See MemoryType enum."""
 
 
-class IngestResponse(BaseModel):
+class IngestResponse(_ResponseModel):
     """Response from ingesting chat/text data."""
 
     source_id: str
@@ -175,20 +199,22 @@ class IngestResponse(BaseModel):
     """True if embedding generation failed (memories still extracted)."""
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(_ResponseModel):
     """Response from health check endpoint."""
 
     status: str
 
 
-class ServiceStatus(BaseModel):
-    """Status of a backend service (Neo4j, Qdrant)."""
+class ServiceStatus(_ResponseModel):
+    """Status of a backend service (Neo4j, Qdrant). Immutable and hashable."""
+
+    model_config = ConfigDict(frozen=True)
 
     ok: bool
     error: str | None = None
 
 
-class RedisStatus(BaseModel):
+class RedisStatus(_ResponseModel):
     """Status of Redis cache service."""
 
     status: str
@@ -196,7 +222,7 @@ class RedisStatus(BaseModel):
     uptime_seconds: int | None = None
 
 
-class ReadyResponse(BaseModel):
+class ReadyResponse(_ResponseModel):
     """Response from readiness check endpoint."""
 
     status: str
@@ -205,7 +231,7 @@ class ReadyResponse(BaseModel):
     redis: RedisStatus | None = None
 
 
-class Session(BaseModel):
+class Session(_ResponseModel):
     """A memory session for scoping memories to specific contexts."""
 
     session_id: str
@@ -216,7 +242,7 @@ class Session(BaseModel):
     claim_count: int = 0
 
 
-class SessionListResponse(BaseModel):
+class SessionListResponse(_ResponseModel):
     """Response containing a list of sessions."""
 
     sessions: list[Session] = Field(default_factory=list)
@@ -226,7 +252,7 @@ class SessionListResponse(BaseModel):
 # --- API Key Models ---
 
 
-class KeyUsageStats(BaseModel):
+class KeyUsageStats(_ResponseModel):
     """Usage stats for a single API key."""
 
     calls: int = 0
@@ -234,7 +260,7 @@ class KeyUsageStats(BaseModel):
     tokens_output: int = 0
 
 
-class APIKeyItem(BaseModel):
+class APIKeyItem(_ResponseModel):
     """An API key (without the secret)."""
 
     key_id: str
@@ -247,7 +273,7 @@ class APIKeyItem(BaseModel):
     usage: KeyUsageStats = Field(default_factory=KeyUsageStats)
 
 
-class CreateKeyResponse(BaseModel):
+class CreateKeyResponse(_ResponseModel):
     """Response containing the new API key."""
 
     key_id: str
@@ -259,13 +285,13 @@ class CreateKeyResponse(BaseModel):
     expires_at: str | None = None
 
 
-class KeyListResponse(BaseModel):
+class KeyListResponse(_ResponseModel):
     """Response containing list of API keys."""
 
     keys: list[APIKeyItem] = Field(default_factory=list)
 
 
-class UsageSummary(BaseModel):
+class UsageSummary(_ResponseModel):
     """Usage summary for billing."""
 
     total_calls: int
@@ -276,7 +302,7 @@ class UsageSummary(BaseModel):
     period_end: str
 
 
-class EndpointUsage(BaseModel):
+class EndpointUsage(_ResponseModel):
     """Usage breakdown by endpoint."""
 
     endpoint: str
@@ -286,14 +312,14 @@ class EndpointUsage(BaseModel):
     cost_usd: float
 
 
-class UsageResponse(BaseModel):
+class UsageResponse(_ResponseModel):
     """Full usage response."""
 
     summary: UsageSummary
     by_endpoint: list[EndpointUsage] = Field(default_factory=list)
 
 
-class QuotaLimit(BaseModel):
+class QuotaLimit(_ResponseModel):
     """A single quota limit with usage."""
 
     used: int
@@ -303,7 +329,7 @@ class QuotaLimit(BaseModel):
     """Remaining quota. -1 means unlimited."""
 
 
-class QuotaResponse(BaseModel):
+class QuotaResponse(_ResponseModel):
     """Full quota status response."""
 
     plan: str
@@ -317,7 +343,7 @@ class QuotaResponse(BaseModel):
 # --- Conversation Models ---
 
 
-class Conversation(BaseModel):
+class Conversation(_ResponseModel):
     """A chat conversation."""
 
     conversation_id: str
@@ -327,7 +353,7 @@ class Conversation(BaseModel):
     updated_at: str
 
 
-class Message(BaseModel):
+class Message(_ResponseModel):
     """A chat message within a conversation."""
 
     message_id: str
@@ -340,6 +366,9 @@ class Message(BaseModel):
 class MessageInput(BaseModel):
     """Input for creating or syncing a message."""
 
+    # Not a response model, but built lazily like them
+    model_config = ConfigDict(defer_build=True)
+
     id: str | None = None
     role: str
     content: str
@@ -350,7 +379,7 @@ class MessageInput(BaseModel):
 # --- Speech Models ---
 
 
-class STTResponse(BaseModel):
+class STTResponse(_ResponseModel):
     """Response from speech-to-text endpoint."""
 
     text: str
@@ -360,7 +389,7 @@ class STTResponse(BaseModel):
 # --- Consolidation Models ---
 
 
-class ConsolidationStatusResponse(BaseModel):
+class ConsolidationStatusResponse(_ResponseModel):
     """Response for consolidation status endpoint."""
 
     enabled: bool
@@ -376,7 +405,7 @@ class ConsolidationStatusResponse(BaseModel):
     """Details of the most recent consolidation run, if any."""
 
 
-class ConsolidationTriggerResponse(BaseModel):
+class ConsolidationTriggerResponse(_ResponseModel):
     """Response for manual consolidation trigger."""
 
     started: bool
@@ -389,7 +418,7 @@ class ConsolidationTriggerResponse(BaseModel):
     """Job ID for tracking the background consolidation. Use get_consolidation_result()."""
 
 
-class ConsolidationResultResponse(BaseModel):
+class ConsolidationResultResponse(_ResponseModel):
     """Response with consolidation cycle results."""
 
     user_id: str
@@ -429,7 +458,7 @@ class ConsolidationResultResponse(BaseModel):
 # --- Evolution/Drift Models ---
 
 
-class DriftScore(BaseModel):
+class DriftScore(_ResponseModel):
     """Drift score for a time period."""
 
     period: str
@@ -442,7 +471,7 @@ class DriftScore(BaseModel):
     """Whether drift was detected in this period."""
 
 
-class EvolutionPoint(BaseModel):
+class EvolutionPoint(_ResponseModel):
     """A point in the memory evolution timeline."""
 
     period: str
@@ -458,7 +487,7 @@ class EvolutionPoint(BaseModel):
     """Embedding centroid for this period (optional)."""
 
 
-class EvolutionResponse(BaseModel):
+class EvolutionResponse(_ResponseModel):
     """Response for memory evolution/drift tracking."""
 
     key: str
@@ -480,7 +509,7 @@ class EvolutionResponse(BaseModel):
     """LLM-generated interpretation of the evolution."""
 
 
-class EvolutionKeysResponse(BaseModel):
+class EvolutionKeysResponse(_ResponseModel):
     """Response listing memory keys with drift potential."""
 
     keys: list[str]
@@ -496,7 +525,7 @@ class EvolutionKeysResponse(BaseModel):
 # --- Entity Models ---
 
 
-class EntityLink(BaseModel):
+class EntityLink(_ResponseModel):
     """Co-occurrence link between entities."""
 
     source: str
@@ -509,7 +538,7 @@ class EntityLink(BaseModel):
     """Co-occurrence weight."""
 
 
-class EntitySummary(BaseModel):
+class EntitySummary(_ResponseModel):
     """Summary of an entity."""
 
     entity_id: str
@@ -525,7 +554,7 @@ class EntitySummary(BaseModel):
     """Number of claims about this entity."""
 
 
-class EntitiesResponse(BaseModel):
+class EntitiesResponse(_ResponseModel):
     """Response for entity list with co-occurrence links."""
 
     entities: list[EntitySummary]
@@ -535,7 +564,7 @@ class EntitiesResponse(BaseModel):
     """Co-occurrence links between entities."""
 
 
-class EntityDetailsResponse(BaseModel):
+class EntityDetailsResponse(_ResponseModel):
     """Detailed entity information."""
 
     entity_id: str
@@ -566,7 +595,7 @@ class EntityDetailsResponse(BaseModel):
 # --- Graph Models ---
 
 
-class GraphNode(BaseModel):
+class GraphNode(_ResponseModel):
     """Node in the claims graph."""
 
     id: str
@@ -582,7 +611,7 @@ class GraphNode(BaseModel):
     """Confidence score."""
 
 
-class GraphLink(BaseModel):
+class GraphLink(_ResponseModel):
     """Link in the claims graph."""
 
     source: str
@@ -598,7 +627,7 @@ class GraphLink(BaseModel):
     """Link confidence."""
 
 
-class ClaimsGraphResponse(BaseModel):
+class ClaimsGraphResponse(_ResponseModel):
     """Response for claims graph visualization."""
 
     nodes: list[GraphNode]
@@ -611,7 +640,7 @@ class ClaimsGraphResponse(BaseModel):
 # --- Contradiction Models ---
 
 
-class ContradictionPair(BaseModel):
+class ContradictionPair(_ResponseModel):
     """A pair of contradicting memories."""
 
     claim_a: MemoryItem
@@ -627,7 +656,7 @@ class ContradictionPair(BaseModel):
     """Session ID of second claim."""
 
 
-class ContradictionsResponse(BaseModel):
+class ContradictionsResponse(_ResponseModel):
     """Response for cross-session contradictions summary."""
 
     total_conflicts: int
@@ -640,7 +669,7 @@ class ContradictionsResponse(BaseModel):
     """Number of sessions with conflicts."""
 
 
-class SessionContradictionsResponse(BaseModel):
+class SessionContradictionsResponse(_ResponseModel):
     """Response for session-specific contradictions."""
 
     contradictions: list[ContradictionPair]
@@ -653,10 +682,29 @@ class SessionContradictionsResponse(BaseModel):
     """Session ID."""
 
 
+# --- Dashboard Models ---
+
+
+class DashboardSnapshot(_ResponseModel):
+    """Entities, claims graph, contradictions and health fetched together."""
+
+    entities: EntitiesResponse
+    """Entities with co-occurrence links."""
+
+    claims: ClaimsGraphResponse
+    """Claims graph nodes and links."""
+
+    contradictions: ContradictionsResponse
+    """Cross-session contradictions summary."""
+
+    health: HealthResponse
+    """API health status."""
+
+
 # --- Audit Models ---
 
 
-class AuditSummaryResponse(BaseModel):
+class AuditSummaryResponse(_ResponseModel):
     """Summary of memory audit activity."""
 
     total: int
@@ -669,7 +717,7 @@ class AuditSummaryResponse(BaseModel):
     """Period in days."""
 
 
-class AuditEvent(BaseModel):
+class AuditEvent(_ResponseModel):
     """A single audit event."""
 
     event_id: str
@@ -688,7 +736,7 @@ class AuditEvent(BaseModel):
     """Additional details."""
 
 
-class RecentAuditResponse(BaseModel):
+class RecentAuditResponse(_ResponseModel):
     """Response for recent audit events."""
 
     modifications: list[AuditEvent]
@@ -698,7 +746,7 @@ class RecentAuditResponse(BaseModel):
     """Number of events returned."""
 
 
-class SuspiciousPattern(BaseModel):
+class SuspiciousPattern(_ResponseModel):
     """A detected suspicious activity pattern."""
 
     pattern_type: str
@@ -714,7 +762,7 @@ class SuspiciousPattern(BaseModel):
     """Affected memory IDs."""
 
 
-class SuspiciousActivityResponse(BaseModel):
+class SuspiciousActivityResponse(_ResponseModel):
     """Response for suspicious activity detection."""
 
     patterns: list[SuspiciousPattern]
@@ -730,7 +778,7 @@ class SuspiciousActivityResponse(BaseModel):
     """Whether suspicious activity was detected."""
 
 
-class MemoryAuditTrailResponse(BaseModel):
+class MemoryAuditTrailResponse(_ResponseModel):
     """Audit trail for a specific memory."""
 
     audit_trail: list[AuditEvent]
@@ -746,7 +794,7 @@ class MemoryAuditTrailResponse(BaseModel):
 # --- Proposed Memory Models ---
 
 
-class ProposedMemoriesResponse(BaseModel):
+class ProposedMemoriesResponse(_ResponseModel):
     """Response for proposed memories awaiting review."""
 
     items: list[MemoryItem]
@@ -756,7 +804,7 @@ class ProposedMemoriesResponse(BaseModel):
     """Number of proposed memories."""
 
 
-class ApproveMemoryResponse(BaseModel):
+class ApproveMemoryResponse(_ResponseModel):
     """Response for approving a proposed memory."""
 
     ok: bool
@@ -775,7 +823,7 @@ class ApproveMemoryResponse(BaseModel):
     """ID of claim that was superseded, if any."""
 
 
-class RejectMemoryResponse(BaseModel):
+class RejectMemoryResponse(_ResponseModel):
     """Response for rejecting a proposed memory."""
 
     ok: bool
@@ -788,7 +836,7 @@ class RejectMemoryResponse(BaseModel):
 # --- Chat Tool Models ---
 
 
-class FeedbackResponse(BaseModel):
+class FeedbackResponse(_ResponseModel):
     """Response for memory feedback submission."""
 
     feedback_id: str
@@ -798,7 +846,7 @@ class FeedbackResponse(BaseModel):
     """Confirmation message."""
 
 
-class MemoryToolResponse(BaseModel):
+class MemoryToolResponse(_ResponseModel):
     """Response for memory tool operations."""
 
     success: bool
@@ -817,7 +865,7 @@ class MemoryToolResponse(BaseModel):
     """Error message, if any."""
 
 
-class ToolParameter(BaseModel):
+class ToolParameter(_ResponseModel):
     """A parameter definition for a memory tool."""
 
     name: str
@@ -836,7 +884,7 @@ class ToolParameter(BaseModel):
     """Allowed values, if restricted."""
 
 
-class ToolDefinition(BaseModel):
+class ToolDefinition(_ResponseModel):
     """Definition of a memory tool for LLM function calling."""
 
     name: str
@@ -849,7 +897,7 @@ class ToolDefinition(BaseModel):
     """Tool parameters."""
 
 
-class MemoryToolsSchemaResponse(BaseModel):
+class MemoryToolsSchemaResponse(_ResponseModel):
     """Response for memory tools schema."""
 
     tools: list[ToolDefinition]
@@ -857,3 +905,16 @@ class MemoryToolsSchemaResponse(BaseModel):
 
     enabled: bool
     """Whether memory tools are enabled."""
+
+
+# Endpoints that take or return a bare JSON array are validated/serialized in
+# one pass through these adapters; like the models, they are built on first use.
+_CONVERSATION_LIST: TypeAdapter[list[Conversation]] = TypeAdapter(
+    list[Conversation], config=ConfigDict(defer_build=True)
+)
+_MESSAGE_LIST: TypeAdapter[list[Message]] = TypeAdapter(
+    list[Message], config=ConfigDict(defer_build=True)
+)
+_MESSAGE_INPUT_LIST: TypeAdapter[list[MessageInput]] = TypeAdapter(
+    list[MessageInput], config=ConfigDict(defer_build=True)
+)
@@ -116,3 +116,26 @@ def create_error_response(
         content=json.dumps({"detail": detail}).encode(),
         headers=headers,
     )
+
+
+@pytest.fixture
+def sample_conversation() -> dict:
+    """Sample conversation from /conversations endpoints."""
+    return {
+        "conversation_id": "conv_1",
+        "title": "Trip",
+        "message_count": 1,
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+    }
+
+
+@pytest.fixture
+def sample_message() -> dict:
+    """Sample message from /conversations/{id}/messages endpoints."""
+    return {
+        "message_id": "msg_1",
+        "role": "user",
+        "content": "Hi",
+        "created_at": "2024-01-01T00:00:00Z",
+    }
@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 
+import httpx
 import pytest
 import respx
 from httpx import Response
 
-from yod import AsyncYodClient
+from yod import AsyncYodClient, RetryConfig
 from yod.exceptions import (
     AuthenticationError,
     NotFoundError,
     RateLimitError,
+    ValidationError,
 )
+from yod.models import MessageInput
 
 
 class TestAsyncClientInitialization:
@@ -23,6 +27,42 @@ class TestAsyncClientInitialization:
         client = AsyncYodClient(api_key="sk-yod-test")
         assert client.config.base_url == "https://api.yod.agames.ai"
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_warmup_on_enter(self):
+        route = respx.get("https://api.yod.agames.ai/health").mock(
+            return_value=Response(200, json={"status": "ok"})
+        )
+
+        async with AsyncYodClient(api_key="sk-yod-test", warmup=True):
+            assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_warmup_failure_is_ignored(self):
+        respx.get("https://api.yod.agames.ai/health").mock(
+            side_effect=httpx.ConnectError("refused")
+        )
+
+        async with AsyncYodClient(api_key="sk-yod-test", warmup=True) as client:
+            assert client._client is not None
+
+    def test_retry_config_overrides_max_retries(self):
+        retry_config = RetryConfig(max_retries=5, initial_delay=1.0, decorrelated_jitter=True)
+        client = AsyncYodClient(api_key="sk-yod-test", retry_config=retry_config)
+        assert client.retry_config is retry_config
+        assert client.config.max_retries == 5
+
+    def test_http2_is_opt_in(self):
+        assert AsyncYodClient(api_key="sk-yod-test").config.http2 is False
+        assert AsyncYodClient(api_key="sk-yod-test", http2=True).config.http2 is True
+
+    def test_max_concurrency_defaults_to_keepalive_limit(self):
+        client = AsyncYodClient(api_key="sk-yod-test", max_keepalive_connections=8)
+        assert client.config.max_concurrency == 8
+        client = AsyncYodClient(api_key="sk-yod-test", max_concurrency=3)
+        assert client.config.max_concurrency == 3
+
     def test_timeout_configuration(self):
         client = AsyncYodClient(
             api_key="sk-yod-test", timeout=60.0, connect_timeout=10.0
@@ -30,6 +70,14 @@ class TestAsyncClientInitialization:
         assert client.config.timeout == 60.0
         assert client.config.connect_timeout == 10.0
 
+    def test_connection_pool_limits(self):
+        client = AsyncYodClient(
+            api_key="sk-yod-test", max_connections=200, max_keepalive_connections=50
+        )
+        assert client.config.max_connections == 200
+        assert client.config.max_keepalive_connections == 50
+        assert client.config.keepalive_expiry == 5.0
+
 
 class TestAsyncContextManager:
     """Tests for async context manager."""
@@ -73,6 +121,24 @@ class TestAsyncChatEndpoint:
         assert body["question"] == "Test?"
         assert body["language"] == "en"
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_chat_bulk_preserves_order(self, sample_chat_response: dict):
+        async def respond(request):
+            question = json.loads(request.content)["question"]
+            # Answer later questions sooner so completion order differs from input order
+            await asyncio.sleep(0.01 * (5 - int(question[1:])))
+            return Response(200, json={**sample_chat_response, "answer": f"re: {question}"})
+
+        route = respx.post("https://api.yod.agames.ai/chat").mock(side_effect=respond)
+
+        questions = [f"q{i}" for i in range(5)]
+        async with AsyncYodClient(api_key="sk-yod-test", max_concurrency=2) as client:
+            responses = await client.chat_bulk(questions)
+
+        assert [r.answer for r in responses] == [f"re: {q}" for q in questions]
+        assert route.call_count == 5
+
 
 class TestAsyncIngestEndpoint:
     """Tests for the async /ingest/chat endpoint."""
@@ -90,6 +156,21 @@ class TestAsyncIngestEndpoint:
         assert response.source_id == "src_abc123"
         assert response.chunks == 3
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_ingest_chat_bulk(self, sample_ingest_response: dict):
+        route = respx.post("https://api.yod.agames.ai/ingest/chat").mock(
+            return_value=Response(200, json=sample_ingest_response)
+        )
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            responses = await client.ingest_chat_bulk(["one", "two", "three"], session_id="s1")
+
+        assert len(responses) == 3
+        sent = [json.loads(call.request.content) for call in route.calls]
+        assert sorted(body["text"] for body in sent) == ["one", "three", "two"]
+        assert all(body["session_id"] == "s1" for body in sent)
+
 
 class TestAsyncMemoriesEndpoint:
     """Tests for async /memories endpoints."""
@@ -118,6 +199,119 @@ class TestAsyncMemoriesEndpoint:
 
         assert memory.memory_id == "mem_123"
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_get_memories_bulk_preserves_order(self, sample_memory_item: dict):
+        def respond(request):
+            memory_id = request.url.path.rsplit("/", 1)[-1]
+            return Response(200, json={**sample_memory_item, "memory_id": memory_id})
+
+        route = respx.get(url__regex=r"https://api\.yod\.agames\.ai/memories/mem_\d+").mock(
+            side_effect=respond
+        )
+
+        async with AsyncYodClient(api_key="sk-yod-test", max_concurrency=2) as client:
+            memories = await client.get_memories_bulk([f"mem_{i}" for i in range(5)])
+
+        assert [m.memory_id for m in memories] == [f"mem_{i}" for i in range(5)]
+        assert route.call_count == 5
+
+    @respx.mock
+    def test_bulk_client_reusable_across_event_loops(self, sample_memory_item: dict):
+        respx.get(url__regex=r"https://api\.yod\.agames\.ai/memories/mem_\d+").mock(
+            return_value=Response(200, json=sample_memory_item)
+        )
+        client = AsyncYodClient(api_key="sk-yod-test", max_concurrency=1)
+
+        async def fetch() -> int:
+            async with client:
+                return len(await client.get_memories_bulk(["mem_1", "mem_2"]))
+
+        assert asyncio.run(fetch()) == 2
+        assert asyncio.run(fetch()) == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_concurrent_identical_gets_share_one_request(self, sample_memory_item: dict):
+        async def respond(request):
+            await asyncio.sleep(0.01)
+            return Response(200, json=sample_memory_item)
+
+        route = respx.get("https://api.yod.agames.ai/memories/mem_123").mock(side_effect=respond)
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            first, second = await asyncio.gather(
+                client.get_memory("mem_123"), client.get_memory("mem_123")
+            )
+            await client.get_memory("mem_123")
+
+        assert route.call_count == 2
+        assert first == second
+        assert first is not second
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cancelling_first_caller_does_not_cancel_joined_get(
+        self, sample_memory_item: dict
+    ):
+        async def respond(request):
+            await asyncio.sleep(0.05)
+            return Response(200, json=sample_memory_item)
+
+        route = respx.get("https://api.yod.agames.ai/memories/mem_123").mock(side_effect=respond)
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            leader = asyncio.ensure_future(client.get_memory("mem_123"))
+            follower = asyncio.ensure_future(client.get_memory("mem_123"))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+
+            memory = await follower
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+
+        assert memory.memory_id == "mem_123"
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cancelling_every_caller_abandons_shared_get(self, sample_memory_item: dict):
+        async def respond(request):
+            await asyncio.sleep(0.5)
+            return Response(200, json=sample_memory_item)
+
+        respx.get("https://api.yod.agames.ai/memories/mem_123").mock(side_effect=respond)
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            caller = asyncio.ensure_future(client.get_memory("mem_123"))
+            await asyncio.sleep(0.01)
+            caller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+
+            assert asyncio.all_tasks() == {asyncio.current_task()}
+            assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_joined_gets_raise_their_own_exceptions(self):
+        async def respond(request):
+            await asyncio.sleep(0.01)
+            return Response(404, json={"detail": "Memory not found"})
+
+        respx.get("https://api.yod.agames.ai/memories/missing").mock(side_effect=respond)
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            first, second = await asyncio.gather(
+                client.get_memory("missing"),
+                client.get_memory("missing"),
+                return_exceptions=True,
+            )
+
+        assert isinstance(first, NotFoundError)
+        assert isinstance(second, NotFoundError)
+        assert first is not second
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_delete_memory(self):
@@ -143,6 +337,87 @@ class TestAsyncMemoriesEndpoint:
         assert len(response.items) == 1
 
 
+class TestAsyncSessionsEndpoint:
+    """Tests for async /sessions endpoints."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_iter_sessions_stops_on_short_page(self):
+        session = {"session_id": "s1", "user_id": "u1", "created_at": "2026-01-01T00:00:00Z"}
+        route = respx.get("https://api.yod.agames.ai/sessions").mock(
+            side_effect=[
+                Response(200, json={"sessions": [session, session], "total": 3}),
+                Response(200, json={"sessions": [session], "total": 3}),
+            ]
+        )
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            sessions = [s async for s in client.iter_sessions(page_size=2)]
+
+        assert len(sessions) == 3
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_iter_sessions_continues_past_capped_page(self):
+        session = {"session_id": "s1", "user_id": "u1", "created_at": "2026-01-01T00:00:00Z"}
+        route = respx.get("https://api.yod.agames.ai/sessions").mock(
+            side_effect=[
+                Response(200, json={"sessions": [session] * 2, "total": 5}),
+                Response(200, json={"sessions": [session] * 2, "total": 5}),
+                Response(200, json={"sessions": [session], "total": 5}),
+            ]
+        )
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            sessions = [s async for s in client.iter_sessions(page_size=3)]
+
+        assert len(sessions) == 5
+        assert [call.request.url.params["offset"] for call in route.calls] == ["0", "2", "4"]
+
+
+class TestAsyncConversationsEndpoint:
+    """Tests for async /conversations endpoints."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_sync_messages_large_batch(self):
+        route = respx.post("https://api.yod.agames.ai/conversations/conv_1/sync").mock(
+            return_value=Response(200, json={"ok": True, "saved": 100})
+        )
+        messages = [MessageInput(role="user", content=f"msg {i}") for i in range(100)]
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            await client.sync_messages("conv_1", messages)
+
+        sent = json.loads(route.calls[0].request.content)["messages"]
+        assert sent == [m.model_dump() for m in messages]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_list_conversations(self, sample_conversation: dict):
+        respx.get("https://api.yod.agames.ai/conversations").mock(
+            return_value=Response(200, json=[sample_conversation])
+        )
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            conversations = await client.list_conversations()
+
+        assert conversations[0].title == "Trip"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_get_messages(self, sample_message: dict):
+        respx.get("https://api.yod.agames.ai/conversations/conv_1/messages").mock(
+            return_value=Response(200, json=[sample_message])
+        )
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            messages = await client.get_messages("conv_1")
+
+        assert messages[0].content == "Hi"
+
+
 class TestAsyncHealthEndpoints:
     """Tests for async health check endpoints."""
 
@@ -171,6 +446,205 @@ class TestAsyncHealthEndpoints:
         assert response.status == "ok"
         assert response.neo4j.ok is True
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_ready_cache_expires(self, sample_ready_response: dict, monkeypatch):
+        route = respx.get("https://api.yod.agames.ai/ready").mock(
+            return_value=Response(200, json=sample_ready_response)
+        )
+        now = [1000.0]
+        monkeypatch.setattr("yod._base_client.time.monotonic", lambda: now[0])
+
+        async with AsyncYodClient(api_key="sk-yod-test", cache_responses=True) as client:
+            await client.ready()
+            await client.ready()
+            now[0] += 10.0
+            await client.ready()
+
+        assert route.call_count == 2
+
+
+class TestAsyncSpeechEndpoints:
+    """Tests for async /speech endpoints."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_text_to_speech_stream_yields_chunks(self):
+        respx.post("https://api.yod.agames.ai/speech/tts").mock(
+            return_value=Response(200, content=b"ID3" + b"\x00" * 10)
+        )
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            chunks = [c async for c in client.text_to_speech_stream("Hello", chunk_size=4)]
+
+        assert b"".join(chunks) == b"ID3" + b"\x00" * 10
+        assert all(len(chunk) <= 4 for chunk in chunks)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_text_to_speech_stream_error(self):
+        respx.post("https://api.yod.agames.ai/speech/tts").mock(
+            return_value=Response(422, json={"detail": "text too long"})
+        )
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            with pytest.raises(ValidationError, match="text too long"):
+                async for _ in client.text_to_speech_stream("Hello"):
+                    pass
+
+
+class TestAsyncAuditEndpoints:
+    """Tests for async audit endpoints."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_get_memory_audit_trails_bulk(self):
+        def respond(request):
+            memory_id = request.url.path.split("/")[2]
+            return Response(200, json={"audit_trail": [], "count": 0, "memory_id": memory_id})
+
+        route = respx.get(url__regex=r"https://api\.yod\.agames\.ai/memories/\w+/audit").mock(
+            side_effect=respond
+        )
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            trails = await client.get_memory_audit_trails_bulk(["mem_a", "mem_b"], limit=5)
+
+        assert [t.memory_id for t in trails] == ["mem_a", "mem_b"]
+        assert all(call.request.url.params["limit"] == "5" for call in route.calls)
+
+
+class TestAsyncProposedMemoryEndpoints:
+    """Tests for async proposed-memory endpoints."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_reject_memories_bulk(self):
+        def respond(request):
+            memory_id = request.url.path.split("/")[2]
+            return Response(200, json={"ok": True, "memory_id": memory_id})
+
+        respx.post(url__regex=r"https://api\.yod\.agames\.ai/memories/\w+/reject").mock(
+            side_effect=respond
+        )
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            results = await client.reject_memories_bulk(["mem_1", "mem_2"])
+
+        assert [r.memory_id for r in results] == ["mem_1", "mem_2"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_bulk_failure_cancels_remaining_requests(self):
+        completed = []
+
+        async def respond(request):
+            memory_id = request.url.path.split("/")[2]
+            if memory_id == "missing":
+                return Response(404, json={"detail": "Memory not found"})
+            await asyncio.sleep(0.5)
+            completed.append(memory_id)
+            return Response(200, json={"ok": True, "memory_id": memory_id})
+
+        respx.post(url__regex=r"https://api\.yod\.agames\.ai/memories/\w+/reject").mock(
+            side_effect=respond
+        )
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            with pytest.raises(NotFoundError):
+                await client.reject_memories_bulk(["mem_1", "missing", "mem_2"])
+
+            assert asyncio.all_tasks() == {asyncio.current_task()}
+
+        assert completed == []
+
+
+class TestAsyncConsolidationEndpoints:
+    """Tests for async /consolidation endpoints."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_wait_for_consolidation_polls_until_complete(self):
+        running = {"user_id": "u1", "started_at": "2026-01-01T00:00:00Z"}
+        done = {**running, "completed_at": "2026-01-01T00:00:05Z"}
+        route = respx.get("https://api.yod.agames.ai/consolidation/result/job_1").mock(
+            side_effect=[Response(200, json=running), Response(200, json=done)]
+        )
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            result = await client.wait_for_consolidation("job_1", poll_interval=0.0)
+
+        assert result.completed_at == "2026-01-01T00:00:05Z"
+        assert route.call_count == 2
+
+
+class TestAsyncDashboardSnapshot:
+    """Tests for the async dashboard_snapshot() helper."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_dashboard_snapshot(self, sample_health_response: dict):
+        base = "https://api.yod.agames.ai"
+        respx.get(f"{base}/entities").mock(
+            return_value=Response(200, json={"entities": [], "links": []})
+        )
+        respx.get(f"{base}/memories/graph").mock(
+            return_value=Response(200, json={"nodes": [], "links": []})
+        )
+        respx.get(f"{base}/memories/contradictions").mock(
+            return_value=Response(200, json={"total_conflicts": 0, "session_count": 0})
+        )
+        respx.get(f"{base}/health").mock(return_value=Response(200, json=sample_health_response))
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            snapshot = await client.dashboard_snapshot()
+
+        assert snapshot.contradictions.total_conflicts == 0
+        assert snapshot.health.status == "ok"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_dashboard_snapshot_propagates_errors(self, sample_health_response: dict):
+        base = "https://api.yod.agames.ai"
+        respx.get(f"{base}/entities").mock(return_value=Response(401, json={"detail": "no"}))
+        respx.get(f"{base}/memories/graph").mock(
+            return_value=Response(200, json={"nodes": [], "links": []})
+        )
+        respx.get(f"{base}/memories/contradictions").mock(
+            return_value=Response(200, json={"total_conflicts": 0, "session_count": 0})
+        )
+        respx.get(f"{base}/health").mock(return_value=Response(200, json=sample_health_response))
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            with pytest.raises(AuthenticationError):
+                await client.dashboard_snapshot()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_dashboard_snapshot_failure_cancels_slow_calls(self):
+        base = "https://api.yod.agames.ai"
+        completed = []
+
+        async def slow(request):
+            await asyncio.sleep(0.5)
+            completed.append(request.url.path)
+            return Response(200, json={})
+
+        respx.get(f"{base}/entities").mock(side_effect=slow)
+        respx.get(f"{base}/memories/graph").mock(side_effect=slow)
+        respx.get(f"{base}/health").mock(side_effect=slow)
+        respx.get(f"{base}/memories/contradictions").mock(
+            return_value=Response(404, json={"detail": "not found"})
+        )
+
+        async with AsyncYodClient(api_key="sk-yod-test") as client:
+            with pytest.raises(NotFoundError):
+                await client.dashboard_snapshot()
+
+            assert asyncio.all_tasks() == {asyncio.current_task()}
+
+        assert completed == []
+
 
 class TestAsyncErrorHandling:
     """Tests for async error response handling."""
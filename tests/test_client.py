@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 import respx
 from httpx import Response
 
-from yod import YodClient
+from yod import RetryConfig, YodClient
 from yod.exceptions import (
     AuthenticationError,
     AuthorizationError,
@@ -16,7 +18,10 @@ from yod.exceptions import (
     RateLimitError,
     ServerError,
     ValidationError,
+    YodAPIError,
+    YodTimeoutError,
 )
+from yod.models import MessageInput
 
 
 class TestClientInitialization:
@@ -32,6 +37,17 @@ class TestClientInitialization:
         assert client.config.base_url == "http://localhost:8000"
         client.close()
 
+    @respx.mock
+    def test_base_url_with_path_prefix(self):
+        route = respx.get("http://localhost:8000/api/health").mock(
+            return_value=Response(200, json={"status": "ok"})
+        )
+
+        with YodClient(api_key="sk-yod-test", base_url="http://localhost:8000/api/") as client:
+            client.health()
+
+        assert route.called
+
     def test_timeout_configuration(self):
         client = YodClient(api_key="sk-yod-test", timeout=60.0, connect_timeout=10.0)
         assert client.config.timeout == 60.0
@@ -44,6 +60,22 @@ class TestClientInitialization:
         # After exiting, client should be closed
         assert client._client is None
 
+    @respx.mock
+    def test_warmup_on_enter(self):
+        route = respx.get("https://api.yod.agames.ai/health").mock(
+            return_value=Response(200, json={"status": "ok"})
+        )
+
+        with YodClient(api_key="sk-yod-test", warmup=True):
+            assert route.call_count == 1
+
+    def test_concurrent_first_use_creates_one_http_client(self):
+        client = YodClient(api_key="sk-yod-test")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = set(pool.map(lambda _: id(client._get_client()), range(32)))
+        assert len(clients) == 1
+        client.close()
+
 
 class TestClientHeaders:
     """Tests for client header construction."""
@@ -80,6 +112,22 @@ class TestClientHeaders:
         assert headers["User-Agent"] == f"yod-python-sdk/{__version__}"
         client.close()
 
+    def test_custom_headers(self):
+        client = YodClient(api_key="sk-yod-test", custom_headers={"X-Trace": "abc"})
+        assert client._build_headers()["X-Trace"] == "abc"
+        client.close()
+
+        client = YodClient(api_key="sk-yod-test")
+        assert dict(client.config.custom_headers) == {}
+        client.close()
+
+    def test_headers_built_once_and_read_only(self):
+        client = YodClient(api_key="sk-yod-test", user_id="user-123")
+        assert dict(client._headers) == client._build_headers()
+        with pytest.raises(TypeError):
+            client._headers["X-User-Id"] = "someone-else"  # type: ignore[index]
+        client.close()
+
 
 class TestChatEndpoint:
     """Tests for the /chat endpoint."""
@@ -112,6 +160,45 @@ class TestChatEndpoint:
         assert body["language"] == "fa"
         assert body["as_of"] == "2024-01-01T00:00:00Z"
 
+    @respx.mock
+    def test_chat_bulk_preserves_order(self, sample_chat_response: dict):
+        def respond(request):
+            question = json.loads(request.content)["question"]
+            return Response(200, json={**sample_chat_response, "answer": f"re: {question}"})
+
+        route = respx.post("https://api.yod.agames.ai/chat").mock(side_effect=respond)
+
+        questions = [f"q{i}" for i in range(5)]
+        with YodClient(api_key="sk-yod-test", max_concurrency=2) as client:
+            responses = client.chat_bulk(questions, session_id="s1")
+
+        assert [r.answer for r in responses] == [f"re: {q}" for q in questions]
+        assert route.call_count == 5
+        assert all(json.loads(c.request.content)["session_id"] == "s1" for c in route.calls)
+
+
+class TestJsonCodec:
+    """Tests for request/response JSON handling with and without orjson."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @respx.mock
+    def test_round_trip(self, monkeypatch, sample_chat_response: dict, use_orjson: bool):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("yod._base_client.orjson", None)
+        route = respx.post("https://api.yod.agames.ai/chat").mock(
+            return_value=Response(200, json=sample_chat_response)
+        )
+
+        with YodClient(api_key="sk-yod-test") as client:
+            response = client.chat("Où est ma clé?")
+
+        request = route.calls[0].request
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {"question": "Où est ma clé?"}
+        assert response.answer == "Your favorite color is blue."
+
 
 class TestIngestEndpoint:
     """Tests for the /ingest/chat endpoint."""
@@ -130,6 +217,20 @@ class TestIngestEndpoint:
         assert len(response.entities) == 1
         assert len(response.memories) == 1
 
+    @respx.mock
+    def test_ingest_chat_bulk(self, sample_ingest_response: dict):
+        route = respx.post("https://api.yod.agames.ai/ingest/chat").mock(
+            return_value=Response(200, json=sample_ingest_response)
+        )
+
+        with YodClient(api_key="sk-yod-test", max_concurrency=2) as client:
+            responses = client.ingest_chat_bulk(["one", "two", "three"], session_id="s1")
+
+        assert len(responses) == 3
+        sent = [json.loads(call.request.content) for call in route.calls]
+        assert sorted(body["text"] for body in sent) == ["one", "three", "two"]
+        assert all(body["session_id"] == "s1" for body in sent)
+
 
 class TestMemoriesEndpoint:
     """Tests for /memories endpoints."""
@@ -146,6 +247,41 @@ class TestMemoriesEndpoint:
         assert len(response.items) == 1
         assert response.items[0].memory_id == "mem_123"
 
+    @respx.mock
+    def test_get_memories_bulk_preserves_order(self, sample_memory_item: dict):
+        def respond(request):
+            memory_id = request.url.path.rsplit("/", 1)[-1]
+            return Response(200, json={**sample_memory_item, "memory_id": memory_id})
+
+        route = respx.get(url__regex=r"https://api\.yod\.agames\.ai/memories/mem_\d+").mock(
+            side_effect=respond
+        )
+
+        with YodClient(api_key="sk-yod-test", max_concurrency=2) as client:
+            memories = client.get_memories_bulk([f"mem_{i}" for i in range(5)])
+
+        assert [m.memory_id for m in memories] == [f"mem_{i}" for i in range(5)]
+        assert route.call_count == 5
+
+    @respx.mock
+    def test_bulk_failure_skips_requests_not_started(self, sample_memory_item: dict):
+        def respond(request):
+            if request.url.path.endswith("/missing"):
+                return Response(404, json={"detail": "Memory not found"})
+            time.sleep(0.05)
+            return Response(200, json=sample_memory_item)
+
+        route = respx.get(url__regex=r"https://api\.yod\.agames\.ai/memories/\w+").mock(
+            side_effect=respond
+        )
+
+        ids = ["missing"] + [f"mem_{i}" for i in range(20)]
+        with YodClient(api_key="sk-yod-test", max_concurrency=1) as client:
+            with pytest.raises(NotFoundError):
+                client.get_memories_bulk(ids)
+
+        assert route.call_count < len(ids)
+
     @respx.mock
     def test_list_memories_with_filters(self, sample_memory_list_response: dict):
         route = respx.get("https://api.yod.agames.ai/memories").mock(
@@ -160,6 +296,17 @@ class TestMemoriesEndpoint:
         assert "search=coffee" in str(request.url)
         assert "limit=10" in str(request.url)
 
+    @respx.mock
+    def test_list_memories_omits_unset_params(self, sample_memory_list_response: dict):
+        route = respx.get("https://api.yod.agames.ai/memories").mock(
+            return_value=Response(200, json=sample_memory_list_response)
+        )
+
+        with YodClient(api_key="sk-yod-test") as client:
+            client.list_memories()
+
+        assert dict(route.calls[0].request.url.params) == {"limit": "50"}
+
     @respx.mock
     def test_get_memory(self, sample_memory_item: dict):
         respx.get("https://api.yod.agames.ai/memories/mem_123").mock(
@@ -184,6 +331,167 @@ class TestMemoriesEndpoint:
         assert result["ok"] is True
         assert result["qdrant_deleted"] == 2
 
+    @respx.mock
+    def test_delete_memory_no_content(self):
+        respx.delete("https://api.yod.agames.ai/memories/mem_123").mock(
+            return_value=Response(204)
+        )
+
+        with YodClient(api_key="sk-yod-test") as client:
+            assert client.delete_memory("mem_123") == {}
+
+
+class TestConversationsEndpoint:
+    """Tests for /conversations endpoints."""
+
+    @respx.mock
+    def test_iter_conversations_pages(self, sample_conversation: dict):
+        route = respx.get("https://api.yod.agames.ai/conversations").mock(
+            side_effect=[
+                Response(200, json=[sample_conversation] * 2),
+                Response(200, json=[sample_conversation]),
+                Response(200, json=[]),
+            ]
+        )
+
+        with YodClient(api_key="sk-yod-test") as client:
+            conversations = list(client.iter_conversations(page_size=2))
+
+        assert len(conversations) == 3
+        assert [call.request.url.params["offset"] for call in route.calls] == ["0", "2", "3"]
+
+    @respx.mock
+    def test_iter_sessions_continues_past_capped_page(self):
+        session = {"session_id": "s1", "user_id": "u1", "created_at": "2026-01-01T00:00:00Z"}
+        route = respx.get("https://api.yod.agames.ai/sessions").mock(
+            side_effect=[
+                Response(200, json={"sessions": [session] * 2, "total": 5}),
+                Response(200, json={"sessions": [session] * 2, "total": 5}),
+                Response(200, json={"sessions": [session], "total": 5}),
+            ]
+        )
+
+        with YodClient(api_key="sk-yod-test") as client:
+            sessions = list(client.iter_sessions(page_size=3))
+
+        assert len(sessions) == 5
+        assert [call.request.url.params["offset"] for call in route.calls] == ["0", "2", "4"]
+
+    @respx.mock
+    def test_sync_messages_serializes_batch(self):
+        route = respx.post("https://api.yod.agames.ai/conversations/conv_1/sync").mock(
+            return_value=Response(200, json={"ok": True, "saved": 2})
+        )
+        messages = [
+            MessageInput(role="user", content="hi"),
+            MessageInput(id="m2", role="assistant", content="hello", citations=[{"n": 1}]),
+        ]
+
+        with YodClient(api_key="sk-yod-test") as client:
+            result = client.sync_messages("conv_1", messages)
+
+        assert result["saved"] == 2
+        sent = json.loads(route.calls[0].request.content)["messages"]
+        assert sent == [m.model_dump() for m in messages]
+
+    @respx.mock
+    def test_list_conversations(self, sample_conversation: dict):
+        respx.get("https://api.yod.agames.ai/conversations").mock(
+            return_value=Response(200, json=[sample_conversation])
+        )
+
+        with YodClient(api_key="sk-yod-test") as client:
+            conversations = client.list_conversations()
+
+        assert len(conversations) == 1
+        assert conversations[0].conversation_id == "conv_1"
+
+    @respx.mock
+    def test_get_messages(self, sample_message: dict):
+        respx.get("https://api.yod.agames.ai/conversations/conv_1/messages").mock(
+            return_value=Response(200, json=[sample_message])
+        )
+
+        with YodClient(api_key="sk-yod-test") as client:
+            messages = client.get_messages("conv_1")
+
+        assert [m.message_id for m in messages] == ["msg_1"]
+
+    @respx.mock
+    def test_empty_body_is_empty_list(self):
+        respx.get("https://api.yod.agames.ai/conversations").mock(return_value=Response(200))
+
+        with YodClient(api_key="sk-yod-test") as client:
+            assert client.list_conversations() == []
+
+
+class TestSpeechEndpoints:
+    """Tests for /speech endpoints."""
+
+    @respx.mock
+    def test_speech_to_text_sends_multipart(self):
+        route = respx.post("https://api.yod.agames.ai/speech/stt").mock(
+            return_value=Response(200, json={"text": "hello"})
+        )
+
+        with YodClient(api_key="sk-yod-test") as client:
+            client.speech_to_text(b"RIFF....", filename="a.wav")
+
+        request = route.calls[0].request
+        assert request.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+        assert request.headers["Authorization"] == "Bearer sk-yod-test"
+
+    @respx.mock
+    def test_text_to_speech_stream_yields_chunks(self):
+        route = respx.post("https://api.yod.agames.ai/speech/tts").mock(
+            return_value=Response(200, content=b"ID3" + b"\x00" * 10)
+        )
+
+        with YodClient(api_key="sk-yod-test") as client:
+            chunks = list(client.text_to_speech_stream("Hello", voice_id="v1", chunk_size=4))
+
+        assert b"".join(chunks) == b"ID3" + b"\x00" * 10
+        assert all(len(chunk) <= 4 for chunk in chunks)
+        assert json.loads(route.calls[0].request.content) == {"text": "Hello", "voice_id": "v1"}
+
+    @respx.mock
+    def test_text_to_speech_stream_error(self):
+        respx.post("https://api.yod.agames.ai/speech/tts").mock(
+            return_value=Response(422, json={"detail": "text too long"})
+        )
+
+        with YodClient(api_key="sk-yod-test") as client:
+            with pytest.raises(ValidationError, match="text too long"):
+                list(client.text_to_speech_stream("Hello"))
+
+
+class TestConsolidationEndpoints:
+    """Tests for /consolidation endpoints."""
+
+    @respx.mock
+    def test_wait_for_consolidation_polls_until_complete(self):
+        running = {"user_id": "u1", "started_at": "2026-01-01T00:00:00Z"}
+        done = {**running, "completed_at": "2026-01-01T00:00:05Z", "clusters_found": 2}
+        route = respx.get("https://api.yod.agames.ai/consolidation/result/job_1").mock(
+            side_effect=[Response(200, json=running)] * 2 + [Response(200, json=done)]
+        )
+
+        with YodClient(api_key="sk-yod-test") as client:
+            result = client.wait_for_consolidation("job_1", poll_interval=0.0)
+
+        assert result.clusters_found == 2
+        assert route.call_count == 3
+
+    @respx.mock
+    def test_wait_for_consolidation_timeout(self):
+        respx.get("https://api.yod.agames.ai/consolidation/result/job_1").mock(
+            return_value=Response(200, json={"user_id": "u1", "started_at": "2026-01-01"})
+        )
+
+        with YodClient(api_key="sk-yod-test") as client:
+            with pytest.raises(YodTimeoutError):
+                client.wait_for_consolidation("job_1", poll_interval=0.01, timeout=0.05)
+
 
 class TestHealthEndpoints:
     """Tests for health check endpoints."""
@@ -199,6 +507,61 @@ class TestHealthEndpoints:
 
         assert response.status == "ok"
 
+    @respx.mock
+    def test_health_not_cached_by_default(self, sample_health_response: dict):
+        route = respx.get("https://api.yod.agames.ai/health").mock(
+            return_value=Response(200, json=sample_health_response)
+        )
+
+        with YodClient(api_key="sk-yod-test") as client:
+            client.health()
+            client.health()
+
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_health_cached_when_enabled(self, sample_health_response: dict):
+        route = respx.get("https://api.yod.agames.ai/health").mock(
+            return_value=Response(200, json=sample_health_response)
+        )
+
+        with YodClient(api_key="sk-yod-test", cache_responses=True) as client:
+            first = client.health()
+            assert client.health() is first
+            client.invalidate_cache()
+            client.health()
+
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_cache_is_thread_safe_past_capacity(self):
+        def respond(request):
+            entity_id = request.url.path.split("/")[2]
+            return Response(
+                200,
+                json={
+                    "entity_id": entity_id,
+                    "type": "person",
+                    "canonical_name": entity_id,
+                    "connection_count": 0,
+                    "claim_count": 0,
+                },
+            )
+
+        respx.get(url__regex=r"https://api\.yod\.agames\.ai/entities/ent_\d+/details").mock(
+            side_effect=respond
+        )
+
+        ids = [f"ent_{i}" for i in range(600)]
+        with YodClient(api_key="sk-yod-test", cache_responses=True, max_concurrency=16) as client:
+            details = client.get_entity_details_bulk(ids)
+            again = client.get_entity_details_bulk(ids[::-1])
+
+            assert len(client._response_cache) == 256
+
+        assert [d.entity_id for d in details] == ids
+        assert [d.entity_id for d in again] == ids[::-1]
+
     @respx.mock
     def test_ready(self, sample_ready_response: dict):
         respx.get("https://api.yod.agames.ai/ready").mock(
@@ -229,6 +592,41 @@ class TestErrorHandling:
         assert "Invalid token" in str(exc_info.value)
         assert exc_info.value.status_code == 401
 
+    @respx.mock
+    def test_non_json_error_body_is_not_parsed(self):
+        respx.get("https://api.yod.agames.ai/health").mock(
+            return_value=Response(
+                400, content=b'{"detail": "not really json"}', headers={"Content-Type": "text/html"}
+            )
+        )
+
+        with YodClient(api_key="sk-yod-test", max_retries=0) as client:
+            with pytest.raises(YodAPIError) as exc_info:
+                client.health()
+
+        assert exc_info.value.response_body is None
+        assert "Unknown error" in str(exc_info.value)
+
+    @respx.mock
+    def test_error_message_fallbacks(self):
+        respx.get("https://api.yod.agames.ai/health").mock(
+            side_effect=[
+                Response(400, json={"message": "Bad input"}),
+                Response(400, json=["unexpected", "shape"]),
+            ]
+        )
+
+        with YodClient(api_key="sk-yod-test", max_retries=0) as client:
+            with pytest.raises(YodAPIError) as exc_info:
+                client.health()
+            assert "Bad input" in str(exc_info.value)
+            assert exc_info.value.response_body == {"message": "Bad input"}
+
+            with pytest.raises(YodAPIError) as exc_info:
+                client.health()
+            assert "unexpected" in str(exc_info.value)
+            assert exc_info.value.response_body is None
+
     @respx.mock
     def test_authorization_error(self):
         respx.post("https://api.yod.agames.ai/chat").mock(
@@ -277,6 +675,24 @@ class TestErrorHandling:
         assert exc_info.value.retry_after == 30.0
         assert exc_info.value.status_code == 429
 
+    @respx.mock
+    def test_retry_resends_same_body(self, sample_chat_response: dict):
+        route = respx.post("https://api.yod.agames.ai/chat").mock(
+            side_effect=[
+                Response(503, json={"detail": "Unavailable"}),
+                Response(200, json=sample_chat_response),
+            ]
+        )
+
+        retry_config = RetryConfig(max_retries=1, initial_delay=0, jitter=0)
+        with YodClient(api_key="sk-yod-test", retry_config=retry_config) as client:
+            client.chat("Test")
+
+        assert route.call_count == 2
+        first, second = (call.request for call in route.calls)
+        assert first.content == second.content
+        assert json.loads(second.content) == {"question": "Test"}
+
     @respx.mock
     def test_server_error(self):
         respx.post("https://api.yod.agames.ai/chat").mock(
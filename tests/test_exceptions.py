@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from yod.exceptions import (
     AuthenticationError,
     AuthorizationError,
@@ -54,6 +56,18 @@ class TestYodAPIError:
         assert "500" in str(error)
         assert "Server error" in str(error)
 
+    def test_defaults_from_class_attributes(self):
+        error = YodAPIError()
+        assert error.status_code == YodAPIError.default_status_code == 500
+        assert "API error" in str(error)
+        assert NotFoundError.default_status_code == 404
+
+    def test_arguments_after_message_are_keyword_only(self):
+        with pytest.raises(TypeError):
+            NotFoundError("Missing", {"detail": "Missing"})
+        with pytest.raises(TypeError):
+            YodAPIError("Error", 400)
+
     def test_str_includes_request_id(self):
         error = YodAPIError("Error", status_code=500, request_id="req-456")
         error_str = str(error)
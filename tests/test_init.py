@@ -0,0 +1,30 @@
+"""Tests for the package-level exports."""
+
+from __future__ import annotations
+
+import pytest
+
+import yod
+
+
+class TestLazyExports:
+    """Tests for the lazily imported package attributes."""
+
+    def test_all_exports_resolve(self):
+        for name in yod.__all__:
+            assert getattr(yod, name) is not None
+
+    def test_clients_resolve_to_their_modules(self):
+        from yod.async_client import AsyncYodClient
+        from yod.client import YodClient
+
+        assert yod.YodClient is YodClient
+        assert yod.AsyncYodClient is AsyncYodClient
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            yod.DoesNotExist  # noqa: B018
+
+    def test_dir_includes_lazy_exports(self):
+        assert "ChatResponse" in dir(yod)
+        assert "YodClient" in dir(yod)
@@ -9,12 +9,16 @@ from yod.models import (
     ChatRequest,
     ChatResponse,
     Contradiction,
+    EntityType,
     ExtractedMemory,
     IngestChatRequest,
     IngestResponse,
     MemoryItem,
+    MemoryKind,
     MemoryLink,
     MemoryListResponse,
+    MemoryStatus,
+    MemoryType,
     MemoryUpdateRequest,
     ReadyResponse,
     ServiceStatus,
@@ -37,6 +41,21 @@ class TestChatResponse:
         assert response.citations == []
         assert response.used_memory_ids == []
 
+    def test_citations_are_hashable_and_frozen(self):
+        response = ChatResponse.model_validate(
+            {
+                "answer": "Test",
+                "citations": [
+                    {"source_id": "src_1", "quote": "a"},
+                    {"source_id": "src_1", "quote": "a"},
+                    {"source_id": "src_2"},
+                ],
+            }
+        )
+        assert len(set(response.citations)) == 2
+        with pytest.raises(PydanticValidationError):
+            response.citations[0].quote = "b"
+
 
 class TestMemoryItem:
     """Tests for MemoryItem model."""
@@ -141,6 +160,9 @@ class TestServiceStatus:
         assert status.ok is False
         assert status.error == "Timeout"
 
+    def test_hashable(self):
+        assert hash(ServiceStatus(ok=True)) == hash(ServiceStatus(ok=True))
+
 
 class TestRequestModels:
     """Tests for request models."""
@@ -226,6 +248,13 @@ class TestMemoryLink:
             })
             assert link.type == link_type
 
+    def test_links_are_hashable_and_frozen(self):
+        data = {"target": "clm_a", "type": "supports", "confidence": 0.9}
+        first = MemoryLink.model_validate(data)
+        assert len({first, MemoryLink.model_validate(data)}) == 1
+        with pytest.raises(PydanticValidationError):
+            first.confidence = 0.1
+
 
 class TestContradiction:
     """Tests for Contradiction model (A-MEM)."""
@@ -249,6 +278,12 @@ class TestContradiction:
         assert contradiction.claim_b == "Lives in Boston"
         assert contradiction.reason is None
 
+    def test_contradiction_is_frozen(self):
+        contradiction = Contradiction.model_validate({"claim_a": "a", "claim_b": "b"})
+        assert hash(contradiction) == hash(Contradiction(claim_a="a", claim_b="b"))
+        with pytest.raises(PydanticValidationError):
+            contradiction.reason = "changed"
+
 
 class TestModelsWithLinks:
     """Tests for models with A-MEM link support."""
@@ -363,3 +398,27 @@ class TestModelsWithLinks:
         assert len(response.memories) == 1
         assert len(response.memories[0].links) == 1
         assert response.memories[0].links[0].type == "supports"
+
+
+class TestEnums:
+    """Tests for the string enums."""
+
+    def test_members_are_strings(self):
+        assert MemoryKind.PREFERENCE == "preference"
+        assert MemoryStatus("active") is MemoryStatus.ACTIVE
+        assert f"{MemoryType.CORE}" == "core"
+        assert str(EntityType.PERSON) == "person"
+
+    def test_memory_item_kind_and_status_parse_to_enums(self):
+        memory = MemoryItem.model_validate(
+            {"memory_id": "m", "kind": "fact", "summary": "s", "confidence": 1, "status": "active"}
+        )
+        assert memory.kind is MemoryKind.FACT
+        assert memory.status is MemoryStatus.ACTIVE
+
+    def test_unknown_kind_and_status_stay_strings(self):
+        memory = MemoryItem.model_validate(
+            {"memory_id": "m", "kind": "novel", "summary": "s", "confidence": 1, "status": "new"}
+        )
+        assert memory.kind == "novel"
+        assert memory.status == "new"
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
 import pytest
 from httpx import Response
 
@@ -36,6 +39,20 @@ class TestRetryConfig:
         assert config.initial_delay == 1.0
         assert config.max_delay == 60.0
 
+    def test_changing_fields_after_creation_takes_effect(self):
+        config = RetryConfig(jitter=0)
+        config.initial_delay = 0
+        config.retry_on_status = (503,)
+
+        assert calculate_delay(0, config) == 0
+        assert not should_retry(500, config)
+        assert should_retry(503, config)
+
+        config.initial_delay = 1.0
+        config.max_delay = 3.0
+        config.max_retries = 5
+        assert calculate_delay(4, config) == 3.0
+
 
 class TestCalculateDelay:
     """Tests for calculate_delay function."""
@@ -52,6 +69,10 @@ class TestCalculateDelay:
         assert calculate_delay(2, config) == 4.0
         assert calculate_delay(3, config) == 8.0
 
+    def test_attempt_beyond_max_retries(self):
+        config = RetryConfig(max_retries=1, initial_delay=1.0, backoff_multiplier=2.0, jitter=0)
+        assert calculate_delay(3, config) == 8.0
+
     def test_respects_max_delay(self):
         config = RetryConfig(
             initial_delay=10.0, backoff_multiplier=2.0, max_delay=15.0, jitter=0
@@ -78,6 +99,17 @@ class TestCalculateDelay:
         # They shouldn't all be exactly the same (probabilistically)
         assert len(set(delays)) > 1
 
+    def test_decorrelated_jitter_bounds(self):
+        config = RetryConfig(initial_delay=1.0, max_delay=10.0, decorrelated_jitter=True)
+        for _ in range(50):
+            assert 1.0 <= calculate_delay(0, config) <= 3.0
+            assert 1.0 <= calculate_delay(1, config, previous_delay=2.0) <= 6.0
+            assert calculate_delay(5, config, previous_delay=9.0) <= 10.0
+
+    def test_decorrelated_jitter_still_honors_retry_after(self):
+        config = RetryConfig(decorrelated_jitter=True)
+        assert calculate_delay(0, config, retry_after=2.0) == 2.0
+
 
 class TestShouldRetry:
     """Tests for should_retry function."""
@@ -120,10 +152,18 @@ class TestGetRetryAfter:
         assert get_retry_after(response) is None
 
     def test_returns_none_for_invalid_format(self):
-        # HTTP-date format is not supported
-        response = Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        response = Response(429, headers={"Retry-After": "soon"})
         assert get_retry_after(response) is None
 
+    def test_extracts_http_date_retry_after(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+        response = Response(429, headers={"Retry-After": format_datetime(retry_at, usegmt=True)})
+        assert 55.0 <= get_retry_after(response) <= 60.0
+
+    def test_past_http_date_means_no_wait(self):
+        response = Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        assert get_retry_after(response) == 0.0
+
 
 class TestExecuteWithRetrySync:
     """Tests for synchronous retry execution."""